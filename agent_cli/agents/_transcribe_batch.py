@@ -0,0 +1,112 @@
+"""Batch transcription of a directory of audio files for the transcribe command."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from agent_cli.core.audio_format import VALID_EXTENSIONS, decode_audio_file
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+
+def find_audio_files(directory: Path, pattern: str) -> list[Path]:
+    """Return the audio files in ``directory`` matching the glob ``pattern``, sorted."""
+    return sorted(
+        path.resolve()
+        for path in directory.glob(pattern)
+        if path.is_file() and path.suffix.lower() in VALID_EXTENSIONS
+    )
+
+
+def load_done_files(output: Path) -> set[str]:
+    """Return the files that already have a transcript in the JSONL ``output``."""
+    done: set[str] = set()
+    try:
+        with output.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by a crash
+                if entry.get("transcript"):
+                    done.add(entry["file"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+async def transcribe_batch(
+    files: list[Path],
+    output: Path,
+    transcribe: Callable[[bytes], Awaitable[str]],
+    logger: logging.Logger,
+    *,
+    concurrency: int,
+) -> tuple[int, int, int]:
+    """Transcribe ``files``, appending one JSON line per file to ``output``.
+
+    Files with a transcript in ``output`` from an earlier run are skipped. At most
+    ``concurrency`` files are decoded or transcribed at a time, with decoding in a
+    process pool. Failed files are recorded with an ``error`` and retried on the
+    next run.
+
+    Returns:
+        The number of transcribed, failed and skipped files.
+
+    """
+    done = load_done_files(output)
+    pending = [path for path in files if str(path) not in done]
+    skipped = len(files) - len(pending)
+    if not pending:
+        return 0, 0, skipped
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with (
+        ProcessPoolExecutor(max_workers=min(concurrency, os.cpu_count() or 1)) as pool,
+        output.open("a", encoding="utf-8") as out,
+    ):
+        if out.tell() and not _ends_with_newline(output):
+            out.write("\n")  # Don't append to a line cut short by a crash
+
+        async def process(path: Path) -> None:
+            nonlocal failed
+            entry: dict[str, str] = {"file": str(path)}
+            async with semaphore:
+                try:
+                    audio_data = await loop.run_in_executor(pool, decode_audio_file, str(path))
+                    transcript = await transcribe(audio_data)
+                except Exception as e:
+                    logger.exception("Failed to transcribe %s", path)
+                    entry["error"] = str(e)
+                else:
+                    if transcript:
+                        entry["transcript"] = transcript
+                    else:
+                        entry["error"] = "No transcript generated from audio"
+            if "error" in entry:
+                failed += 1
+            else:
+                logger.info("Transcribed %s", path)
+            out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            out.flush()
+
+        await asyncio.gather(*(process(path) for path in pending))
+
+    return len(pending) - failed, failed, skipped
@@ -2,6 +2,7 @@ r"""Common functionalities for voice-based agents."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -14,6 +15,7 @@ from agent_cli.services.llm import process_and_update_clipboard
 from agent_cli.services.tts import handle_tts_playback
 
 if TYPE_CHECKING:
+    import pyaudio
     from rich.live import Live
 
     from agent_cli import config
@@ -21,9 +23,28 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger()
 
 
+def start_live_transcription(
+    queue: asyncio.Queue[bytes | None],
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    logger: logging.Logger,
+) -> asyncio.Task[str | None] | None:
+    """Start transcribing the audio on ``queue`` while it is being recorded.
+
+    Only Wyoming ASR accepts streamed audio; for other providers this returns None
+    and the recording is transcribed once it is complete.
+    """
+    if provider_cfg.asr_provider != "local":
+        return None
+    return asyncio.create_task(
+        asr.transcribe_audio_queue(queue, wyoming_asr_cfg, logger, quiet=True),
+    )
+
+
 async def get_instruction_from_audio(
     *,
-    audio_data: bytes,
+    audio_data: bytes | memoryview,
     provider_cfg: config.ProviderSelection,
     audio_input_cfg: config.AudioInput,
     wyoming_asr_cfg: config.WyomingASR,
@@ -31,21 +52,29 @@ async def get_instruction_from_audio(
     ollama_cfg: config.Ollama,
     logger: logging.Logger,
     quiet: bool,
+    live_transcript: asyncio.Task[str | None] | None = None,
 ) -> str | None:
-    """Transcribe audio data and return the instruction."""
+    """Transcribe audio data and return the instruction.
+
+    With ``live_transcript`` (see `start_live_transcription`), the transcript of the
+    live session is used, and the recording is only sent to ASR if that session failed
+    or came back empty (e.g. the connection was lost before the transcript).
+    """
     try:
         start_time = time.monotonic()
-        transcriber = asr.create_recorded_audio_transcriber(provider_cfg)
-        instruction = await transcriber(
-            audio_data=audio_data,
-            provider_cfg=provider_cfg,
-            audio_input_cfg=audio_input_cfg,
-            wyoming_asr_cfg=wyoming_asr_cfg,
-            openai_asr_cfg=openai_asr_cfg,
-            ollama_cfg=ollama_cfg,
-            logger=logger,
-            quiet=quiet,
-        )
+        instruction = await live_transcript if live_transcript else None
+        if not instruction:
+            transcriber = asr.create_recorded_audio_transcriber(provider_cfg)
+            instruction = await transcriber(
+                audio_data=audio_data,
+                provider_cfg=provider_cfg,
+                audio_input_cfg=audio_input_cfg,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                openai_asr_cfg=openai_asr_cfg,
+                ollama_cfg=ollama_cfg,
+                logger=logger,
+                quiet=quiet,
+            )
         elapsed = time.monotonic() - start_time
 
         if not instruction or not instruction.strip():
@@ -90,6 +119,7 @@ async def process_instruction_and_respond(
     agent_instructions: str,
     live: Live | None,
     logger: logging.Logger,
+    p: pyaudio.PyAudio | None = None,
 ) -> None:
     """Process instruction with LLM and handle TTS response."""
     # Process with LLM if clipboard mode is enabled
@@ -127,4 +157,5 @@ async def process_instruction_and_respond(
                     status_message="🔊 Speaking response...",
                     description="TTS audio",
                     live=live,
+                    p=p,
                 )
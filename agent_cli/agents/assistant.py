@@ -30,13 +30,15 @@ from __future__ import annotations
 import asyncio
 import logging
 from contextlib import suppress
+from functools import partial
 from pathlib import Path  # noqa: TC003
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-from agent_cli import config, opts
+from agent_cli import config, constants, opts
 from agent_cli.agents._voice_agent_common import (
     get_instruction_from_audio,
     process_instruction_and_respond,
+    start_live_transcription,
 )
 from agent_cli.cli import app
 from agent_cli.core import audio, process
@@ -51,14 +53,23 @@ from agent_cli.core.utils import (
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
+from agent_cli.services._wyoming_utils import closing_connection_pool
 from agent_cli.services.wake_word import create_wake_word_detector
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pyaudio
     from rich.live import Live
 
+    from agent_cli.core.audio import VoiceActivityDetector
+
 LOGGER = logging.getLogger()
 
+# Audio captured before the wake word detection fired, replayed into the recording so
+# words spoken during the detection latency are not clipped.
+WAKE_WORD_PREROLL_SECONDS = 1.0
+
 WAKE_WORD_VARIATIONS = {
     "ok_nabu": ["ok nabu", "okay nabu", "okay, nabu", "ok, nabu", "ok naboo", "okay naboo"],
     "alexa": ["alexa"],
@@ -69,7 +80,7 @@ WAKE_WORD_VARIATIONS = {
 SYSTEM_PROMPT_TEMPLATE = """\
 You are a helpful voice assistant. Respond to user questions and commands in a conversational, friendly manner.
 
-The user is using a wake word to start and stop the recording, so the wake word will always appear at the END of the transcription.
+The user is using a wake word to start and stop the recording, so the wake word will always appear at the END of the transcription (and often at the beginning as well).
 The wake word is "{wake_word}". You should ignore the wake word and any variations of it (e.g., "{variations}") when processing the user's command.
 
 Keep your responses concise but informative. If the user asks you to perform an action that requires external tools or systems, explain what you would do if you had access to those capabilities.
@@ -90,6 +101,23 @@ Respond as if you're having a natural conversation.
 """
 
 
+async def _stop_word_or_cancel(stop_task: asyncio.Task[str | None]) -> str | None:
+    """Return the detected stop word, cancelling detection if it is still running."""
+    if stop_task.done():
+        return stop_task.result()
+    stop_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await stop_task
+    return None
+
+
+class _Recording(NamedTuple):
+    """Recorded audio, and the live ASR session that transcribed it while recording."""
+
+    audio_data: memoryview
+    live_transcript: asyncio.Task[str | None] | None = None
+
+
 async def _record_audio_with_wake_word(
     stream: pyaudio.Stream,
     stop_event: InteractiveStopEvent,
@@ -98,8 +126,18 @@ async def _record_audio_with_wake_word(
     wake_word_cfg: config.WakeWord,
     quiet: bool = False,
     live: Live | None = None,
-) -> bytes | None:
-    """Record audio to a buffer using wake word detection to start and stop."""
+    max_recording_seconds: float = constants.MAX_RECORDING_SECONDS,
+    vad: VoiceActivityDetector | None = None,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
+    transcribe_live: Callable[[audio.TeeQueue], asyncio.Task[str | None] | None] | None = None,
+) -> _Recording | None:
+    """Record audio to a buffer using wake word detection to start and stop.
+
+    With a voice activity detector, the recording also stops at the end of speech,
+    so saying the wake word again is optional. With ``transcribe_live``, an extra tee
+    queue with the same audio is handed to it when recording starts, so the audio
+    can be transcribed while it is recorded.
+    """
     if not quiet:
         print_with_style(
             f"👂 Listening for wake word: [bold yellow]{wake_word_cfg.wake_word}[/bold yellow]",
@@ -109,9 +147,16 @@ async def _record_audio_with_wake_word(
             style="dim",
         )
 
-    async with audio.tee_audio_stream(stream, stop_event, logger) as tee:
-        # Create a queue for wake word detection
-        wake_queue = await tee.add_queue()
+    async with audio.tee_audio_stream(
+        stream,
+        stop_event,
+        logger,
+        preroll_seconds=WAKE_WORD_PREROLL_SECONDS,
+        num_frames=chunk_size,
+    ) as tee:
+        # Create a queue for wake word detection. It drops its oldest audio when the
+        # wake word client falls behind, so it can never stall the recording queue.
+        wake_queue = await tee.add_queue(policy="drop_oldest")
 
         detector = create_wake_word_detector(wake_word_cfg)
         detected_word = await detector(
@@ -132,36 +177,69 @@ async def _record_audio_with_wake_word(
                 style="green",
             )
 
-        # Add a new queue for recording
-        record_queue = await tee.add_queue()
-        record_task = asyncio.create_task(asr.record_audio_to_buffer(record_queue, logger))
+        # Add a new lossless queue for recording, primed with the pre-roll audio
+        record_queue = await tee.add_queue(policy="block", preroll=True)
+        # The pre-roll holds the wake word itself, so the VAD only listens after it
+        preroll_chunks = record_queue.qsize()
+        live_transcript = None
+        if transcribe_live:
+            # The ASR queue merges chunks instead of stalling the tee when ASR falls behind
+            asr_queue = await tee.add_queue(policy="coalesce", preroll=True)
+            live_transcript = transcribe_live(asr_queue)
+            if live_transcript is None:
+                await tee.remove_queue(asr_queue)
+            else:
+                # Nothing reads the queue anymore once the session ends, e.g. on an error
+                live_transcript.add_done_callback(lambda _: tee.discard_queue(asr_queue))
+        record_task = asyncio.create_task(
+            asr.record_audio_to_buffer(
+                record_queue,
+                logger,
+                max_recording_seconds=max_recording_seconds,
+                vad=vad,
+                vad_skip_chunks=preroll_chunks,
+            ),
+        )
 
         # Use the same wake_queue for stop-word detection
-        stop_detected_word = await detector(
-            logger=logger,
-            queue=wake_queue,
-            quiet=quiet,
-            live=live,
-            progress_message="Recording... (say wake word to stop)",
+        stop_task = asyncio.create_task(
+            detector(
+                logger=logger,
+                queue=wake_queue,
+                quiet=quiet,
+                live=live,
+                progress_message="Recording... (say wake word to stop)",
+            ),
         )
+        # Without VAD the recording only ends on the stop word; with VAD whichever
+        # of the two finishes first ends it.
+        await asyncio.wait((stop_task, record_task), return_when=asyncio.FIRST_COMPLETED)
+        stop_detected_word = await _stop_word_or_cancel(stop_task)
 
-        # Stop the recording task by removing its queue
+        # Stop the recording task and the live ASR session by removing their queues
         await tee.remove_queue(record_queue)
+        if live_transcript:
+            await tee.remove_queue(asr_queue)
         audio_data = await record_task
 
         # Clean up the wake queue
         await tee.remove_queue(wake_queue)
 
-    if not stop_detected_word or stop_event.is_set():
+    if stop_event.is_set() or not (stop_detected_word or vad):
+        if live_transcript:
+            live_transcript.cancel()
         return None
 
     if not quiet:
-        print_with_style(
-            f"🛑 Wake word '{stop_detected_word}' detected! Stopping recording...",
-            style="yellow",
-        )
+        if stop_detected_word:
+            print_with_style(
+                f"🛑 Wake word '{stop_detected_word}' detected! Stopping recording...",
+                style="yellow",
+            )
+        else:
+            print_with_style("🛑 End of speech detected! Stopping recording...", style="yellow")
 
-    return audio_data
+    return _Recording(audio_data, live_transcript)
 
 
 async def _async_main(
@@ -192,22 +270,36 @@ async def _async_main(
         audio_in_cfg.input_device_index = input_device_index
         audio_out_cfg.output_device_index = tts_output_device_index
 
-        stream_kwargs = audio.setup_input_stream(input_device_index)
+        stream_kwargs = audio.setup_input_stream(
+            input_device_index,
+            chunk_size=audio_in_cfg.chunk_size,
+        )
         with (
             audio.open_pyaudio_stream(p, **stream_kwargs) as stream,
             signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
         ):
             while not stop_event.is_set():
-                audio_data = await _record_audio_with_wake_word(
+                recording = await _record_audio_with_wake_word(
                     stream,
                     stop_event,
                     LOGGER,
                     wake_word_cfg=wake_word_cfg,
                     quiet=general_cfg.quiet,
                     live=live,
+                    max_recording_seconds=audio_in_cfg.max_recording_seconds,
+                    vad=audio.create_vad(audio_in_cfg),
+                    chunk_size=audio_in_cfg.chunk_size,
+                    transcribe_live=partial(
+                        start_live_transcription,
+                        provider_cfg=provider_cfg,
+                        wyoming_asr_cfg=wyoming_asr_cfg,
+                        logger=LOGGER,
+                    ),
                 )
 
-                if not audio_data:
+                if not recording or not recording.audio_data:
+                    if recording and recording.live_transcript:
+                        recording.live_transcript.cancel()
                     if not general_cfg.quiet:
                         print_with_style("No audio recorded", style="yellow")
                     continue
@@ -216,7 +308,7 @@ async def _async_main(
                     break
 
                 instruction = await get_instruction_from_audio(
-                    audio_data=audio_data,
+                    audio_data=recording.audio_data,
                     provider_cfg=provider_cfg,
                     audio_input_cfg=audio_in_cfg,
                     wyoming_asr_cfg=wyoming_asr_cfg,
@@ -224,6 +316,7 @@ async def _async_main(
                     ollama_cfg=ollama_cfg,
                     logger=LOGGER,
                     quiet=general_cfg.quiet,
+                    live_transcript=recording.live_transcript,
                 )
                 if not instruction:
                     continue
@@ -244,6 +337,7 @@ async def _async_main(
                     agent_instructions=agent_instructions,
                     live=live,
                     logger=LOGGER,
+                    p=p,
                 )
 
                 if not general_cfg.quiet:
@@ -264,9 +358,13 @@ def assistant(
     # --- ASR (Audio) Configuration ---
     input_device_index: int | None = opts.INPUT_DEVICE_INDEX,
     input_device_name: str | None = opts.INPUT_DEVICE_NAME,
+    max_recording_duration: float = opts.MAX_RECORDING_DURATION,
+    vad: bool = opts.VAD,
+    vad_silence: float = opts.VAD_SILENCE,
     asr_wyoming_ip: str = opts.ASR_WYOMING_IP,
     asr_wyoming_port: int = opts.ASR_WYOMING_PORT,
     asr_openai_model: str = opts.ASR_OPENAI_MODEL,
+    asr_openai_upload_format: str = opts.ASR_OPENAI_UPLOAD_FORMAT,
     # --- LLM Configuration ---
     llm_ollama_model: str = opts.LLM_OLLAMA_MODEL,
     llm_ollama_host: str = opts.LLM_OLLAMA_HOST,
@@ -301,6 +399,7 @@ def assistant(
     log_file: str | None = opts.LOG_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
+    latency_profile: str = opts.LATENCY_PROFILE,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
 ) -> None:
@@ -340,6 +439,10 @@ def assistant(
         audio_in_cfg = config.AudioInput(
             input_device_index=input_device_index,
             input_device_name=input_device_name,
+            latency_profile=latency_profile,
+            max_recording_seconds=max_recording_duration,
+            vad=vad,
+            vad_silence_seconds=vad_silence,
         )
         wyoming_asr_cfg = config.WyomingASR(
             asr_wyoming_ip=asr_wyoming_ip,
@@ -347,6 +450,7 @@ def assistant(
         )
         openai_asr_cfg = config.OpenAIASR(
             asr_openai_model=asr_openai_model,
+            asr_openai_upload_format=asr_openai_upload_format,
             openai_api_key=openai_api_key,
         )
         ollama_cfg = config.Ollama(
@@ -366,6 +470,7 @@ def assistant(
             enable_tts=enable_tts,
             output_device_index=output_device_index,
             output_device_name=output_device_name,
+            latency_profile=latency_profile,
             tts_speed=tts_speed,
         )
         wyoming_tts_cfg = config.WyomingTTS(
@@ -402,22 +507,24 @@ def assistant(
         )
 
         asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
-                wake_word_cfg=wake_word_cfg,
-                system_prompt=system_prompt,
-                agent_instructions=agent_instructions,
-                live=live,
+            closing_connection_pool(
+                _async_main(
+                    provider_cfg=provider_cfg,
+                    general_cfg=general_cfg,
+                    audio_in_cfg=audio_in_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_llm_cfg=openai_llm_cfg,
+                    gemini_llm_cfg=gemini_llm_cfg,
+                    audio_out_cfg=audio_out_cfg,
+                    wyoming_tts_cfg=wyoming_tts_cfg,
+                    openai_tts_cfg=openai_tts_cfg,
+                    kokoro_tts_cfg=kokoro_tts_cfg,
+                    wake_word_cfg=wake_word_cfg,
+                    system_prompt=system_prompt,
+                    agent_instructions=agent_instructions,
+                    live=live,
+                ),
             ),
         )
@@ -44,6 +44,7 @@ from agent_cli.core.utils import (
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
+from agent_cli.services._wyoming_utils import closing_connection_pool
 from agent_cli.services.llm import get_llm_response
 from agent_cli.services.tts import handle_tts_playback
 
@@ -291,6 +292,7 @@ async def _handle_conversation_turn(
             play_audio=not general_cfg.save_file,
             stop_event=stop_event,
             live=live,
+            p=p,
         )
 
     # Reset stop_event for next iteration
@@ -380,9 +382,13 @@ def chat(
     # --- ASR (Audio) Configuration ---
     input_device_index: int | None = opts.INPUT_DEVICE_INDEX,
     input_device_name: str | None = opts.INPUT_DEVICE_NAME,
+    max_recording_duration: float = opts.MAX_RECORDING_DURATION,
+    vad: bool = opts.VAD,
+    vad_silence: float = opts.VAD_SILENCE,
     asr_wyoming_ip: str = opts.ASR_WYOMING_IP,
     asr_wyoming_port: int = opts.ASR_WYOMING_PORT,
     asr_openai_model: str = opts.ASR_OPENAI_MODEL,
+    asr_openai_upload_format: str = opts.ASR_OPENAI_UPLOAD_FORMAT,
     # --- LLM Configuration ---
     llm_ollama_model: str = opts.LLM_OLLAMA_MODEL,
     llm_ollama_host: str = opts.LLM_OLLAMA_HOST,
@@ -430,6 +436,7 @@ def chat(
     log_file: str | None = opts.LOG_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
+    latency_profile: str = opts.LATENCY_PROFILE,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
 ) -> None:
@@ -465,6 +472,10 @@ def chat(
         audio_in_cfg = config.AudioInput(
             input_device_index=input_device_index,
             input_device_name=input_device_name,
+            latency_profile=latency_profile,
+            max_recording_seconds=max_recording_duration,
+            vad=vad,
+            vad_silence_seconds=vad_silence,
         )
         wyoming_asr_cfg = config.WyomingASR(
             asr_wyoming_ip=asr_wyoming_ip,
@@ -472,6 +483,7 @@ def chat(
         )
         openai_asr_cfg = config.OpenAIASR(
             asr_openai_model=asr_openai_model,
+            asr_openai_upload_format=asr_openai_upload_format,
             openai_api_key=openai_api_key,
         )
         ollama_cfg = config.Ollama(
@@ -491,6 +503,7 @@ def chat(
             enable_tts=enable_tts,
             output_device_index=output_device_index,
             output_device_name=output_device_name,
+            latency_profile=latency_profile,
             tts_speed=tts_speed,
         )
         wyoming_tts_cfg = config.WyomingTTS(
@@ -516,19 +529,21 @@ def chat(
         )
 
         asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                history_cfg=history_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
+            closing_connection_pool(
+                _async_main(
+                    provider_cfg=provider_cfg,
+                    general_cfg=general_cfg,
+                    history_cfg=history_cfg,
+                    audio_in_cfg=audio_in_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_llm_cfg=openai_llm_cfg,
+                    gemini_llm_cfg=gemini_llm_cfg,
+                    audio_out_cfg=audio_out_cfg,
+                    wyoming_tts_cfg=wyoming_tts_cfg,
+                    openai_tts_cfg=openai_tts_cfg,
+                    kokoro_tts_cfg=kokoro_tts_cfg,
+                ),
             ),
         )
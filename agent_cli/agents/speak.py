@@ -21,6 +21,7 @@ from agent_cli.core.utils import (
     setup_logging,
     stop_or_status_or_toggle,
 )
+from agent_cli.services._wyoming_utils import closing_connection_pool
 from agent_cli.services.tts import handle_tts_playback
 
 LOGGER = logging.getLogger()
@@ -71,6 +72,7 @@ async def _async_main(
                 status_message="🔊 Synthesizing speech...",
                 description="Audio",
                 live=live,
+                p=p,
             )
 
 
@@ -111,6 +113,7 @@ def speak(
     log_level: str = opts.LOG_LEVEL,
     log_file: str | None = opts.LOG_FILE,
     quiet: bool = opts.QUIET,
+    latency_profile: str = opts.LATENCY_PROFILE,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
 ) -> None:
@@ -146,6 +149,7 @@ def speak(
         audio_out_cfg = config.AudioOutput(
             output_device_index=output_device_index,
             output_device_name=output_device_name,
+            latency_profile=latency_profile,
             tts_speed=tts_speed,
             enable_tts=True,  # Implied for speak command
         )
@@ -167,13 +171,15 @@ def speak(
         )
 
         asyncio.run(
-            _async_main(
-                general_cfg=general_cfg,
-                text=text,
-                provider_cfg=provider_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
+            closing_connection_pool(
+                _async_main(
+                    general_cfg=general_cfg,
+                    text=text,
+                    provider_cfg=provider_cfg,
+                    audio_out_cfg=audio_out_cfg,
+                    wyoming_tts_cfg=wyoming_tts_cfg,
+                    openai_tts_cfg=openai_tts_cfg,
+                    kokoro_tts_cfg=kokoro_tts_cfg,
+                ),
             ),
         )
@@ -9,16 +9,19 @@ import platform
 import time
 from contextlib import suppress
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path  # noqa: TC003
 from typing import TYPE_CHECKING
 
 import pyperclip
 import typer
 
-from agent_cli import config, opts
+from agent_cli import config, constants, opts
+from agent_cli.agents._transcribe_batch import find_audio_files, transcribe_batch
 from agent_cli.cli import app
 from agent_cli.core import process
 from agent_cli.core.audio import pyaudio_context, setup_devices
+from agent_cli.core.transcription_cache import cache_key, get_default_cache
 from agent_cli.core.utils import (
     maybe_live,
     print_command_line_args,
@@ -30,14 +33,21 @@ from agent_cli.core.utils import (
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
+from agent_cli.services._wyoming_utils import closing_connection_pool
 from agent_cli.services.asr import (
     create_recorded_audio_transcriber,
     get_last_recording,
     load_audio_from_file,
 )
-from agent_cli.services.llm import process_and_update_clipboard
+from agent_cli.services.llm import (
+    INPUT_TEMPLATE,
+    get_llm_response,
+    process_and_update_clipboard,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     import pyaudio
 
 LOGGER = logging.getLogger()
@@ -111,7 +121,121 @@ def log_transcription(
         f.write(json.dumps(log_entry) + "\n")
 
 
-async def _async_main(  # noqa: PLR0912, PLR0915
+def _llm_model_info(
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+) -> str:
+    """Return the LLM provider and model, for the transcription log."""
+    if provider_cfg.llm_provider == "local":
+        return f"{provider_cfg.llm_provider}:{ollama_cfg.llm_ollama_model}"
+    if provider_cfg.llm_provider == "openai":
+        return f"{provider_cfg.llm_provider}:{openai_llm_cfg.llm_openai_model}"
+    if provider_cfg.llm_provider == "gemini":
+        return f"{provider_cfg.llm_provider}:{gemini_llm_cfg.llm_gemini_model}"
+    msg = f"Unsupported LLM provider: {provider_cfg.llm_provider}"
+    raise ValueError(msg)
+
+
+def _asr_model_info(
+    provider_cfg: config.ProviderSelection,
+    openai_asr_cfg: config.OpenAIASR,
+) -> str:
+    """Return the ASR provider and model, for the transcription log."""
+    if provider_cfg.asr_provider == "openai":
+        return f"{provider_cfg.asr_provider}:{openai_asr_cfg.asr_openai_model}"
+    return provider_cfg.asr_provider
+
+
+async def _transcribe_recorded_audio(
+    audio_data: bytes | memoryview,
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    chunk_size: int,
+    quiet: bool,
+) -> str:
+    """Transcribe recorded audio with the configured provider."""
+    recorded_transcriber = create_recorded_audio_transcriber(provider_cfg)
+    # Call with appropriate arguments based on provider
+    if provider_cfg.asr_provider == "openai":
+        return await recorded_transcriber(audio_data, openai_asr_cfg, LOGGER, quiet=quiet)
+    # Wyoming expects keyword arguments
+    return await recorded_transcriber(
+        audio_data=audio_data,
+        wyoming_asr_cfg=wyoming_asr_cfg,
+        logger=LOGGER,
+        quiet=quiet,
+        chunk_size=chunk_size,
+    )
+
+
+async def _transcribe_file_audio(
+    audio_data: bytes | memoryview,
+    *,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    silence_trim_cfg: config.SilenceTrim | None,
+    segmented_cfg: config.SegmentedTranscription | None,
+    chunk_size: int,
+    transcript_cache: bool,
+    quiet: bool,
+) -> str:
+    """Trim, then transcribe PCM from a file, using segments and the cache if enabled."""
+    audio_data = asr.trim_silence(audio_data, silence_trim_cfg, LOGGER)
+    transcribe_segment = partial(
+        _transcribe_recorded_audio,
+        provider_cfg=provider_cfg,
+        wyoming_asr_cfg=wyoming_asr_cfg,
+        openai_asr_cfg=openai_asr_cfg,
+        chunk_size=chunk_size,
+        quiet=quiet,
+    )
+    key = cache_key(
+        audio_data,
+        asr.asr_identity(provider_cfg, wyoming_asr_cfg, openai_asr_cfg),
+        segmented_cfg.model_dump_json() if segmented_cfg else "",
+    )
+    return await asr.cached_transcription(
+        get_default_cache() if transcript_cache else None,
+        key,
+        partial(asr.transcribe_segmented, audio_data, transcribe_segment, segmented_cfg, LOGGER),
+        LOGGER,
+    )
+
+
+async def _async_batch(
+    directory: Path,
+    pattern: str,
+    output: Path,
+    transcribe_file: Callable[[bytes], Awaitable[str]],
+    *,
+    concurrency: int,
+    quiet: bool,
+) -> None:
+    """Transcribe all matching audio files in a directory into a JSONL file."""
+    files = find_audio_files(directory, pattern)
+    if not quiet:
+        print_with_style(f"📁 Found {len(files)} audio file(s) in {directory}", style="blue")
+    transcribed, failed, skipped = await transcribe_batch(
+        files,
+        output,
+        transcribe_file,
+        LOGGER,
+        concurrency=concurrency,
+    )
+    if not quiet:
+        print_with_style(
+            f"✅ Transcribed {transcribed}, failed {failed}, skipped {skipped} already done."
+            f" Results in {output}",
+            style="red" if failed else "green",
+        )
+
+
+async def _async_main(  # noqa: PLR0912
     *,
     extra_instructions: str | None,
     provider_cfg: config.ProviderSelection,
@@ -128,6 +252,9 @@ async def _async_main(  # noqa: PLR0912, PLR0915
     # Optional parameters for file-based transcription
     audio_file_path: Path | None = None,
     save_recording: bool = True,
+    silence_trim_cfg: config.SilenceTrim | None = None,
+    segmented_cfg: config.SegmentedTranscription | None = None,
+    transcript_cache: bool = False,
 ) -> None:
     """Unified async entry point for both live and file-based transcription."""
     start_time = time.monotonic()
@@ -143,27 +270,19 @@ async def _async_main(  # noqa: PLR0912, PLR0915
                     style="red",
                 )
                 return
-
-            recorded_transcriber = create_recorded_audio_transcriber(provider_cfg)
-
-            asr_config = (
-                openai_asr_cfg if provider_cfg.asr_provider == "openai" else wyoming_asr_cfg
+            transcript = await _transcribe_file_audio(
+                audio_data,
+                provider_cfg=provider_cfg,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                openai_asr_cfg=openai_asr_cfg,
+                silence_trim_cfg=silence_trim_cfg,
+                segmented_cfg=segmented_cfg,
+                chunk_size=(
+                    audio_in_cfg.chunk_size if audio_in_cfg else constants.PYAUDIO_CHUNK_SIZE
+                ),
+                transcript_cache=transcript_cache,
+                quiet=general_cfg.quiet,
             )
-            # Call with appropriate arguments based on provider
-            if provider_cfg.asr_provider == "openai":
-                transcript = await recorded_transcriber(
-                    audio_data,
-                    asr_config,
-                    LOGGER,
-                    quiet=general_cfg.quiet,
-                )
-            else:  # Wyoming expects keyword arguments
-                transcript = await recorded_transcriber(
-                    audio_data=audio_data,
-                    wyoming_asr_cfg=asr_config,
-                    logger=LOGGER,
-                    quiet=general_cfg.quiet,
-                )
         else:
             # Live recording transcription
             if not audio_in_cfg or not p:
@@ -176,6 +295,7 @@ async def _async_main(  # noqa: PLR0912, PLR0915
                     audio_in_cfg,
                     wyoming_asr_cfg,
                     openai_asr_cfg,
+                    silence_trim_cfg,
                 )
                 transcript = await live_transcriber(
                     logger=LOGGER,
@@ -184,6 +304,7 @@ async def _async_main(  # noqa: PLR0912, PLR0915
                     quiet=general_cfg.quiet,
                     live=live,
                     save_recording=save_recording,
+                    show_partials=True,
                 )
 
         elapsed = time.monotonic() - start_time
@@ -200,15 +321,7 @@ async def _async_main(  # noqa: PLR0912, PLR0915
                 instructions += f"\n\n{extra_instructions}"
 
             # Get model info for logging
-            if provider_cfg.llm_provider == "local":
-                model_info = f"{provider_cfg.llm_provider}:{ollama_cfg.llm_ollama_model}"
-            elif provider_cfg.llm_provider == "openai":
-                model_info = f"{provider_cfg.llm_provider}:{openai_llm_cfg.llm_openai_model}"
-            elif provider_cfg.llm_provider == "gemini":
-                model_info = f"{provider_cfg.llm_provider}:{gemini_llm_cfg.llm_gemini_model}"
-            else:
-                msg = f"Unsupported LLM provider: {provider_cfg.llm_provider}"
-                raise ValueError(msg)
+            model_info = _llm_model_info(provider_cfg, ollama_cfg, openai_llm_cfg, gemini_llm_cfg)
 
             processed_transcript = await process_and_update_clipboard(
                 system_prompt=SYSTEM_PROMPT,
@@ -250,15 +363,12 @@ async def _async_main(  # noqa: PLR0912, PLR0915
 
         # Log transcription if requested (raw only)
         if transcription_log:
-            asr_model_info = f"{provider_cfg.asr_provider}"
-            if provider_cfg.asr_provider == "openai":
-                asr_model_info += f":{openai_asr_cfg.asr_openai_model}"
             log_transcription(
                 log_file=transcription_log,
                 role="user",
                 raw_transcript=transcript,
                 processed_transcript=None,
-                model_info=asr_model_info,
+                model_info=_asr_model_info(provider_cfg, openai_asr_cfg),
             )
 
         if general_cfg.clipboard:
@@ -272,8 +382,142 @@ async def _async_main(  # noqa: PLR0912, PLR0915
             print_with_style("⚠️ No transcript captured.", style="yellow")
 
 
+async def _clean_up_segment(
+    transcript: str,
+    *,
+    extra_instructions: str | None,
+    provider_cfg: config.ProviderSelection,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+) -> str | None:
+    """Clean up the transcript of one segment with the LLM, without touching the clipboard."""
+    instructions = AGENT_INSTRUCTIONS
+    if extra_instructions:
+        instructions += f"\n\n{extra_instructions}"
+    return await get_llm_response(
+        system_prompt=SYSTEM_PROMPT,
+        agent_instructions=instructions,
+        user_input=INPUT_TEMPLATE.format(original_text=transcript, instruction=INSTRUCTION),
+        provider_cfg=provider_cfg,
+        ollama_cfg=ollama_cfg,
+        openai_cfg=openai_llm_cfg,
+        gemini_cfg=gemini_llm_cfg,
+        logger=LOGGER,
+        quiet=True,
+    )
+
+
+async def _async_continuous(
+    *,
+    extra_instructions: str | None,
+    provider_cfg: config.ProviderSelection,
+    general_cfg: config.General,
+    audio_in_cfg: config.AudioInput,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    ollama_cfg: config.Ollama,
+    openai_llm_cfg: config.OpenAILLM,
+    gemini_llm_cfg: config.GeminiLLM,
+    llm_enabled: bool,
+    transcription_log: Path | None,
+    p: pyaudio.PyAudio,
+    save_recording: bool,
+    silence_trim_cfg: config.SilenceTrim,
+    segmented_cfg: config.SegmentedTranscription,
+) -> None:
+    """Dictate until stopped, transcribing each segment while the next one is recorded.
+
+    Every segment is transcribed, optionally cleaned up, and appended to the output
+    as soon as it is done, so once the user stops only the last segment is left.
+    """
+    segments: asyncio.Queue[bytes | None] = asyncio.Queue()
+    texts: list[str] = []
+    with (
+        maybe_live(not general_cfg.quiet) as live,
+        signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
+    ):
+        recorder = asyncio.create_task(
+            asr.record_segments(
+                p,
+                audio_in_cfg.input_device_index,
+                stop_event,
+                segments,
+                LOGGER,
+                silence_seconds=audio_in_cfg.vad_silence_seconds,
+                max_segment_seconds=segmented_cfg.segment_seconds,
+                quiet=general_cfg.quiet,
+                live=live,
+                save_recording=save_recording,
+                recording_format=audio_in_cfg.recording_format,
+                chunk_size=audio_in_cfg.chunk_size,
+            ),
+        )
+        try:
+            while (segment := await segments.get()) is not None:
+                start_time = time.monotonic()
+                transcript = await _transcribe_recorded_audio(
+                    asr.trim_silence(segment, silence_trim_cfg, LOGGER),
+                    provider_cfg=provider_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    chunk_size=audio_in_cfg.chunk_size,
+                    quiet=True,
+                )
+                if not transcript:
+                    LOGGER.info("Segment transcript empty.")
+                    continue
+                processed_transcript = None
+                if llm_enabled:
+                    processed_transcript = await _clean_up_segment(
+                        transcript,
+                        extra_instructions=extra_instructions,
+                        provider_cfg=provider_cfg,
+                        ollama_cfg=ollama_cfg,
+                        openai_llm_cfg=openai_llm_cfg,
+                        gemini_llm_cfg=gemini_llm_cfg,
+                    )
+                texts.append(processed_transcript or transcript)
+
+                if general_cfg.quiet:
+                    print(texts[-1], flush=True)
+                else:
+                    print_output_panel(
+                        texts[-1],
+                        title=f"📝 Segment {len(texts)}",
+                        subtitle=f"[dim]took {time.monotonic() - start_time:.2f}s[/dim]",
+                    )
+                if general_cfg.clipboard:
+                    pyperclip.copy(" ".join(texts))
+                if transcription_log:
+                    log_transcription(
+                        log_file=transcription_log,
+                        role="assistant" if processed_transcript else "user",
+                        raw_transcript=transcript,
+                        processed_transcript=processed_transcript,
+                        model_info=(
+                            _llm_model_info(
+                                provider_cfg,
+                                ollama_cfg,
+                                openai_llm_cfg,
+                                gemini_llm_cfg,
+                            )
+                            if processed_transcript
+                            else _asr_model_info(provider_cfg, openai_asr_cfg)
+                        ),
+                    )
+        finally:
+            stop_event.set()
+            await recorder
+
+    if not texts:
+        LOGGER.info("Transcript empty.")
+        if not general_cfg.quiet:
+            print_with_style("⚠️ No transcript captured.", style="yellow")
+
+
 @app.command("transcribe")
-def transcribe(  # noqa: PLR0912
+def transcribe(  # noqa: PLR0911, PLR0912, PLR0915
     *,
     extra_instructions: str | None = typer.Option(
         None,
@@ -283,15 +527,36 @@ def transcribe(  # noqa: PLR0912
     from_file: Path | None = opts.FROM_FILE,
     last_recording: int = opts.LAST_RECORDING,
     save_recording: bool = opts.SAVE_RECORDING,
+    keep_recordings: int = opts.KEEP_RECORDINGS,
+    recording_max_age: float = opts.RECORDING_MAX_AGE,
+    recording_max_size: float = opts.RECORDING_MAX_SIZE,
+    recording_format: str = opts.RECORDING_FORMAT,
+    # --- Batch Transcription ---
+    from_dir: Path | None = opts.FROM_DIR,
+    glob: str = opts.BATCH_GLOB,
+    batch_output: Path | None = opts.BATCH_OUTPUT,
+    batch_concurrency: int = opts.BATCH_CONCURRENCY,
     # --- Provider Selection ---
     asr_provider: str = opts.ASR_PROVIDER,
     llm_provider: str = opts.LLM_PROVIDER,
     # --- ASR (Audio) Configuration ---
     input_device_index: int | None = opts.INPUT_DEVICE_INDEX,
     input_device_name: str | None = opts.INPUT_DEVICE_NAME,
+    max_recording_duration: float = opts.MAX_RECORDING_DURATION,
+    vad: bool = opts.VAD,
+    vad_silence: float = opts.VAD_SILENCE,
+    continuous: bool = opts.CONTINUOUS,
+    trim_silence: bool = opts.TRIM_SILENCE,
+    trim_threshold: float = opts.TRIM_THRESHOLD,
+    trim_max_pause: float = opts.TRIM_MAX_PAUSE,
+    parallel_segments: int = opts.PARALLEL_SEGMENTS,
+    segment_seconds: float = opts.SEGMENT_SECONDS,
+    transcript_cache: bool = opts.TRANSCRIPT_CACHE,
     asr_wyoming_ip: str = opts.ASR_WYOMING_IP,
     asr_wyoming_port: int = opts.ASR_WYOMING_PORT,
+    asr_wyoming_endpoint: list[str] | None = opts.ASR_WYOMING_ENDPOINTS,
     asr_openai_model: str = opts.ASR_OPENAI_MODEL,
+    asr_openai_upload_format: str = opts.ASR_OPENAI_UPLOAD_FORMAT,
     # --- LLM Configuration ---
     llm_ollama_model: str = opts.LLM_OLLAMA_MODEL,
     llm_ollama_host: str = opts.LLM_OLLAMA_HOST,
@@ -311,6 +576,7 @@ def transcribe(  # noqa: PLR0912
     log_file: str | None = opts.LOG_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
+    latency_profile: str = opts.LATENCY_PROFILE,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
     transcription_log: Path | None = opts.TRANSCRIPTION_LOG,
@@ -324,10 +590,33 @@ def transcribe(  # noqa: PLR0912
     if transcription_log:
         transcription_log = transcription_log.expanduser()
 
+    asr.apply_recording_retention(
+        config.RecordingRetention(
+            keep_recordings=keep_recordings,
+            recording_max_age_days=recording_max_age,
+            recording_max_size_mb=recording_max_size,
+        ),
+    )
+
     # Handle recovery options
     if last_recording and from_file:
         print_with_style("❌ Cannot use both --last-recording and --from-file", style="red")
         return
+    if from_dir and (last_recording or from_file):
+        print_with_style(
+            "❌ Cannot combine --from-dir with --last-recording or --from-file",
+            style="red",
+        )
+        return
+    if continuous and (from_dir or last_recording or from_file):
+        print_with_style(
+            "❌ --continuous only works with live recording",
+            style="red",
+        )
+        return
+    if from_dir and not from_dir.expanduser().is_dir():
+        print_with_style(f"❌ Directory not found: {from_dir}", style="red")
+        return
 
     # Determine audio source
     audio_file_path = None
@@ -370,11 +659,22 @@ def transcribe(  # noqa: PLR0912
     wyoming_asr_cfg = config.WyomingASR(
         asr_wyoming_ip=asr_wyoming_ip,
         asr_wyoming_port=asr_wyoming_port,
+        asr_wyoming_endpoints=asr_wyoming_endpoint or [],
     )
     openai_asr_cfg = config.OpenAIASR(
         asr_openai_model=asr_openai_model,
+        asr_openai_upload_format=asr_openai_upload_format,
         openai_api_key=openai_api_key,
     )
+    silence_trim_cfg = config.SilenceTrim(
+        trim_silence=trim_silence,
+        trim_threshold_db=trim_threshold,
+        trim_max_pause_seconds=trim_max_pause,
+    )
+    segmented_cfg = config.SegmentedTranscription(
+        parallel_segments=parallel_segments,
+        segment_seconds=segment_seconds,
+    )
     ollama_cfg = config.Ollama(
         llm_ollama_model=llm_ollama_model,
         llm_ollama_host=llm_ollama_host,
@@ -389,22 +689,55 @@ def transcribe(  # noqa: PLR0912
         gemini_api_key=gemini_api_key,
     )
 
+    if from_dir:
+        from_dir = from_dir.expanduser()
+        transcribe_file = partial(
+            _transcribe_file_audio,
+            provider_cfg=provider_cfg,
+            wyoming_asr_cfg=wyoming_asr_cfg,
+            openai_asr_cfg=openai_asr_cfg,
+            silence_trim_cfg=silence_trim_cfg,
+            segmented_cfg=segmented_cfg,
+            chunk_size=config.AudioInput(latency_profile=latency_profile).chunk_size,
+            transcript_cache=transcript_cache,
+            quiet=True,
+        )
+        asyncio.run(
+            closing_connection_pool(
+                _async_batch(
+                    from_dir,
+                    glob,
+                    (batch_output or from_dir / "transcripts.jsonl").expanduser(),
+                    transcribe_file,
+                    concurrency=batch_concurrency,
+                    quiet=quiet,
+                ),
+            ),
+        )
+        return
+
     # Handle recovery mode (transcribing from file)
     if audio_file_path:
         # We're transcribing from a saved file
         asyncio.run(
-            _async_main(
-                audio_file_path=audio_file_path,
-                extra_instructions=extra_instructions,
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                llm_enabled=llm,
-                transcription_log=transcription_log,
+            closing_connection_pool(
+                _async_main(
+                    audio_file_path=audio_file_path,
+                    extra_instructions=extra_instructions,
+                    provider_cfg=provider_cfg,
+                    general_cfg=general_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_llm_cfg=openai_llm_cfg,
+                    gemini_llm_cfg=gemini_llm_cfg,
+                    llm_enabled=llm,
+                    transcription_log=transcription_log,
+                    silence_trim_cfg=silence_trim_cfg,
+                    segmented_cfg=segmented_cfg,
+                    transcript_cache=transcript_cache,
+                    audio_in_cfg=config.AudioInput(latency_profile=latency_profile),
+                ),
             ),
         )
         return
@@ -425,6 +758,11 @@ def transcribe(  # noqa: PLR0912
         audio_in_cfg = config.AudioInput(
             input_device_index=input_device_index,
             input_device_name=input_device_name,
+            latency_profile=latency_profile,
+            max_recording_seconds=max_recording_duration,
+            vad=vad,
+            vad_silence_seconds=vad_silence,
+            recording_format=recording_format,
         )
 
         # We only use setup_devices for its input device handling
@@ -436,20 +774,46 @@ def transcribe(  # noqa: PLR0912
 
         # Use context manager for PID file management
         with process.pid_file_context(process_name), suppress(KeyboardInterrupt):
+            if continuous:
+                asyncio.run(
+                    closing_connection_pool(
+                        _async_continuous(
+                            extra_instructions=extra_instructions,
+                            provider_cfg=provider_cfg,
+                            general_cfg=general_cfg,
+                            audio_in_cfg=audio_in_cfg,
+                            wyoming_asr_cfg=wyoming_asr_cfg,
+                            openai_asr_cfg=openai_asr_cfg,
+                            ollama_cfg=ollama_cfg,
+                            openai_llm_cfg=openai_llm_cfg,
+                            gemini_llm_cfg=gemini_llm_cfg,
+                            llm_enabled=llm,
+                            transcription_log=transcription_log,
+                            save_recording=save_recording,
+                            silence_trim_cfg=silence_trim_cfg,
+                            segmented_cfg=segmented_cfg,
+                            p=p,
+                        ),
+                    ),
+                )
+                return
             asyncio.run(
-                _async_main(
-                    extra_instructions=extra_instructions,
-                    provider_cfg=provider_cfg,
-                    general_cfg=general_cfg,
-                    audio_in_cfg=audio_in_cfg,
-                    wyoming_asr_cfg=wyoming_asr_cfg,
-                    openai_asr_cfg=openai_asr_cfg,
-                    ollama_cfg=ollama_cfg,
-                    openai_llm_cfg=openai_llm_cfg,
-                    gemini_llm_cfg=gemini_llm_cfg,
-                    llm_enabled=llm,
-                    transcription_log=transcription_log,
-                    save_recording=save_recording,
-                    p=p,
+                closing_connection_pool(
+                    _async_main(
+                        extra_instructions=extra_instructions,
+                        provider_cfg=provider_cfg,
+                        general_cfg=general_cfg,
+                        audio_in_cfg=audio_in_cfg,
+                        wyoming_asr_cfg=wyoming_asr_cfg,
+                        openai_asr_cfg=openai_asr_cfg,
+                        ollama_cfg=ollama_cfg,
+                        openai_llm_cfg=openai_llm_cfg,
+                        gemini_llm_cfg=gemini_llm_cfg,
+                        llm_enabled=llm,
+                        transcription_log=transcription_log,
+                        save_recording=save_recording,
+                        silence_trim_cfg=silence_trim_cfg,
+                        p=p,
+                    ),
                 ),
             )
@@ -42,10 +42,11 @@ from agent_cli import config, opts
 from agent_cli.agents._voice_agent_common import (
     get_instruction_from_audio,
     process_instruction_and_respond,
+    start_live_transcription,
 )
 from agent_cli.cli import app
 from agent_cli.core import process
-from agent_cli.core.audio import pyaudio_context, setup_devices
+from agent_cli.core.audio import create_vad, pyaudio_context, setup_devices
 from agent_cli.core.utils import (
     get_clipboard_text,
     maybe_live,
@@ -57,6 +58,7 @@ from agent_cli.core.utils import (
     stop_or_status_or_toggle,
 )
 from agent_cli.services import asr
+from agent_cli.services._wyoming_utils import closing_connection_pool
 
 LOGGER = logging.getLogger()
 
@@ -122,6 +124,14 @@ async def _async_main(
             signal_handling_context(LOGGER, general_cfg.quiet) as stop_event,
             maybe_live(not general_cfg.quiet) as live,
         ):
+            # Stream the audio to ASR while recording, so the transcript is ready at stop
+            asr_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+            live_transcript = start_live_transcription(
+                asr_queue,
+                provider_cfg=provider_cfg,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                logger=LOGGER,
+            )
             audio_data = await asr.record_audio_with_manual_stop(
                 p,
                 input_device_index,
@@ -129,9 +139,16 @@ async def _async_main(
                 LOGGER,
                 live=live,
                 quiet=general_cfg.quiet,
+                max_recording_seconds=audio_in_cfg.max_recording_seconds,
+                vad=create_vad(audio_in_cfg),
+                chunk_size=audio_in_cfg.chunk_size,
+                tee_queue=asr_queue if live_transcript else None,
+                tee_reader=live_transcript,
             )
 
             if not audio_data:
+                if live_transcript:
+                    live_transcript.cancel()
                 if not general_cfg.quiet:
                     print_with_style("No audio recorded", style="yellow")
                 return
@@ -145,6 +162,7 @@ async def _async_main(
                 ollama_cfg=ollama_cfg,
                 logger=LOGGER,
                 quiet=general_cfg.quiet,
+                live_transcript=live_transcript,
             )
             if not instruction:
                 return
@@ -165,6 +183,7 @@ async def _async_main(
                 agent_instructions=AGENT_INSTRUCTIONS,
                 live=live,
                 logger=LOGGER,
+                p=p,
             )
 
 
@@ -178,9 +197,13 @@ def voice_edit(
     # --- ASR (Audio) Configuration ---
     input_device_index: int | None = opts.INPUT_DEVICE_INDEX,
     input_device_name: str | None = opts.INPUT_DEVICE_NAME,
+    max_recording_duration: float = opts.MAX_RECORDING_DURATION,
+    vad: bool = opts.VAD,
+    vad_silence: float = opts.VAD_SILENCE,
     asr_wyoming_ip: str = opts.ASR_WYOMING_IP,
     asr_wyoming_port: int = opts.ASR_WYOMING_PORT,
     asr_openai_model: str = opts.ASR_OPENAI_MODEL,
+    asr_openai_upload_format: str = opts.ASR_OPENAI_UPLOAD_FORMAT,
     # --- LLM Configuration ---
     llm_ollama_model: str = opts.LLM_OLLAMA_MODEL,
     llm_ollama_host: str = opts.LLM_OLLAMA_HOST,
@@ -215,6 +238,7 @@ def voice_edit(
     log_file: str | None = opts.LOG_FILE,
     list_devices: bool = opts.LIST_DEVICES,
     quiet: bool = opts.QUIET,
+    latency_profile: str = opts.LATENCY_PROFILE,
     config_file: str | None = opts.CONFIG_FILE,
     print_args: bool = opts.PRINT_ARGS,
 ) -> None:
@@ -259,6 +283,10 @@ def voice_edit(
         audio_in_cfg = config.AudioInput(
             input_device_index=input_device_index,
             input_device_name=input_device_name,
+            latency_profile=latency_profile,
+            max_recording_seconds=max_recording_duration,
+            vad=vad,
+            vad_silence_seconds=vad_silence,
         )
         wyoming_asr_cfg = config.WyomingASR(
             asr_wyoming_ip=asr_wyoming_ip,
@@ -266,6 +294,7 @@ def voice_edit(
         )
         openai_asr_cfg = config.OpenAIASR(
             asr_openai_model=asr_openai_model,
+            asr_openai_upload_format=asr_openai_upload_format,
             openai_api_key=openai_api_key,
         )
         ollama_cfg = config.Ollama(
@@ -285,6 +314,7 @@ def voice_edit(
             enable_tts=enable_tts,
             output_device_index=output_device_index,
             output_device_name=output_device_name,
+            latency_profile=latency_profile,
             tts_speed=tts_speed,
         )
         wyoming_tts_cfg = config.WyomingTTS(
@@ -306,18 +336,20 @@ def voice_edit(
         )
 
         asyncio.run(
-            _async_main(
-                provider_cfg=provider_cfg,
-                general_cfg=general_cfg,
-                audio_in_cfg=audio_in_cfg,
-                wyoming_asr_cfg=wyoming_asr_cfg,
-                openai_asr_cfg=openai_asr_cfg,
-                ollama_cfg=ollama_cfg,
-                openai_llm_cfg=openai_llm_cfg,
-                gemini_llm_cfg=gemini_llm_cfg,
-                audio_out_cfg=audio_out_cfg,
-                wyoming_tts_cfg=wyoming_tts_cfg,
-                openai_tts_cfg=openai_tts_cfg,
-                kokoro_tts_cfg=kokoro_tts_cfg,
+            closing_connection_pool(
+                _async_main(
+                    provider_cfg=provider_cfg,
+                    general_cfg=general_cfg,
+                    audio_in_cfg=audio_in_cfg,
+                    wyoming_asr_cfg=wyoming_asr_cfg,
+                    openai_asr_cfg=openai_asr_cfg,
+                    ollama_cfg=ollama_cfg,
+                    openai_llm_cfg=openai_llm_cfg,
+                    gemini_llm_cfg=gemini_llm_cfg,
+                    audio_out_cfg=audio_out_cfg,
+                    wyoming_tts_cfg=wyoming_tts_cfg,
+                    openai_tts_cfg=openai_tts_cfg,
+                    kokoro_tts_cfg=kokoro_tts_cfg,
+                ),
             ),
         )
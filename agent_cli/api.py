@@ -2,28 +2,45 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from agent_cli import config, opts
 from agent_cli.agents.transcribe import AGENT_INSTRUCTIONS, INSTRUCTION, SYSTEM_PROMPT
 from agent_cli.core.audio_format import VALID_EXTENSIONS, convert_audio_to_wyoming_format
+from agent_cli.core.transcription_cache import cache_key, get_default_cache
 from agent_cli.core.transcription_logger import get_default_logger
 from agent_cli.services import asr
+from agent_cli.services._wyoming_utils import close_connection_pool
 from agent_cli.services.llm import process_and_update_clipboard
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Close the pooled Wyoming connections when the server shuts down."""
+    yield
+    await close_connection_pool()
+
+
 app = FastAPI(
     title="Agent CLI Transcription API",
     description="Web service for audio transcription and text cleanup",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -85,25 +102,39 @@ async def health_check() -> HealthResponse:
 
 
 async def _transcribe_with_provider(
-    audio_data: bytes,
+    audio_data: bytes | memoryview,
     provider_cfg: config.ProviderSelection,
     wyoming_asr_cfg: config.WyomingASR,
     openai_asr_cfg: config.OpenAIASR,
+    segmented_cfg: config.SegmentedTranscription | None = None,
+    *,
+    filename: str = "audio.wav",
 ) -> str:
-    """Transcribe audio using the configured provider."""
+    """Transcribe audio using the configured provider.
+
+    Local ASR audio is raw PCM, so long uploads can be transcribed in concurrent
+    segments according to ``segmented_cfg``. OpenAI gets the uploaded file
+    unchanged, named ``filename``.
+    """
     transcriber = asr.create_recorded_audio_transcriber(provider_cfg)
 
     if provider_cfg.asr_provider == "local":
-        return await transcriber(
-            audio_data=audio_data,
-            wyoming_asr_cfg=wyoming_asr_cfg,
-            logger=LOGGER,
+        return await asr.transcribe_segmented(
+            audio_data,
+            lambda segment: transcriber(
+                audio_data=segment,
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                logger=LOGGER,
+            ),
+            segmented_cfg,
+            LOGGER,
         )
     if provider_cfg.asr_provider == "openai":
         return await transcriber(
             audio_data=audio_data,
             openai_asr_cfg=openai_asr_cfg,
             logger=LOGGER,
+            filename=filename,
         )
     msg = f"Unsupported ASR provider: {provider_cfg.asr_provider}"
     raise ValueError(msg)
@@ -165,6 +196,8 @@ def _load_transcription_configs() -> tuple[
     config.ProviderSelection,
     config.WyomingASR,
     config.OpenAIASR,
+    config.SilenceTrim,
+    config.SegmentedTranscription,
     config.Ollama,
     config.OpenAILLM,
     config.GeminiLLM,
@@ -184,10 +217,24 @@ def _load_transcription_configs() -> tuple[
     wyoming_asr_cfg = config.WyomingASR(
         asr_wyoming_ip=defaults.get("asr_wyoming_ip", opts.ASR_WYOMING_IP.default),  # type: ignore[attr-defined]
         asr_wyoming_port=defaults.get("asr_wyoming_port", opts.ASR_WYOMING_PORT.default),  # type: ignore[attr-defined]
+        asr_wyoming_endpoints=defaults.get("asr_wyoming_endpoint") or [],
     )
     openai_asr_cfg = config.OpenAIASR(
         asr_openai_model=defaults.get("asr_openai_model", opts.ASR_OPENAI_MODEL.default),  # type: ignore[attr-defined]
         openai_api_key=defaults.get("openai_api_key", opts.OPENAI_API_KEY.default),  # type: ignore[attr-defined,union-attr]
+        asr_openai_upload_format=defaults.get(
+            "asr_openai_upload_format",
+            opts.ASR_OPENAI_UPLOAD_FORMAT.default,  # type: ignore[attr-defined]
+        ),
+    )
+    silence_trim_cfg = config.SilenceTrim(
+        trim_silence=defaults.get("trim_silence", opts.TRIM_SILENCE.default),  # type: ignore[attr-defined]
+        trim_threshold_db=defaults.get("trim_threshold", opts.TRIM_THRESHOLD.default),  # type: ignore[attr-defined]
+        trim_max_pause_seconds=defaults.get("trim_max_pause", opts.TRIM_MAX_PAUSE.default),  # type: ignore[attr-defined]
+    )
+    segmented_cfg = config.SegmentedTranscription(
+        parallel_segments=defaults.get("parallel_segments", opts.PARALLEL_SEGMENTS.default),  # type: ignore[attr-defined]
+        segment_seconds=defaults.get("segment_seconds", opts.SEGMENT_SECONDS.default),  # type: ignore[attr-defined]
     )
     ollama_cfg = config.Ollama(
         llm_ollama_model=defaults.get("llm_ollama_model", opts.LLM_OLLAMA_MODEL.default),  # type: ignore[attr-defined]
@@ -207,6 +254,8 @@ def _load_transcription_configs() -> tuple[
         provider_cfg,
         wyoming_asr_cfg,
         openai_asr_cfg,
+        silence_trim_cfg,
+        segmented_cfg,
         ollama_cfg,
         openai_llm_cfg,
         gemini_llm_cfg,
@@ -293,6 +342,8 @@ async def transcribe_audio(
             provider_cfg,
             wyoming_asr_cfg,
             openai_asr_cfg,
+            silence_trim_cfg,
+            segmented_cfg,
             ollama_cfg,
             openai_llm_cfg,
             gemini_llm_cfg,
@@ -300,18 +351,38 @@ async def transcribe_audio(
         ) = _load_transcription_configs()
 
         # Save uploaded file
-        audio_data = await audio_file.read()
-
-        # Convert audio to Wyoming format if using local ASR
-        if provider_cfg.asr_provider == "local":
-            audio_data = _convert_audio_for_local_asr(audio_data, audio_file.filename)
+        uploaded_data = await audio_file.read()
+
+        async def transcribe() -> str:
+            audio_data = uploaded_data
+            # Convert audio to Wyoming format if using local ASR; only raw PCM can be trimmed
+            if provider_cfg.asr_provider == "local":
+                audio_data = _convert_audio_for_local_asr(audio_data, audio_file.filename)
+                audio_data = asr.trim_silence(audio_data, silence_trim_cfg, LOGGER)
+
+            # Transcribe audio using the configured provider
+            return await _transcribe_with_provider(
+                audio_data,
+                provider_cfg,
+                wyoming_asr_cfg,
+                openai_asr_cfg,
+                segmented_cfg,
+                filename=audio_file.filename or "audio.wav",
+            )
 
-        # Transcribe audio using the configured provider
-        raw_transcript = await _transcribe_with_provider(
-            audio_data,
-            provider_cfg,
-            wyoming_asr_cfg,
-            openai_asr_cfg,
+        # Retried uploads of the same file are answered from the transcript cache
+        use_cache = defaults.get("transcript_cache", opts.TRANSCRIPT_CACHE.default)  # type: ignore[attr-defined]
+        key = cache_key(
+            uploaded_data,
+            asr.asr_identity(provider_cfg, wyoming_asr_cfg, openai_asr_cfg),
+            silence_trim_cfg.model_dump_json(),
+            segmented_cfg.model_dump_json(),
+        )
+        raw_transcript = await asr.cached_transcription(
+            get_default_cache() if use_cache else None,
+            key,
+            transcribe,
+            LOGGER,
         )
 
         if not raw_transcript:
@@ -348,3 +419,60 @@ async def transcribe_audio(
         # Log the transcription automatically (even if it failed)
         transcription_logger = get_default_logger()
         transcription_logger.log_transcription(raw=raw_transcript, processed=cleaned_transcript)
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/transcribe/stream")
+async def transcribe_audio_stream(
+    request: Request,
+    audio: Annotated[UploadFile | None, File()] = None,
+) -> StreamingResponse:
+    """Transcribe an audio file, streaming partial transcripts as server-sent events.
+
+    Emits ``partial`` events while the ASR server produces `TranscriptChunk`s and a
+    ``final`` event with the complete transcript, each with ``text``, ``is_final`` and
+    ``timestamp`` (seconds since the transcription started). Failures are reported
+    as an ``error`` event.
+    """
+    audio_file = await _extract_audio_file_from_request(request, audio)
+    _validate_audio_file(audio_file)
+    audio_data = await audio_file.read()
+
+    async def events() -> AsyncIterator[str]:
+        raw_transcript = ""
+        try:
+            (
+                provider_cfg,
+                wyoming_asr_cfg,
+                openai_asr_cfg,
+                silence_trim_cfg,
+                *_,
+            ) = _load_transcription_configs()
+            data = audio_data
+            if provider_cfg.asr_provider == "local":
+                data = _convert_audio_for_local_asr(data, audio_file.filename)
+                data = asr.trim_silence(data, silence_trim_cfg, LOGGER)
+            async for segment in asr.stream_transcript(
+                data,
+                provider_cfg,
+                wyoming_asr_cfg,
+                openai_asr_cfg,
+                LOGGER,
+                filename=audio_file.filename or "audio.wav",
+            ):
+                if segment.is_final:
+                    raw_transcript = segment.text
+                yield _sse_event("final" if segment.is_final else "partial", segment._asdict())
+            if not raw_transcript:
+                yield _sse_event("error", {"error": "No transcript generated from audio"})
+        except Exception as e:
+            LOGGER.exception("Error during streaming transcription")
+            yield _sse_event("error", {"error": str(e)})
+        finally:
+            get_default_logger().log_transcription(raw=raw_transcript, processed=None)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -8,6 +8,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, field_validator
 
+from agent_cli import constants
 from agent_cli.core.utils import console
 
 CONFIG_PATHS = [
@@ -15,6 +16,9 @@ CONFIG_PATHS = [
     Path.home() / ".config" / "agent-cli" / "config.toml",
 ]
 
+LatencyProfile = Literal["low-latency", "balanced", "throughput"]
+RecordingFormat = Literal["wav", "flac", "opus"]
+
 # --- Panel: Provider Selection ---
 
 
@@ -59,6 +63,40 @@ class AudioInput(BaseModel):
 
     input_device_index: int | None = None
     input_device_name: str | None = None
+    max_recording_seconds: float = constants.MAX_RECORDING_SECONDS
+    vad: bool = False
+    vad_silence_seconds: float = 1.5
+    latency_profile: LatencyProfile = "balanced"
+    recording_format: RecordingFormat = "wav"
+
+    @property
+    def chunk_size(self) -> int:
+        """Frames per buffer for the latency profile."""
+        return constants.LATENCY_PROFILES[self.latency_profile]
+
+
+class SilenceTrim(BaseModel):
+    """Configuration for trimming silence before ASR submission."""
+
+    trim_silence: bool = False
+    trim_threshold_db: float = -45.0
+    trim_max_pause_seconds: float = 0.75
+
+
+class SegmentedTranscription(BaseModel):
+    """Configuration for splitting long audio into concurrently transcribed segments."""
+
+    parallel_segments: int = 1
+    segment_seconds: float = 30.0
+    segment_overlap_seconds: float = 0.5
+
+
+class RecordingRetention(BaseModel):
+    """Retention policy for saved recordings (0 disables a limit)."""
+
+    keep_recordings: int = 0
+    recording_max_age_days: float = 0
+    recording_max_size_mb: float = 0
 
 
 class WyomingASR(BaseModel):
@@ -66,6 +104,26 @@ class WyomingASR(BaseModel):
 
     asr_wyoming_ip: str
     asr_wyoming_port: int
+    asr_wyoming_endpoints: list[str] = []
+
+    @field_validator("asr_wyoming_endpoints")
+    @classmethod
+    def _check_endpoints(cls, v: list[str]) -> list[str]:
+        for endpoint in v:
+            host, _, port = endpoint.rpartition(":")
+            if not host or not port.isdigit():
+                msg = f"Invalid ASR endpoint {endpoint!r}, expected 'host:port'"
+                raise ValueError(msg)
+        return v
+
+    @property
+    def endpoints(self) -> list[tuple[str, int]]:
+        """The primary server followed by the extra endpoints, without duplicates."""
+        endpoints = [(self.asr_wyoming_ip, self.asr_wyoming_port)]
+        for endpoint in self.asr_wyoming_endpoints:
+            host, _, port = endpoint.rpartition(":")
+            endpoints.append((host, int(port)))
+        return list(dict.fromkeys(endpoints))
 
 
 class OpenAIASR(BaseModel):
@@ -73,6 +131,7 @@ class OpenAIASR(BaseModel):
 
     asr_openai_model: str
     openai_api_key: str | None = None
+    asr_openai_upload_format: RecordingFormat = "flac"
 
 
 # --- Panel: TTS (Text-to-Speech) Configuration ---
@@ -85,6 +144,12 @@ class AudioOutput(BaseModel):
     output_device_name: str | None = None
     tts_speed: float = 1.0
     enable_tts: bool = False
+    latency_profile: LatencyProfile = "balanced"
+
+    @property
+    def chunk_size(self) -> int:
+        """Frames per buffer for the latency profile."""
+        return constants.LATENCY_PROFILES[self.latency_profile]
 
 
 class WyomingTTS(BaseModel):
@@ -8,7 +8,22 @@ import pyaudio
 PYAUDIO_FORMAT = pyaudio.paInt16
 PYAUDIO_CHANNELS = 1
 PYAUDIO_RATE = 16000
-PYAUDIO_CHUNK_SIZE = 1024
+
+# Frames per buffer for each latency profile: small buffers deliver audio sooner,
+# large buffers wake the CPU less often
+LATENCY_PROFILES = {
+    "low-latency": 256,
+    "balanced": 1024,
+    "throughput": 4096,
+}
+DEFAULT_LATENCY_PROFILE = "balanced"
+PYAUDIO_CHUNK_SIZE = LATENCY_PROFILES[DEFAULT_LATENCY_PROFILE]
+
+# Recordings longer than this keep only their most recent part
+MAX_RECORDING_SECONDS = 3600.0
+
+# Silence kept before the speech of each segment in continuous dictation
+SEGMENT_PREROLL_SECONDS = 0.3
 
 # Standard Wyoming audio configuration
 WYOMING_AUDIO_CONFIG = {
@@ -16,3 +31,8 @@ WYOMING_AUDIO_CONFIG = {
     "width": 2,  # 16-bit audio
     "channels": PYAUDIO_CHANNELS,
 }
+
+# Pre-recorded audio is sent to Wyoming in about this many frames, each no smaller
+# than a live capture chunk and holding at most this much audio
+WYOMING_RECORDED_CHUNKS = 64
+WYOMING_MAX_CHUNK_SECONDS = 2.0
@@ -3,17 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import functools
+import itertools
+import json
 import logging
-from contextlib import asynccontextmanager, contextmanager
-from typing import TYPE_CHECKING
-
+import mmap
+import struct
+import threading
+import wave
+import weakref
+from contextlib import asynccontextmanager, contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
 import pyaudio
-from rich.text import Text
 
 from agent_cli import constants
 
-from .utils import InteractiveStopEvent, console, print_device_index, print_with_style
+from .utils import (
+    InteractiveStopEvent,
+    console,
+    print_device_index,
+    print_with_style,
+    render_scheduler,
+)
 
 if TYPE_CHECKING:
     import logging
@@ -23,13 +38,380 @@ if TYPE_CHECKING:
 
     from agent_cli import config
 
+OverflowPolicy = Literal["block", "drop_oldest", "coalesce"]
+
+# Per-consumer tee queue bound, in chunks (~16s of audio at the default chunk size)
+TEE_QUEUE_MAXSIZE = 256
+
+
+class _CaptureThread:
+    """Read a blocking PyAudio stream on a dedicated thread and hand chunks to the loop.
+
+    Instead of one ``asyncio.to_thread`` round trip through the shared default executor
+    per chunk, a single long-lived reader thread performs the blocking reads and wakes
+    the event loop with ``call_soon_threadsafe``. Read-ahead is bounded by ``max_pending``
+    so a stalled consumer cannot grow memory without limit.
+    """
+
+    def __init__(
+        self,
+        stream: pyaudio.Stream,
+        logger: logging.Logger,
+        *,
+        num_frames: int = constants.PYAUDIO_CHUNK_SIZE,
+        max_pending: int = 64,
+    ) -> None:
+        """Initialize the capture thread (call `start` to begin reading)."""
+        self.stream = stream
+        self.logger = logger
+        self.num_frames = num_frames
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[bytes | BaseException] = asyncio.Queue()
+        self._slots = threading.Semaphore(max_pending)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="audio-capture", daemon=True)
+
+    def _run(self) -> None:
+        """Blocking read loop, runs on the capture thread."""
+        while True:
+            self._slots.acquire()
+            if self._stop.is_set():
+                return
+            try:
+                chunk = self.stream.read(self.num_frames, exception_on_overflow=False)
+            except Exception as e:  # handed to the consumer on the loop
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, e)
+                return
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, chunk)
+
+    def start(self) -> None:
+        """Start the capture thread."""
+        self._thread.start()
+
+    async def read(self) -> bytes:
+        """Return the next captured chunk, re-raising errors from the capture thread."""
+        item = await self._queue.get()
+        if isinstance(item, BaseException):
+            raise item
+        self._slots.release()
+        return item
+
+    async def stop(self) -> None:
+        """Stop the capture thread and wait until it no longer touches the stream."""
+        self._stop.set()
+        self._slots.release()  # Wake the thread if it is waiting for a free slot
+        if self._thread.is_alive():
+            await asyncio.to_thread(self._thread.join)
+
+
+@asynccontextmanager
+async def capture_audio_stream(
+    stream: pyaudio.Stream,
+    logger: logging.Logger,
+    *,
+    num_frames: int = constants.PYAUDIO_CHUNK_SIZE,
+) -> AsyncGenerator[_CaptureThread, None]:
+    """Context manager that captures a PyAudio stream on a dedicated thread.
+
+    ``num_frames`` should match the ``frames_per_buffer`` the stream was opened with.
+    The thread is joined on exit, so the stream can safely be closed afterwards.
+    """
+    capture = _CaptureThread(stream, logger, num_frames=num_frames)
+    capture.start()
+    try:
+        yield capture
+    finally:
+        await capture.stop()
+
+
+class AudioBuffer:
+    """A capped, preallocated buffer for recorded PCM audio.
+
+    The buffer reserves ``max_seconds`` of audio up front in an anonymous memory map, so
+    pages are only committed as audio is written and chunks are copied exactly once.
+    `view` hands out a zero-copy `memoryview` of the recording. Once the cap is reached
+    the buffer becomes a ring that keeps the most recent ``max_seconds`` of audio;
+    `views` then returns its two segments without copying, while `view` first rotates
+    the ring in place.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        max_seconds: float = constants.MAX_RECORDING_SECONDS,
+    ) -> None:
+        """Initialize the buffer."""
+        self.logger = logger
+        frame_size = constants.PYAUDIO_CHANNELS * 2
+        frames = max(1, int(max_seconds * constants.PYAUDIO_RATE))
+        self._capacity = frames * frame_size
+        self._data = mmap.mmap(-1, self._capacity)
+        self._size = 0
+        self._start = 0  # Offset of the oldest byte once the ring has wrapped
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes."""
+        return self._size
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, overwriting the oldest audio if the buffer is full."""
+        data = memoryview(chunk)
+        n = len(data)
+        if n >= self._capacity:
+            data = data[n - self._capacity :]
+            n = self._capacity
+        end = (self._start + self._size) % self._capacity
+        first = min(n, self._capacity - end)
+        self._data[end : end + first] = data[:first]
+        self._data[: n - first] = data[first:]
+        overflow = self._size + n - self._capacity
+        if overflow > 0:
+            if self._start == 0 and self._size < self._capacity:
+                self.logger.warning(
+                    "Recording exceeded %.0fs, keeping only the most recent audio",
+                    self._capacity / (constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2),
+                )
+            self._start = (self._start + overflow) % self._capacity
+            self._size = self._capacity
+        else:
+            self._size += n
+
+    def views(self) -> tuple[memoryview, ...]:
+        """Return zero-copy views of the buffered audio segments, oldest first."""
+        data = memoryview(self._data)
+        if not self._start:
+            return (data[: self._size],)
+        return (data[self._start :], data[: self._start])
+
+    def view(self) -> memoryview:
+        """Return a zero-copy view of the buffered audio, oldest byte first."""
+        if self._start:
+            # The ring has wrapped: rotate it in place once so the view is contiguous,
+            # moving the longer segment and copying only the shorter one aside
+            start, head = self._start, self._capacity - self._start
+            if start <= head:
+                newest = self._data[:start]
+                self._data.move(0, start, head)
+                self._data[head:] = newest
+            else:
+                oldest = self._data[start:]
+                self._data.move(head, 0, start)
+                self._data[:head] = oldest
+            self._start = 0
+        return memoryview(self._data)[: self._size]
+
+
+# RIFF header of a 16-bit PCM WAV file whose only other chunk is "data"
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(data_size: int) -> bytes:
+    channels, rate = constants.PYAUDIO_CHANNELS, constants.PYAUDIO_RATE
+    return WAV_HEADER.pack(
+        *(b"RIFF", 36 + data_size, b"WAVE", b"fmt ", 16, 1, channels, rate),
+        *(rate * channels * 2, channels * 2, 16, b"data", data_size),
+    )
+
+
+class WavFileWriter:
+    """A WAV recording written to disk chunk by chunk while it is captured.
+
+    Chunks go straight to the OS with unbuffered writes, so everything captured so far
+    survives a crash or a forced exit, and stopping the recording only has to patch the
+    sizes in the header. `repair_wav_header` patches them for a file that was never closed.
+    """
+
+    def __init__(self, path: Path, logger: logging.Logger) -> None:
+        """Create the file and write a header for an empty recording."""
+        self.path = path
+        self.logger = logger
+        self.size = 0
+        self._file = path.open("wb", buffering=0)
+        self._file.write(_wav_header(0))
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk; after a write error the rest of the recording is dropped."""
+        if self._file.closed:
+            return
+        try:
+            self._file.write(chunk)
+        except OSError:
+            self.logger.exception("Failed to write audio recording to %s", self.path)
+            self._file.close()
+        else:
+            self.size += len(chunk)
+
+    def close(self) -> None:
+        """Patch the header with the final sizes and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self._file.seek(0)
+            self._file.write(_wav_header(self.size))
+        finally:
+            self._file.close()
+
+
+def repair_wav_header(path: Path) -> bool:
+    """Patch the sizes in the header of a `WavFileWriter` recording that was never closed.
+
+    Only a header that still has the empty-recording sizes `WavFileWriter` starts
+    with is patched, so finished recordings and other WAV files are left alone.
+
+    Returns:
+        True if the header was repaired, False if it was already correct or isn't ours
+
+    """
+    expected = _wav_header(0)
+    with path.open("rb") as f:
+        header = f.read(WAV_HEADER.size)
+    if header != expected:
+        return False  # Finished, or not written by `WavFileWriter`
+    data_size = path.stat().st_size - WAV_HEADER.size
+    data_size -= data_size % 2  # Drop a sample cut in half by the crash
+    if not data_size:
+        return False
+    with path.open("r+b") as f:
+        f.write(_wav_header(data_size))
+        f.truncate(WAV_HEADER.size + data_size)
+    return True
+
+
+def map_wav_data(path: Path) -> memoryview:
+    """Memory-map the samples of a 16 kHz 16-bit mono PCM WAV file.
+
+    The samples are read lazily from the page cache as the view is consumed, so
+    long recordings can be streamed without loading them into memory; slices of
+    the view don't copy. The mapping stays open as long as a view of it exists.
+
+    Raises:
+        wave.Error: If the file isn't a WAV file in that format
+
+    """
+    with path.open("rb") as f:
+        if path.stat().st_size < WAV_HEADER.size:
+            msg = f"{path} is too short to be a WAV file"
+            raise wave.Error(msg)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, "madvise"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    view = memoryview(mapped)
+    if view[:4] != b"RIFF" or view[8:12] != b"WAVE":
+        msg = f"{path} is not a WAV file"
+        raise wave.Error(msg)
+    audio_format = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = view[offset : offset + 4].tobytes()
+        (size,) = struct.unpack_from("<I", view, offset + 4)
+        start = offset + 8
+        if chunk_id == b"fmt ":
+            audio_format = struct.unpack_from("<HHIIHH", view, start)
+        elif chunk_id == b"data":
+            if audio_format is None or (
+                audio_format[0],  # PCM
+                audio_format[1],
+                audio_format[2],
+                audio_format[5],
+            ) != (1, constants.PYAUDIO_CHANNELS, constants.PYAUDIO_RATE, 16):
+                msg = f"{path} is not 16 kHz 16-bit mono PCM"
+                raise wave.Error(msg)
+            end = min(start + size, len(view))
+            return view[start : end - (end - start) % 2]
+        offset = start + size + size % 2  # Chunks are padded to an even size
+    msg = f"{path} has no data chunk"
+    raise wave.Error(msg)
+
+
+class TeeQueue(asyncio.Queue[bytes | None]):
+    """A bounded consumer queue of an `_AudioTee` with a per-consumer overflow policy.
+
+    When the queue is full, the policy decides what happens to a new chunk:
+
+    - ``"block"``: the tee waits for the consumer (lossless, applies backpressure).
+    - ``"drop_oldest"``: the oldest queued chunk is discarded (bounded latency).
+    - ``"coalesce"``: the chunk is appended to the newest queued chunk, so the consumer
+      receives fewer, larger chunks (lossless, never blocks the tee).
+
+    The end-of-stream ``None`` sentinel is always accepted, even when the queue is full.
+    """
+
+    def __init__(self, maxsize: int = TEE_QUEUE_MAXSIZE, policy: OverflowPolicy = "block") -> None:
+        """Initialize the queue."""
+        super().__init__(maxsize)
+        self.policy = policy
+        self.overflows = 0
+        self._closed = False
+        self._space = asyncio.Event()
+
+    def _get(self) -> bytes | None:
+        item = super()._get()
+        self._space.set()
+        return item
+
+    def full(self) -> bool:
+        """Return True if a new chunk would trigger the overflow policy."""
+        return not self._closed and super().full()
+
+    def offer(self, chunk: bytes) -> bool:
+        """Enqueue a chunk without waiting.
+
+        Returns False only for the ``"block"`` policy when the queue is full, in which
+        case the caller should await `put_when_space`.
+        """
+        if self._closed:
+            return True
+        if not self.full():
+            self.put_nowait(chunk)
+            return True
+        if self.policy == "block":
+            return False
+        self.overflows += 1
+        if self.policy == "drop_oldest":
+            self.get_nowait()
+            self.put_nowait(chunk)
+        else:
+            # Merge into a bytearray, so coalescing doesn't copy the backlog every time
+            last = self._queue[-1]
+            if not isinstance(last, bytearray):
+                last = self._queue[-1] = bytearray(last)
+            last += chunk
+        return True
+
+    async def put_when_space(self, chunk: bytes) -> None:
+        """Wait until the consumer makes room (or the queue is closed), then enqueue."""
+        self.overflows += 1
+        while self.full():
+            self._space.clear()
+            await self._space.wait()
+        if not self._closed:
+            self.put_nowait(chunk)
+
+    def close(self) -> None:
+        """Signal the end of the stream to the consumer and release a waiting producer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._space.set()
+        self.put_nowait(None)
+
 
 class _AudioTee:
-    """A thread-safe class to tee a continuous PyAudio stream into multiple asyncio queues.
+    """Tee a continuous PyAudio stream into multiple asyncio queues.
 
     This class reads from a single audio stream in a background task and forwards
     the audio chunks to any number of dynamically added consumer queues. It is designed
     to be started once and run for the lifetime of the stream.
+
+    Every consumer gets its own bounded `TeeQueue` with an overflow policy, so a slow
+    consumer (e.g., a wake word client stuck on a TCP write) can only stall the tee if
+    it explicitly asked for ``"block"``. The consumer list is replaced, never mutated,
+    so fan-out iterates over a snapshot and never holds a lock across an await.
+
+    With ``preroll_seconds`` the tee also keeps a rolling window of the most recent
+    audio, which `add_queue` can replay into a new consumer so that it starts slightly
+    in the past (e.g., to catch words spoken while a wake word was being detected).
     """
 
     def __init__(
@@ -37,53 +419,89 @@ class _AudioTee:
         stream: pyaudio.Stream,
         stop_event: InteractiveStopEvent,
         logger: logging.Logger,
+        *,
+        preroll_seconds: float = 0.0,
+        num_frames: int = constants.PYAUDIO_CHUNK_SIZE,
     ) -> None:
         """Initialize the AudioTee."""
         self.stream = stream
         self.stop_event = stop_event
         self.logger = logger
-        self.queues: list[asyncio.Queue[bytes | None]] = []
+        self.num_frames = num_frames
+        self.queues: tuple[TeeQueue, ...] = ()
         self._task: asyncio.Task | None = None
         self._stop_tee_event = asyncio.Event()
-        self._lock = asyncio.Lock()  # For thread-safe modification of the queues list
+        self._preroll: collections.deque[bytes] = collections.deque()
+        self._preroll_bytes = 0
+        self._preroll_max_bytes = int(
+            preroll_seconds * constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2,
+        )
 
-    async def add_queue(self) -> asyncio.Queue[bytes | None]:
-        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
-        async with self._lock:
-            self.queues.append(queue)
-        self.logger.debug("Added a queue to the tee. Total queues: %d", len(self.queues))
+    async def add_queue(
+        self,
+        *,
+        maxsize: int = TEE_QUEUE_MAXSIZE,
+        policy: OverflowPolicy = "block",
+        preroll: bool = False,
+    ) -> TeeQueue:
+        queue = TeeQueue(maxsize, policy)
+        if preroll:
+            for chunk in self._preroll:
+                queue.offer(chunk)
+        self.queues = (*self.queues, queue)
+        self.logger.debug(
+            "Added a %r queue to the tee (%d pre-roll byte(s)). Total queues: %d",
+            policy,
+            self._preroll_bytes if preroll else 0,
+            len(self.queues),
+        )
         return queue
 
-    async def remove_queue(self, queue: asyncio.Queue[bytes | None]) -> None:
-        async with self._lock:
-            if queue in self.queues:
-                self.queues.remove(queue)
+    def _remember(self, chunk: bytes) -> None:
+        """Keep the chunk in the pre-roll window, evicting the oldest audio."""
+        self._preroll.append(chunk)
+        self._preroll_bytes += len(chunk)
+        while self._preroll_bytes - len(self._preroll[0]) >= self._preroll_max_bytes:
+            self._preroll_bytes -= len(self._preroll.popleft())
+
+    async def remove_queue(self, queue: TeeQueue) -> None:
+        self.discard_queue(queue)
+
+    def discard_queue(self, queue: TeeQueue) -> None:
+        """Remove a consumer queue without waiting, e.g. from a done callback."""
+        self.queues = tuple(q for q in self.queues if q is not queue)
         # Signal the end of the stream for this specific queue consumer
-        await queue.put(None)
-        self.logger.debug("Removed a queue from the tee. Total queues: %d", len(self.queues))
+        queue.close()
+        self.logger.debug(
+            "Removed a %r queue from the tee (%d overflow(s)). Total queues: %d",
+            queue.policy,
+            queue.overflows,
+            len(self.queues),
+        )
 
     async def _run(self) -> None:
         """The main background task that reads from the stream and pushes to all queues."""
         self.logger.debug("Starting continuous audio reading task.")
         try:
-            while not self.stop_event.is_set() and not self._stop_tee_event.is_set():
-                chunk = await asyncio.to_thread(
-                    self.stream.read,
-                    num_frames=constants.PYAUDIO_CHUNK_SIZE,
-                    exception_on_overflow=False,
-                )
-                # Lock the queue list while iterating to prevent modification during iteration
-                async with self._lock:
+            async with capture_audio_stream(
+                self.stream,
+                self.logger,
+                num_frames=self.num_frames,
+            ) as capture:
+                while not self.stop_event.is_set() and not self._stop_tee_event.is_set():
+                    chunk = await capture.read()
+                    if self._preroll_max_bytes:
+                        self._remember(chunk)
                     for queue in self.queues:
-                        await queue.put(chunk)
+                        if not queue.offer(chunk):
+                            await queue.put_when_space(chunk)
         except OSError:
             self.logger.exception("Error reading audio stream")
         finally:
             # Signal the end of the stream to all remaining consumers
             self.logger.debug("Stopping audio reading task and signaling all consumers.")
-            async with self._lock:
-                for queue in self.queues:
-                    await queue.put(None)
+            for queue in self.queues:
+                queue.close()
 
     def start(self) -> None:
         """Start the background reading task."""
@@ -103,9 +521,28 @@ async def tee_audio_stream(
     stream: pyaudio.Stream,
     stop_event: InteractiveStopEvent,
     logger: logging.Logger,
+    *,
+    preroll_seconds: float = 0.0,
+    num_frames: int = constants.PYAUDIO_CHUNK_SIZE,
 ) -> AsyncGenerator[_AudioTee, None]:
-    """Context manager for an AudioTee."""
-    tee = _AudioTee(stream, stop_event, logger)
+    """Context manager for an AudioTee.
+
+    Args:
+        stream: PyAudio input stream to tee
+        stop_event: Event to stop reading
+        logger: Logger instance
+        preroll_seconds: Seconds of recent audio to keep for queues added with
+            ``preroll=True``
+        num_frames: Frames per read, matching the stream's ``frames_per_buffer``
+
+    """
+    tee = _AudioTee(
+        stream,
+        stop_event,
+        logger,
+        preroll_seconds=preroll_seconds,
+        num_frames=num_frames,
+    )
     tee.start()
     try:
         yield tee
@@ -113,12 +550,196 @@ async def tee_audio_stream(
         await tee.stop()
 
 
+class VoiceActivityDetector:
+    """Energy and zero-crossing-rate voice activity detector.
+
+    Audio is split into short frames and, vectorized with NumPy, each frame is
+    classified as speech when it is loud enough and its zero-crossing rate is below
+    that of broadband noise. A speech onset needs ``min_speech_frames`` consecutive
+    speech frames, and each speech frame keeps the detector in the speech state for
+    ``hangover_frames`` more frames to bridge short gaps between words.
+
+    `process` returns True once speech has been heard and is followed by
+    ``silence_seconds`` of silence, i.e., at the end of the utterance.
+    """
+
+    def __init__(
+        self,
+        *,
+        silence_seconds: float = 1.5,
+        threshold_db: float = -40.0,
+        max_zero_crossing_rate: float = 0.35,
+        frame_ms: float = 20.0,
+        min_speech_frames: int = 3,
+        hangover_frames: int = 10,
+    ) -> None:
+        """Initialize the detector."""
+        self.frame_length = int(constants.PYAUDIO_RATE * frame_ms / 1000)
+        self.threshold = 32768.0 * 10 ** (threshold_db / 20)
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.min_speech_frames = min_speech_frames
+        self.hangover_frames = hangover_frames
+        self.silence_frames = max(1, round(silence_seconds * 1000 / frame_ms))
+        self.speech_detected = False
+        self._pending = np.empty(0, dtype=np.int16)
+        self._speech_run = 0
+        self._hangover = 0
+        self._silence_run = 0
+
+    def speech_frames(self, samples: np.ndarray) -> np.ndarray:
+        """Classify complete frames of 16-bit mono samples as speech (True) or not."""
+        n_frames = len(samples) // self.frame_length
+        frames = samples[: n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+        frames = frames.astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        signs = np.signbit(frames)
+        zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+        return (rms > self.threshold) & (zcr < self.max_zero_crossing_rate)
+
+    def process(self, chunk: bytes) -> bool:
+        """Feed a chunk of audio and return True at the end of an utterance."""
+        samples = np.concatenate((self._pending, np.frombuffer(chunk, dtype=np.int16)))
+        usable = len(samples) - len(samples) % self.frame_length
+        self._pending = samples[usable:]
+        for is_speech in self.speech_frames(samples[:usable]):
+            if is_speech:
+                self._speech_run += 1
+                if self._speech_run >= self.min_speech_frames:
+                    self.speech_detected = True
+                    self._hangover = self.hangover_frames
+            else:
+                self._speech_run = 0
+                if self._hangover:
+                    self._hangover -= 1
+            in_speech = self._speech_run >= self.min_speech_frames or self._hangover > 0
+            self._silence_run = 0 if in_speech else self._silence_run + 1
+        return self.speech_detected and self._silence_run >= self.silence_frames
+
+
+def _frame_rms(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """Return the RMS level of each complete frame of ``frame_length`` samples."""
+    n_frames = len(samples) // frame_length
+    frames = samples[: n_frames * frame_length].reshape(n_frames, frame_length)
+    frames = frames.astype(np.float32)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def compact_silence(
+    audio_data: bytes | memoryview,
+    *,
+    threshold_db: float = -45.0,
+    max_pause_seconds: float = 0.75,
+    padding_seconds: float = 0.2,
+    frame_ms: float = 20.0,
+) -> bytes | memoryview:
+    """Trim leading/trailing silence and shorten long pauses in 16-bit mono PCM.
+
+    Frames quieter than ``threshold_db`` are silence. Speech keeps ``padding_seconds``
+    of context on each side, and pauses between speech longer than
+    ``max_pause_seconds`` are cut down to that length. The input is returned as-is
+    if nothing would be removed or if no speech is found at all.
+    """
+    frame_length = int(constants.PYAUDIO_RATE * frame_ms / 1000)
+    samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+    rms = _frame_rms(samples, frame_length)
+    if len(rms) == 0:
+        return audio_data
+    loud = rms > 32768.0 * 10 ** (threshold_db / 20)
+    if not loud.any():
+        return audio_data
+
+    padding = round(padding_seconds * 1000 / frame_ms)
+    # Slice the full convolution: mode="same" is longer than ``loud`` for short audio
+    keep = np.convolve(loud, np.ones(2 * padding + 1))[padding : padding + len(loud)] > 0
+    loud_idx = np.flatnonzero(loud)
+    keep[loud_idx[0] : loud_idx[-1] + 1] = True
+
+    # Shorten pauses between speech that are longer than allowed
+    max_pause = round(max_pause_seconds * 1000 / frame_ms)
+    gaps = np.diff(loud_idx) - 1
+    long_gaps = np.flatnonzero(gaps > max_pause)
+    head = max_pause // 2
+    for start, length in zip(loud_idx[long_gaps] + 1, gaps[long_gaps], strict=True):
+        keep[start + head : start + length - (max_pause - head)] = False
+
+    if keep.all():
+        return audio_data
+    mask = np.repeat(keep, frame_length)
+    # The incomplete last frame follows the decision for the last complete one
+    mask = np.concatenate((mask, np.full(len(samples) - len(mask), keep[-1])))
+    return samples[mask].tobytes()
+
+
+def split_on_silence(
+    audio_data: bytes | memoryview,
+    *,
+    segment_seconds: float = 30.0,
+    overlap_seconds: float = 0.5,
+    search_seconds: float = 5.0,
+    frame_ms: float = 20.0,
+) -> list[memoryview]:
+    """Split 16-bit mono PCM into segments of at most about ``segment_seconds``.
+
+    Each cut is placed at the quietest point in the last ``search_seconds`` before
+    the target length, so it usually falls in a pause. Neighbouring segments share
+    ``overlap_seconds`` of audio on each side of a cut so that a word at the
+    boundary is not lost; the segments are zero-copy views of ``audio_data``.
+    """
+    view = memoryview(audio_data).cast("B")
+    frame_length = int(constants.PYAUDIO_RATE * frame_ms / 1000)
+    frame_bytes = frame_length * 2
+    samples = np.frombuffer(view, dtype=np.int16, count=len(view) // 2)
+    rms = _frame_rms(samples, frame_length)
+    segment_frames = max(1, round(segment_seconds * 1000 / frame_ms))
+    if len(rms) <= segment_frames:
+        return [view]
+
+    # Prefer cuts whose overlap on both sides is quiet too. The level is averaged
+    # over the frames that exist, so the ends of the audio don't look quieter
+    overlap_frames = round(overlap_seconds * 1000 / frame_ms)
+    kernel = np.ones(2 * overlap_frames + 1)
+    window = slice(overlap_frames, overlap_frames + len(rms))
+    level = np.convolve(rms, kernel)[window] / np.convolve(np.ones(len(rms)), kernel)[window]
+    # Search at most the second half of each segment, so every segment is a real one
+    search = min(round(search_seconds * 1000 / frame_ms), segment_frames // 2)
+    cuts = [0]
+    while len(rms) - cuts[-1] > segment_frames:
+        target = cuts[-1] + segment_frames
+        low = target - search
+        cuts.append(low + int(np.argmin(level[low : target + 1])))
+
+    overlap = overlap_frames * frame_bytes
+    bounds = [cut * frame_bytes for cut in cuts] + [len(view)]
+    return [
+        view[max(0, start - overlap) : min(len(view), end + overlap)]
+        for start, end in itertools.pairwise(bounds)
+    ]
+
+
+def create_vad(audio_input_cfg: config.AudioInput) -> VoiceActivityDetector | None:
+    """Return a voice activity detector if enabled in the audio input config."""
+    if not audio_input_cfg.vad:
+        return None
+    return VoiceActivityDetector(silence_seconds=audio_input_cfg.vad_silence_seconds)
+
+
 async def read_from_queue(
     queue: asyncio.Queue[bytes | None],
     chunk_handler: Callable[[bytes], None] | Callable[[bytes], Awaitable[None]],
     logger: logging.Logger,
+    *,
+    vad: VoiceActivityDetector | None = None,
+    stop_event: asyncio.Event | InteractiveStopEvent | None = None,
+    vad_skip_chunks: int = 0,
 ) -> None:
-    """Read audio chunks from a queue and call a handler."""
+    """Read audio chunks from a queue and call a handler.
+
+    If a voice activity detector is given, reading stops (and ``stop_event`` is set)
+    at the end of the utterance. The first ``vad_skip_chunks`` chunks (e.g., a
+    replayed pre-roll with the wake word in it) are not fed to the detector, so
+    only speech after them can start an utterance.
+    """
+    n_chunks = 0
     while True:
         chunk = await queue.get()
         if chunk is None:
@@ -128,6 +749,12 @@ async def read_from_queue(
         else:
             chunk_handler(chunk)
         logger.debug("Processed %d byte(s) of audio from queue", len(chunk))
+        n_chunks += 1
+        if vad and n_chunks > vad_skip_chunks and vad.process(chunk):
+            logger.info("End of speech detected")
+            if stop_event is not None:
+                stop_event.set()
+            break
 
 
 @contextmanager
@@ -137,9 +764,57 @@ def pyaudio_context() -> Generator[pyaudio.PyAudio, None, None]:
     try:
         yield p
     finally:
+        manager = _output_stream_managers.pop(p, None)
+        if manager is not None:
+            manager.close()
         p.terminate()
 
 
+class OutputStreamManager:
+    """Keeps one warm output stream open on a PyAudio instance across playbacks.
+
+    The stream is only reopened when its parameters (device, sample rate, width,
+    channel count or buffer size) change, so consecutive responses skip the
+    open/close cost and the device wake-up delay. `pyaudio_context` closes it.
+    """
+
+    def __init__(self, p: pyaudio.PyAudio) -> None:
+        """Initialize the manager without opening a stream."""
+        self.p = p
+        self._stream: pyaudio.Stream | None = None
+        self._stream_kwargs: dict | None = None
+
+    def get(self, **stream_kwargs: object) -> pyaudio.Stream:
+        """Return an open output stream with the given `setup_output_stream` parameters."""
+        if self._stream is not None and stream_kwargs == self._stream_kwargs:
+            return self._stream
+        self.close()
+        self._stream = self.p.open(**stream_kwargs)
+        self._stream_kwargs = stream_kwargs
+        return self._stream
+
+    def close(self) -> None:
+        """Close the stream, if open (e.g., after a playback error)."""
+        stream, self._stream, self._stream_kwargs = self._stream, None, None
+        if stream is not None:
+            with suppress(OSError):
+                stream.stop_stream()
+                stream.close()
+
+
+_output_stream_managers: weakref.WeakKeyDictionary[pyaudio.PyAudio, OutputStreamManager] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def output_stream_manager(p: pyaudio.PyAudio) -> OutputStreamManager:
+    """Return the output stream manager of a PyAudio instance."""
+    manager = _output_stream_managers.get(p)
+    if manager is None:
+        manager = _output_stream_managers[p] = OutputStreamManager(p)
+    return manager
+
+
 @contextmanager
 def open_pyaudio_stream(
     p: pyaudio.PyAudio,
@@ -165,6 +840,8 @@ async def read_audio_stream(
     quiet: bool = False,
     progress_message: str = "Processing audio",
     progress_style: str = "blue",
+    vad: VoiceActivityDetector | None = None,
+    num_frames: int = constants.PYAUDIO_CHUNK_SIZE,
 ) -> None:
     """Core audio reading function - reads chunks and calls handler.
 
@@ -180,40 +857,42 @@ async def read_audio_stream(
         quiet: If True, suppress console output
         progress_message: Message to display
         progress_style: Rich style for progress
+        vad: Voice activity detector that sets ``stop_event`` at the end of speech
+        num_frames: Frames per read, matching the stream's ``frames_per_buffer``
 
     """
+    renderer = render_scheduler(live, quiet=quiet)
     try:
-        seconds_streamed = 0.0
-        while not stop_event.is_set():
-            chunk = await asyncio.to_thread(
-                stream.read,
-                num_frames=constants.PYAUDIO_CHUNK_SIZE,
-                exception_on_overflow=False,
-            )
-
-            # Handle chunk (sync or async)
-            if asyncio.iscoroutinefunction(chunk_handler):
-                await chunk_handler(chunk)
-            else:
-                chunk_handler(chunk)
-
-            logger.debug("Processed %d byte(s) of audio", len(chunk))
-
-            # Update progress display
-            seconds_streamed += len(chunk) / (
-                constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2
-            )
-            if live and not quiet:
-                if stop_event.ctrl_c_pressed:
-                    msg = f"Ctrl+C pressed. Stopping {progress_message.lower()}..."
-                    live.update(Text(msg, style="yellow"))
+        async with capture_audio_stream(stream, logger, num_frames=num_frames) as capture:
+            seconds_streamed = 0.0
+            while not stop_event.is_set():
+                chunk = await capture.read()
+
+                # Handle chunk (sync or async)
+                if asyncio.iscoroutinefunction(chunk_handler):
+                    await chunk_handler(chunk)
                 else:
-                    live.update(
-                        Text(
+                    chunk_handler(chunk)
+
+                logger.debug("Processed %d byte(s) of audio", len(chunk))
+
+                if vad and vad.process(chunk):
+                    logger.info("End of speech detected")
+                    stop_event.set()
+
+                # Update progress display
+                seconds_streamed += len(chunk) / (
+                    constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2
+                )
+                if renderer.enabled:
+                    if stop_event.ctrl_c_pressed:
+                        msg = f"Ctrl+C pressed. Stopping {progress_message.lower()}..."
+                        renderer.update(msg, style="yellow")
+                    else:
+                        renderer.update(
                             f"{progress_message}... ({seconds_streamed:.1f}s)",
                             style=progress_style,
-                        ),
-                    )
+                        )
 
     except OSError:
         logger.exception("Error reading audio")
@@ -221,11 +900,14 @@ async def read_audio_stream(
 
 def setup_input_stream(
     input_device_index: int | None,
+    *,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
 ) -> dict:
     """Get standard PyAudio input stream configuration.
 
     Args:
         input_device_index: Input device index
+        chunk_size: Frames per buffer, see `constants.LATENCY_PROFILES`
 
     Returns:
         Dictionary of stream parameters
@@ -236,7 +918,7 @@ def setup_input_stream(
         "channels": constants.PYAUDIO_CHANNELS,
         "rate": constants.PYAUDIO_RATE,
         "input": True,
-        "frames_per_buffer": constants.PYAUDIO_CHUNK_SIZE,
+        "frames_per_buffer": chunk_size,
         "input_device_index": input_device_index,
     }
 
@@ -247,6 +929,7 @@ def setup_output_stream(
     sample_rate: int | None = None,
     sample_width: int | None = None,
     channels: int | None = None,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
 ) -> dict:
     """Get standard PyAudio output stream configuration.
 
@@ -256,6 +939,7 @@ def setup_output_stream(
         sample_rate: Custom sample rate (defaults to config)
         sample_width: Custom sample width in bytes (defaults to config)
         channels: Custom channel count (defaults to config)
+        chunk_size: Frames per buffer, see `constants.LATENCY_PROFILES`
 
     Returns:
         Dictionary of stream parameters
@@ -266,11 +950,15 @@ def setup_output_stream(
         "channels": channels or constants.PYAUDIO_CHANNELS,
         "rate": sample_rate or constants.PYAUDIO_RATE,
         "output": True,
-        "frames_per_buffer": constants.PYAUDIO_CHUNK_SIZE,
+        "frames_per_buffer": chunk_size,
         "output_device_index": output_device_index,
     }
 
 
+# Persisted device map, so resolving a device name can skip enumerating all devices
+DEVICE_CACHE_FILE = Path.home() / ".cache" / "agent-cli" / "audio_devices.json"
+
+
 @functools.cache
 def _get_all_devices(p: pyaudio.PyAudio) -> list[dict]:
     """Get information for all audio devices with caching.
@@ -313,6 +1001,62 @@ def _get_device_by_index(p: pyaudio.PyAudio, input_device_index: int) -> dict:
     raise ValueError(msg)
 
 
+def _device_key(device: dict) -> str:
+    """Identify a device by its host API and name, which survive index changes."""
+    return f"{device.get('hostApi', 0)}:{device.get('name')}"
+
+
+def _load_device_cache(p: pyaudio.PyAudio) -> list[dict] | None:
+    """Load the persisted device map, unless the number of devices has changed."""
+    try:
+        cache = json.loads(DEVICE_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if cache.get("device_count") != p.get_device_count():
+        return None
+    return [{"key": key, **device} for key, device in cache.get("devices", {}).items()]
+
+
+def _save_device_cache(p: pyaudio.PyAudio, devices: list[dict]) -> None:
+    """Persist the device map keyed by host API and name (best effort)."""
+    cache = {
+        "device_count": p.get_device_count(),
+        "devices": {
+            _device_key(device): {
+                "index": device["index"],
+                "name": device.get("name"),
+                "maxInputChannels": device.get("maxInputChannels", 0),
+                "maxOutputChannels": device.get("maxOutputChannels", 0),
+            }
+            for device in devices
+        },
+    }
+    with suppress(OSError):
+        DEVICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = DEVICE_CACHE_FILE.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(cache))
+        tmp_file.replace(DEVICE_CACHE_FILE)
+
+
+def _is_cached_device_valid(p: pyaudio.PyAudio, device: dict) -> bool:
+    """Check with a single device query that a cached index still points to the device."""
+    try:
+        info = p.get_device_info_by_index(device["index"])
+    except (OSError, ValueError):
+        return False
+    return _device_key(info) == device["key"]
+
+
+def _match_device(devices: list[dict], search_terms: list[str], key: str) -> dict | None:
+    """Return the first device matching the highest-priority search term."""
+    candidates = [d for d in devices if d.get("name") and d.get(key, 0) > 0]
+    for term in search_terms:
+        for device in candidates:
+            if term in device["name"].lower():
+                return device
+    return None
+
+
 def _list_input_devices(p: pyaudio.PyAudio) -> None:
     """Print a numbered list of available input devices."""
     console.print("[bold]Available input devices:[/bold]")
@@ -357,16 +1101,18 @@ def _in_or_out_device(
         msg = "Device name string is empty or contains only whitespace."
         raise ValueError(msg)
 
-    devices = []
-    for device in _get_all_devices(p):
-        device_info_name = device.get("name")
-        if device_info_name and device.get(key, 0) > 0:
-            devices.append((device["index"], device_info_name))
-
-    for term in search_terms:
-        for index, name in devices:
-            if term in name.lower():
-                return index, name
+    # Common path: resolve the name from the persisted map and verify only that device
+    cached_devices = _load_device_cache(p)
+    if cached_devices is not None:
+        device = _match_device(cached_devices, search_terms, key)
+        if device is not None and _is_cached_device_valid(p, device):
+            return device["index"], device["name"]
+
+    devices = _get_all_devices(p)
+    _save_device_cache(p, devices)
+    device = _match_device(devices, search_terms, key)
+    if device is not None:
+        return device["index"], device["name"]
 
     msg = f"No {what} device found matching any of the keywords in {input_device_name!r}"
     raise ValueError(msg)
@@ -1,18 +1,32 @@
-"""Audio format conversion utilities using FFmpeg."""
+"""Audio format conversion utilities using FFmpeg (or `soundfile`, if installed)."""
 
 from __future__ import annotations
 
+import importlib.util
+import io
 import logging
 import shutil
 import subprocess
 import tempfile
+import wave
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from agent_cli import constants
 
+if TYPE_CHECKING:
+    from agent_cli.config import RecordingFormat
+
 logger = logging.getLogger(__name__)
 
-VALID_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".aac", ".webm")
+VALID_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".aac", ".webm", ".opus")
+
+RECORDING_EXTENSIONS: dict[RecordingFormat, str] = {"wav": ".wav", "flac": ".flac", "opus": ".opus"}
+OPUS_BITRATE = "24k"
+
+has_soundfile = importlib.util.find_spec("soundfile") is not None
 
 
 def convert_audio_to_wyoming_format(
@@ -121,3 +135,100 @@ def check_ffmpeg_available() -> bool:
 
     """
     return shutil.which("ffmpeg") is not None
+
+
+def encode_pcm(audio_data: bytes | memoryview, recording_format: RecordingFormat) -> bytes:
+    """Encode 16 kHz 16-bit mono PCM as a WAV, FLAC (lossless) or Opus (lossy) file.
+
+    FLAC and Opus use `soundfile` if it is installed and FFmpeg otherwise.
+
+    Raises:
+        RuntimeError: If neither `soundfile` nor FFmpeg can encode the format
+
+    """
+    audio_data = memoryview(audio_data)[: len(audio_data) - len(audio_data) % 2]
+    out = io.BytesIO()
+    if recording_format == "wav":
+        with wave.open(out, "wb") as wav_file:
+            wav_file.setnchannels(constants.PYAUDIO_CHANNELS)
+            wav_file.setsampwidth(2)  # 16-bit audio
+            wav_file.setframerate(constants.PYAUDIO_RATE)
+            wav_file.writeframes(audio_data)
+        return out.getvalue()
+
+    if has_soundfile:
+        import soundfile  # noqa: PLC0415
+
+        fmt, subtype = ("FLAC", "PCM_16") if recording_format == "flac" else ("OGG", "OPUS")
+        if soundfile.check_format(fmt, subtype):
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            soundfile.write(out, samples, constants.PYAUDIO_RATE, format=fmt, subtype=subtype)
+            return out.getvalue()
+
+    codec = (
+        ["-f", "flac"]
+        if recording_format == "flac"
+        else ["-c:a", "libopus", "-b:a", OPUS_BITRATE, "-f", "ogg"]
+    )
+    return _run_ffmpeg([*_PCM_INPUT_ARGS, "-i", "pipe:0", *codec, "pipe:1"], bytes(audio_data))
+
+
+def decode_audio_file(path: Path | str) -> bytes:
+    """Read an audio file as 16 kHz 16-bit mono PCM.
+
+    WAV files in that format are read directly, FLAC/Opus through `soundfile` if
+    it is installed, and anything else (or any other sample rate) through FFmpeg.
+
+    Raises:
+        RuntimeError: If the file can't be decoded
+
+    """
+    path = Path(path)
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            if (
+                wav_file.getframerate() == constants.PYAUDIO_RATE
+                and wav_file.getsampwidth() == 2  # noqa: PLR2004
+                and wav_file.getnchannels() == constants.PYAUDIO_CHANNELS
+            ):
+                return wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError):
+        pass  # Not a plain PCM WAV file
+
+    if has_soundfile and path.suffix.lower() in (".flac", ".ogg", ".opus"):
+        import soundfile  # noqa: PLC0415
+
+        info = soundfile.info(str(path))
+        if (
+            info.samplerate == constants.PYAUDIO_RATE
+            and info.channels == constants.PYAUDIO_CHANNELS
+        ):
+            samples, _ = soundfile.read(str(path), dtype="int16")
+            return samples.tobytes()
+
+    return convert_audio_to_wyoming_format(path.read_bytes(), path.name)
+
+
+_PCM_INPUT_ARGS = [
+    "-f",
+    "s16le",
+    "-ar",
+    str(constants.PYAUDIO_RATE),
+    "-ac",
+    str(constants.PYAUDIO_CHANNELS),
+]
+
+
+def _run_ffmpeg(args: list[str], input_data: bytes) -> bytes:
+    """Run FFmpeg with ``input_data`` on stdin and return its stdout."""
+    if not shutil.which("ffmpeg"):
+        msg = "FFmpeg not found in PATH. Install FFmpeg or soundfile to use compressed audio."
+        raise RuntimeError(msg)
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *args]
+    logger.debug("Running FFmpeg command: %s", " ".join(cmd))
+    result = subprocess.run(cmd, input=input_data, capture_output=True, check=False)
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace")
+        msg = f"FFmpeg failed: {stderr}"
+        raise RuntimeError(msg)
+    return result.stdout
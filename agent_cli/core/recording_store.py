@@ -0,0 +1,219 @@
+"""SQLite index of saved recordings with a retention policy."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+from agent_cli import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+INDEX_FILENAME = "recordings.sqlite3"
+RECORDING_GLOB = "recording_*"
+RECORDING_SUFFIXES = (".wav", ".flac", ".opus")
+WAV_HEADER_BYTES = 44
+IN_PROGRESS_SUFFIX = ".pid"
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    name TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    duration REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class RecordingStore:
+    """Index of the ``recording_*`` files (WAV, FLAC or Opus) in a directory.
+
+    Recordings are ordered by name, which starts with their timestamp, so the
+    n-th most recent one is a single indexed lookup instead of a directory scan.
+    Recordings that already exist when the index is created are imported once.
+    Recordings that a running process is still writing (see `mark_in_progress`)
+    are skipped by lookups and retention.
+
+    Retention is opt-in (``0`` disables a limit, the default) and keeps at most ``max_recordings`` files,
+    none older than ``max_age_days``, and at most ``max_size_mb`` in total; the
+    oldest recordings are deleted first, in a background thread after each save.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_recordings: int = 0,
+        max_age_days: float = 0,
+        max_size_mb: float = 0,
+    ) -> None:
+        """Initialize the store."""
+        self.directory = directory
+        self.max_recordings = max_recordings
+        self.max_age_days = max_age_days
+        self.max_size_mb = max_size_mb
+        self.index_file = directory / INDEX_FILENAME
+        self._evict_lock = threading.Lock()
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        is_new = not self.index_file.exists()
+        conn = sqlite3.connect(self.index_file, timeout=5.0)
+        if is_new:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(_SCHEMA)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO recordings VALUES (?, ?, ?, ?)",
+                    self._scan(),
+                )
+        return closing(conn)
+
+    def _scan(self) -> Iterator[tuple[str, float, float, int]]:
+        """Describe the recordings already on disk, using only their size and mtime."""
+        for path in self.directory.glob(RECORDING_GLOB):
+            if path.suffix not in RECORDING_SUFFIXES:
+                continue
+            stat = path.stat()
+            duration = _duration(stat.st_size) if path.suffix == ".wav" else 0.0
+            yield path.name, stat.st_mtime, duration, stat.st_size
+
+    def add(self, path: Path, *, duration: float, background: bool = True) -> None:
+        """Index a saved recording and apply the retention policy."""
+        try:
+            with self._connect() as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?)",
+                    (path.name, time.time(), duration, path.stat().st_size),
+                )
+        except (OSError, sqlite3.Error):
+            LOGGER.exception("Failed to index recording %s", path)
+            return
+        if background:
+            threading.Thread(target=self.evict, name="recording-eviction", daemon=True).start()
+        else:
+            self.evict()
+
+    def remove(self, path: Path) -> None:
+        """Forget a recording that was deleted or replaced."""
+        try:
+            with self._connect() as conn, conn:
+                conn.execute("DELETE FROM recordings WHERE name = ?", (path.name,))
+        except sqlite3.Error:
+            LOGGER.exception("Failed to update the recording index")
+
+    def last(self, index: int = 1) -> Path | None:
+        """Return the ``index``-th most recent recording (1 = most recent), if any."""
+        if index < 1:
+            return None
+        try:
+            with self._connect() as conn:
+                offset = index - 1
+                while True:
+                    row = conn.execute(
+                        "SELECT name FROM recordings ORDER BY name DESC LIMIT 1 OFFSET ?",
+                        (offset,),
+                    ).fetchone()
+                    if row is None:
+                        return None
+                    path = self.directory / row[0]
+                    if is_in_progress(path):
+                        offset += 1
+                    elif path.exists():
+                        return path
+                    else:
+                        # Deleted behind our back; forget it and look again
+                        with conn:
+                            conn.execute("DELETE FROM recordings WHERE name = ?", row)
+        except sqlite3.Error:
+            LOGGER.exception("Failed to read the recording index")
+            return None
+
+    def evict(self) -> None:
+        """Delete the recordings that fall outside the retention policy."""
+        if not self._evict_lock.acquire(blocking=False):
+            return  # Another eviction is already running
+        try:
+            with self._connect() as conn:
+                rows = [
+                    row
+                    for row in conn.execute(
+                        "SELECT name, created, size FROM recordings ORDER BY name DESC",
+                    )
+                    if not is_in_progress(self.directory / row[0])
+                ]
+                expired = [name for name, _, _ in rows[self.max_recordings or len(rows) :]]
+                if self.max_age_days:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    expired += [name for name, created, _ in rows if created < cutoff]
+                if self.max_size_mb:
+                    total = 0
+                    for name, _, size in rows:
+                        total += size
+                        if total > self.max_size_mb * 1024 * 1024:
+                            expired.append(name)
+                for name in set(expired):
+                    (self.directory / name).unlink(missing_ok=True)
+                    with conn:
+                        conn.execute("DELETE FROM recordings WHERE name = ?", (name,))
+                if expired:
+                    LOGGER.info("Deleted %d old recording(s)", len(set(expired)))
+        except (OSError, sqlite3.Error):
+            LOGGER.exception("Failed to apply the recording retention policy")
+        finally:
+            self._evict_lock.release()
+
+
+def _in_progress_file(path: Path) -> Path:
+    return path.with_name(path.name + IN_PROGRESS_SUFFIX)
+
+
+def mark_in_progress(path: Path) -> None:
+    """Mark ``path`` as being written by this process, until `mark_finished`."""
+    _in_progress_file(path).write_text(str(os.getpid()))
+
+
+def mark_finished(path: Path) -> None:
+    """Mark ``path`` as no longer being written."""
+    _in_progress_file(path).unlink(missing_ok=True)
+
+
+def is_in_progress(path: Path) -> bool:
+    """Check if a running process is still writing ``path``. Cleans up stale marks.
+
+    A recording whose process crashed counts as finished, so it can be recovered.
+    """
+    pid_file = _in_progress_file(path)
+    try:
+        pid = int(pid_file.read_text().strip())
+        os.kill(pid, 0)
+    except FileNotFoundError:
+        return False
+    except (ValueError, ProcessLookupError, PermissionError):
+        pid_file.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _duration(size: int) -> float:
+    """Estimate a WAV recording's duration in seconds from its file size."""
+    return max(0, size - WAV_HEADER_BYTES) / (constants.PYAUDIO_RATE * 2)
+
+
+_stores: dict[Path, RecordingStore] = {}
+
+
+def get_recording_store(directory: Path) -> RecordingStore:
+    """Return the shared recording store of a directory."""
+    store = _stores.get(directory)
+    if store is None:
+        store = _stores[directory] = RecordingStore(directory)
+    return store
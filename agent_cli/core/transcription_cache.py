@@ -0,0 +1,101 @@
+"""Disk-backed cache of transcription results, keyed by the audio content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import suppress
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "agent-cli" / "transcripts"
+CACHE_MAX_ENTRIES = 1000
+CACHE_TTL_SECONDS = 7 * 24 * 3600.0
+
+LOGGER = logging.getLogger(__name__)
+
+
+def cache_key(audio_data: bytes | memoryview, *identity: str) -> str:
+    """Return the cache key of ``audio_data`` transcribed by the ASR in ``identity``.
+
+    ``identity`` names everything besides the audio that changes the transcript,
+    e.g. the provider and model.
+    """
+    digest = hashlib.sha256()
+    for part in identity:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(audio_data)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """LRU cache of transcripts stored as one small JSON file per entry.
+
+    Entries expire ``ttl`` seconds after they were stored; a file's modification
+    time records its last use, and the least recently used entries are evicted
+    once there are more than ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl: float = CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache."""
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached transcript for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry["created"] > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        with suppress(OSError):
+            os.utime(path)
+        return entry["text"]
+
+    def put(self, key: str, text: str) -> None:
+        """Store a transcript, evicting the least recently used entries if needed."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(key).with_suffix(".tmp")
+            tmp.write_text(json.dumps({"created": time.time(), "text": text}), encoding="utf-8")
+            tmp.replace(self._path(key))
+            self._evict()
+        except OSError:
+            LOGGER.exception("Failed to write transcription cache")
+
+    def _evict(self) -> None:
+        entries = sorted(
+            self.directory.glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in entries[self.max_entries :]:
+            path.unlink(missing_ok=True)
+
+
+# Default cache instance
+_default_cache: TranscriptionCache | None = None
+
+
+def get_default_cache() -> TranscriptionCache:
+    """Get the default transcription cache instance."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TranscriptionCache(CACHE_DIR)
+    return _default_cache
@@ -7,6 +7,7 @@ import logging
 import signal
 import sys
 import time
+import weakref
 from contextlib import (
     AbstractContextManager,
     asynccontextmanager,
@@ -17,7 +18,7 @@ from contextlib import (
 from typing import TYPE_CHECKING
 
 import pyperclip
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.spinner import Spinner
@@ -34,6 +35,9 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Maximum redraws per second of the status line in a Live display
+RENDER_FPS = 4.0
+
 
 class InteractiveStopEvent:
     """A stop event with reset capability for chat agents."""
@@ -239,10 +243,100 @@ def stop_or_status_or_toggle(
 def maybe_live(use_live: bool) -> AbstractContextManager[Live | None]:
     """Create a live context manager if use_live is True."""
     if use_live:
-        return Live(_create_spinner("Initializing", "blue"), console=console, transient=True)
+        return Live(
+            _create_spinner("Initializing", "blue"),
+            console=console,
+            transient=True,
+            refresh_per_second=RENDER_FPS,
+        )
     return nullcontext()
 
 
+class RenderScheduler:
+    """Coalesces status updates for a Rich Live display at a capped frame rate.
+
+    `update` only records the latest message; the renderable is swapped at most ``fps``
+    times per second, and the same `Text` and `Spinner` are reused for every frame
+    (which also keeps the spinner animating). Without a live display, in quiet mode or
+    when the console is not a terminal, the scheduler is disabled and does nothing.
+    """
+
+    def __init__(self, live: Live | None, *, fps: float = RENDER_FPS) -> None:
+        """Initialize the scheduler."""
+        self.live = live
+        live_console = getattr(live, "console", None)
+        self.enabled = live_console is not None and live_console.is_terminal
+        self.interval = 1 / fps
+        self._text = Text()
+        self._spinner = Spinner("dots", text=self._text)
+        self._caption = Text(style="dim")
+        self._pending: tuple[str, str, bool] | None = None
+        self._shown: tuple[str, str, bool] | None = None
+        self._last_draw = -self.interval
+        self._handle: asyncio.TimerHandle | None = None
+
+    def update(self, message: str, *, style: str = "blue", spinner: bool = False) -> None:
+        """Show a status message (with a spinner if requested) at the next frame."""
+        if not self.enabled:
+            return
+        self._pending = (message, style, spinner)
+        if self._handle is not None:
+            return  # A frame is already scheduled and will pick up this message
+        delay = self._last_draw + self.interval - time.monotonic()
+        if delay <= 0:
+            self._draw()
+        else:
+            self._handle = asyncio.get_running_loop().call_later(delay, self._draw)
+
+    def set_caption(self, caption: str) -> None:
+        """Show ``caption`` (e.g. a partial transcript) under the status message."""
+        if not self.enabled:
+            return
+        self._caption.plain = caption
+        if self._pending is None and self._shown is not None:
+            message, style, spinner = self._shown
+            self.update(message, style=style, spinner=spinner)
+
+    def clear(self) -> None:
+        """Drop pending updates and clear the status line immediately."""
+        if not self.enabled:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending = None
+        self._shown = None
+        self._caption.plain = ""
+        self.live.update("")  # type: ignore[union-attr]
+
+    def _draw(self) -> None:
+        self._handle = None
+        if self._pending is None:
+            return
+        message, style, spinner = self._shown = self._pending
+        self._pending = None
+        self._last_draw = time.monotonic()
+        self._text.plain = message
+        self._text.style = style
+        status = self._spinner if spinner else self._text
+        renderable = Group(status, self._caption) if self._caption.plain else status
+        self.live.update(renderable)  # type: ignore[union-attr]
+
+
+_DISABLED_RENDERER = RenderScheduler(None)
+_renderers: weakref.WeakKeyDictionary[Live, RenderScheduler] = weakref.WeakKeyDictionary()
+
+
+def render_scheduler(live: Live | None, *, quiet: bool = False) -> RenderScheduler:
+    """Return the shared render scheduler of a Live display."""
+    if live is None or quiet:
+        return _DISABLED_RENDERER
+    renderer = _renderers.get(live)
+    if renderer is None:
+        renderer = _renderers[live] = RenderScheduler(live)
+    return renderer
+
+
 @asynccontextmanager
 async def live_timer(
     live: Live,
@@ -267,7 +361,8 @@ async def live_timer(
             await some_operation()
 
     """
-    if quiet:
+    renderer = render_scheduler(live, quiet=quiet)
+    if not renderer.enabled:
         yield
         return
 
@@ -281,16 +376,14 @@ async def live_timer(
 
             # Check if Ctrl+C was pressed
             if stop_event and stop_event.ctrl_c_pressed:
-                ctrl_c_text = Text(
+                renderer.update(
                     "Ctrl+C pressed. Processing transcription... (Press Ctrl+C again to force exit)",
                     style="yellow",
                 )
-                live.update(ctrl_c_text)
             else:
-                spinner = _create_spinner(f"{base_message}... ({elapsed:.1f}s)", style)
-                live.update(spinner)
+                renderer.update(f"{base_message}... ({elapsed:.1f}s)", style=style, spinner=True)
 
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(renderer.interval)
 
     timer_task = asyncio.create_task(update_timer())
 
@@ -301,8 +394,7 @@ async def live_timer(
         timer_task.cancel()
         with suppress(asyncio.CancelledError):
             await timer_task
-        if not quiet:
-            live.update("")
+        renderer.clear()
 
 
 def setup_logging(log_level: str, log_file: str | None, *, quiet: bool) -> None:
@@ -345,9 +437,10 @@ async def manage_send_receive_tasks(
         return_when=return_when,
     )
 
-    # Cancel any pending tasks
+    # Cancel any pending tasks and let them clean up before the caller moves on
     for task in pending:
         task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
 
     return send_task, recv_task
 
@@ -94,6 +94,73 @@ INPUT_DEVICE_NAME: str | None = typer.Option(
     help="Device name keywords for partial matching.",
     rich_help_panel="ASR (Audio) Configuration",
 )
+MAX_RECORDING_DURATION: float = typer.Option(
+    3600.0,
+    "--max-recording-duration",
+    help="Maximum recording length in seconds. Longer recordings keep only their most recent audio.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+VAD: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--vad/--no-vad",
+    help="Use local voice-activity detection to stop recording automatically after you stop speaking.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+VAD_SILENCE: float = typer.Option(
+    1.5,
+    "--vad-silence",
+    help="Seconds of trailing silence that end an utterance when --vad is enabled.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+CONTINUOUS: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--continuous/--no-continuous",
+    help="Dictate until stopped: each segment is transcribed (and cleaned up) as soon as a pause"
+    " of --vad-silence seconds ends it, while the next one is being recorded.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+TRIM_SILENCE: bool = typer.Option(
+    False,  # noqa: FBT003
+    "--trim-silence/--no-trim-silence",
+    help="Trim leading/trailing silence and shorten long pauses before sending audio to the ASR."
+    " Off by default, since quiet speech at the edges may be cut.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+TRIM_THRESHOLD: float = typer.Option(
+    -45.0,
+    "--trim-threshold",
+    help="Level in dBFS below which audio counts as silence for --trim-silence.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+TRIM_MAX_PAUSE: float = typer.Option(
+    0.75,
+    "--trim-max-pause",
+    help="Longest pause in seconds kept between speech when --trim-silence is enabled.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+PARALLEL_SEGMENTS: int = typer.Option(
+    1,
+    "--parallel-segments",
+    min=1,
+    help="Split long recordings at pauses and transcribe up to this many segments concurrently."
+    " 1 sends the audio as a single request.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+SEGMENT_SECONDS: float = typer.Option(
+    30.0,
+    "--segment-seconds",
+    min=5.0,
+    help="Target length in seconds of the segments used by --parallel-segments, and the"
+    " longest segment in --continuous mode.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
+TRANSCRIPT_CACHE: bool = typer.Option(
+    True,  # noqa: FBT003
+    "--transcript-cache/--no-transcript-cache",
+    help="Reuse the cached transcript when the same audio is transcribed again with the same"
+    " ASR settings.",
+    rich_help_panel="ASR (Audio) Configuration",
+)
 LIST_DEVICES: bool = typer.Option(
     False,  # noqa: FBT003
     "--list-devices",
@@ -114,6 +181,13 @@ ASR_WYOMING_PORT: int = typer.Option(
     help="Wyoming ASR server port.",
     rich_help_panel="ASR (Audio) Configuration: Wyoming (local)",
 )
+ASR_WYOMING_ENDPOINTS: list[str] | None = typer.Option(
+    None,
+    "--asr-wyoming-endpoint",
+    help="Additional Wyoming ASR server as 'host:port'. Repeat to balance requests across"
+    " several servers.",
+    rich_help_panel="ASR (Audio) Configuration: Wyoming (local)",
+)
 # OpenAI
 ASR_OPENAI_MODEL: str = typer.Option(
     "whisper-1",
@@ -121,6 +195,14 @@ ASR_OPENAI_MODEL: str = typer.Option(
     help="The OpenAI model to use for ASR (transcription).",
     rich_help_panel="ASR (Audio) Configuration: OpenAI",
 )
+ASR_OPENAI_UPLOAD_FORMAT: str = typer.Option(
+    "flac",
+    "--asr-openai-upload-format",
+    help="Format of the audio uploaded to OpenAI: 'wav', 'flac' (lossless, about half the"
+    " size) or 'opus' (lossy, about 1/10 the size). Falls back to WAV if neither `soundfile`"
+    " nor FFmpeg is available.",
+    rich_help_panel="ASR (Audio) Configuration: OpenAI",
+)
 
 
 # --- Wake Word Options ---
@@ -322,6 +404,13 @@ TRANSCRIPTION_LOG: Path | None = typer.Option(
     help="Path to log transcription results with timestamps, hostname, model, and raw output.",
     rich_help_panel="General Options",
 )
+LATENCY_PROFILE: str = typer.Option(
+    "balanced",
+    "--latency-profile",
+    help="Audio buffer size: 'low-latency' (256 frames) for interactive use, 'balanced' (1024),"
+    " or 'throughput' (4096) for batch work with the least CPU overhead.",
+    rich_help_panel="General Options",
+)
 
 # --- Transcribe Specific Options ---
 FROM_FILE: Path | None = typer.Option(
@@ -336,9 +425,60 @@ LAST_RECORDING: int = typer.Option(
     help="Transcribe a saved recording. Use 1 for most recent, 2 for second-to-last, etc. Use 0 to disable (default).",
     rich_help_panel="Audio Recovery",
 )
+FROM_DIR: Path | None = typer.Option(
+    None,
+    "--from-dir",
+    help="Transcribe every audio file in a directory and append the results to a JSONL file."
+    " Files already transcribed in that file are skipped, so an interrupted run can be resumed.",
+    rich_help_panel="Batch Transcription",
+)
+BATCH_GLOB: str = typer.Option(
+    "*",
+    "--glob",
+    help="Glob pattern selecting the files in --from-dir, e.g. '**/*.m4a'.",
+    rich_help_panel="Batch Transcription",
+)
+BATCH_OUTPUT: Path | None = typer.Option(
+    None,
+    "--batch-output",
+    help="JSONL file for --from-dir results. Defaults to 'transcripts.jsonl' in the directory.",
+    rich_help_panel="Batch Transcription",
+)
+BATCH_CONCURRENCY: int = typer.Option(
+    4,
+    "--batch-concurrency",
+    min=1,
+    help="Number of files decoded and transcribed at the same time with --from-dir.",
+    rich_help_panel="Batch Transcription",
+)
 SAVE_RECORDING: bool = typer.Option(
     True,  # noqa: FBT003
     "--save-recording/--no-save-recording",
     help="Save the audio recording to disk for recovery.",
     rich_help_panel="Audio Recovery",
 )
+KEEP_RECORDINGS: int = typer.Option(
+    0,
+    "--keep-recordings",
+    help="Number of saved recordings to keep; older ones are deleted. 0 (the default) keeps all.",
+    rich_help_panel="Audio Recovery",
+)
+RECORDING_MAX_AGE: float = typer.Option(
+    0,
+    "--recording-max-age",
+    help="Delete saved recordings older than this many days. 0 disables the limit.",
+    rich_help_panel="Audio Recovery",
+)
+RECORDING_MAX_SIZE: float = typer.Option(
+    0,
+    "--recording-max-size",
+    help="Delete the oldest saved recordings beyond this total size in MB. 0 disables the limit.",
+    rich_help_panel="Audio Recovery",
+)
+RECORDING_FORMAT: str = typer.Option(
+    "wav",
+    "--recording-format",
+    help="Format of saved recordings: 'wav', 'flac' (lossless, about half the size) or 'opus'"
+    " (lossy, about 1/10 the size). FLAC and Opus need `soundfile` or FFmpeg.",
+    rich_help_panel="Audio Recovery",
+)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 from typing import TYPE_CHECKING
 
+from agent_cli.core.audio_format import encode_pcm
+
 if TYPE_CHECKING:
     import logging
 
@@ -13,6 +16,14 @@ if TYPE_CHECKING:
     from agent_cli import config
 
 
+# OpenAI detects the container from the file name and accepts ".ogg" but not ".opus"
+UPLOAD_FILENAMES: dict[config.RecordingFormat, str] = {
+    "wav": "audio.wav",
+    "flac": "audio.flac",
+    "opus": "audio.ogg",
+}
+
+
 def _get_openai_client(api_key: str) -> AsyncOpenAI:
     """Get an OpenAI client instance."""
     from openai import AsyncOpenAI  # noqa: PLC0415
@@ -24,19 +35,29 @@ def _get_openai_client(api_key: str) -> AsyncOpenAI:
 
 
 async def transcribe_audio_openai(
-    audio_data: bytes,
+    audio_data: bytes | memoryview,
     openai_asr_cfg: config.OpenAIASR,
     logger: logging.Logger,
+    *,
+    filename: str | None = None,
     **_kwargs: object,  # Accept extra kwargs for consistency with Wyoming
 ) -> str:
-    """Transcribe audio using OpenAI's Whisper API."""
+    """Transcribe audio using OpenAI's Whisper API.
+
+    ``audio_data`` is 16 kHz 16-bit mono PCM, which is encoded in the configured
+    upload format, unless ``filename`` is given: then it is the content of that
+    audio file, which is uploaded unchanged.
+    """
     logger.info("Transcribing audio with OpenAI Whisper...")
     if not openai_asr_cfg.openai_api_key:
         msg = "OpenAI API key is not set."
         raise ValueError(msg)
     client = _get_openai_client(api_key=openai_asr_cfg.openai_api_key)
-    audio_file = io.BytesIO(audio_data)
-    audio_file.name = "audio.wav"
+    if filename is not None:
+        audio_file = io.BytesIO(audio_data)
+        audio_file.name = filename
+    else:
+        audio_file = await _encode_upload(audio_data, openai_asr_cfg, logger)
     response = await client.audio.transcriptions.create(
         model=openai_asr_cfg.asr_openai_model,
         file=audio_file,
@@ -44,6 +65,25 @@ async def transcribe_audio_openai(
     return response.text
 
 
+async def _encode_upload(
+    audio_data: bytes | memoryview,
+    openai_asr_cfg: config.OpenAIASR,
+    logger: logging.Logger,
+) -> io.BytesIO:
+    """Encode PCM as a named file in the upload format, or as WAV if that fails."""
+    upload_format = openai_asr_cfg.asr_openai_upload_format
+    try:
+        encoded = await asyncio.to_thread(encode_pcm, audio_data, upload_format)
+    except RuntimeError as e:
+        logger.warning("Could not encode audio as %s, uploading WAV instead: %s", upload_format, e)
+        upload_format = "wav"
+        encoded = await asyncio.to_thread(encode_pcm, audio_data, upload_format)
+    logger.debug("Uploading %d bytes of %s audio", len(encoded), upload_format)
+    audio_file = io.BytesIO(encoded)
+    audio_file.name = UPLOAD_FILENAMES[upload_format]
+    return audio_file
+
+
 async def synthesize_speech_openai(
     text: str,
     openai_tts_cfg: config.OpenAITTS,
@@ -2,16 +2,252 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING
+import asyncio
+import io
+import time
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
+from wyoming.audio import AudioChunk
 from wyoming.client import AsyncClient
+from wyoming.event import write_event
+from wyoming.info import Describe, Info
 
+from agent_cli import constants
 from agent_cli.core.utils import print_error_message
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Awaitable, Container, Generator, Sequence
+
+POOL_MAX_IDLE = 4
+POOL_KEEPALIVE_SECONDS = 60.0
+POOL_PROBE_TIMEOUT_SECONDS = 1.0
+
+EJECT_AFTER_FAILURES = 2
+EJECT_SECONDS = 30.0
+LATENCY_EWMA_ALPHA = 0.3
+
+PoolKey = tuple[str, int, str]
+T = TypeVar("T")
+
+
+class _IdleConnection(NamedTuple):
+    client: AsyncClient
+    stack: AsyncExitStack
+    released_at: float
+
+
+def _is_open(client: AsyncClient) -> bool:
+    """Return whether the client's socket is open and has nothing left unread."""
+    reader = getattr(client, "_reader", None)
+    writer = getattr(client, "_writer", None)
+    return (
+        isinstance(reader, asyncio.StreamReader)
+        and isinstance(writer, asyncio.StreamWriter)
+        and not writer.is_closing()
+        and not reader.at_eof()
+        and not reader._buffer
+    )
+
+
+async def _probe(client: AsyncClient) -> bool:
+    """Check that the server still answers by doing a `Describe` round trip."""
+    try:
+        async with asyncio.timeout(POOL_PROBE_TIMEOUT_SECONDS):
+            await client.write_event(Describe().event())
+            while (event := await client.read_event()) is not None:
+                if Info.is_type(event.type):
+                    return True
+    except (OSError, TimeoutError):
+        return False
+    return False
+
+
+class WyomingConnectionPool:
+    """Keep connected Wyoming clients around between sessions.
+
+    Connections are keyed by ``(host, port, service)``. A connection is only
+    returned to the pool when its session finished without an error and nothing
+    is left unread on the socket, and it is checked with a `Describe` round trip
+    before being handed out again, because the server may be about to hang up.
+    Servers that hang up after a session (e.g. faster-whisper after the
+    transcript) fail that check, and their connections are not pooled anymore.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle: int = POOL_MAX_IDLE,
+        keepalive: float = POOL_KEEPALIVE_SECONDS,
+    ) -> None:
+        """Initialize the pool."""
+        self.max_idle = max_idle
+        self.keepalive = keepalive
+        self._idle: dict[PoolKey, list[_IdleConnection]] = {}
+        self._not_persistent: set[PoolKey] = set()
+
+    async def acquire(self, key: PoolKey) -> tuple[AsyncClient, AsyncExitStack, bool]:
+        """Return ``(client, stack, reused)`` for ``key``, connecting if needed."""
+        idle = self._idle.get(key, [])
+        while idle:
+            conn = idle.pop()
+            if time.monotonic() - conn.released_at <= self.keepalive and _is_open(conn.client):
+                if await _probe(conn.client):
+                    return conn.client, conn.stack, True
+                self._not_persistent.add(key)
+            await _close(conn.stack)
+        host, port, _ = key
+        stack = AsyncExitStack()
+        client = await stack.enter_async_context(AsyncClient.from_uri(f"tcp://{host}:{port}"))
+        return client, stack, False
+
+    async def release(
+        self,
+        key: PoolKey,
+        client: AsyncClient,
+        stack: AsyncExitStack,
+        *,
+        reusable: bool,
+    ) -> None:
+        """Return a connection to the pool, or close it if it can't be reused."""
+        idle = self._idle.setdefault(key, [])
+        if (
+            reusable
+            and key not in self._not_persistent
+            and _is_open(client)
+            and len(idle) < self.max_idle
+        ):
+            idle.append(_IdleConnection(client, stack, time.monotonic()))
+        else:
+            await _close(stack)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                await _close(conn.stack)
+
+
+async def _close(stack: AsyncExitStack) -> None:
+    with suppress(OSError):
+        await stack.aclose()
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, WyomingConnectionPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_connection_pool() -> WyomingConnectionPool:
+    """Return the connection pool of the running event loop.
+
+    Streams are bound to the loop that opened them, so each loop gets its own pool.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = WyomingConnectionPool()
+    return pool
+
+
+async def close_connection_pool() -> None:
+    """Close the idle connections of the running event loop's pool."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+async def closing_connection_pool(main: Awaitable[T]) -> T:
+    """Await ``main``, then close the Wyoming connections it left in the pool.
+
+    Wrap the coroutine given to `asyncio.run` with this, so idle pooled sockets are
+    closed before the loop is, even if ``main`` fails or is interrupted.
+    """
+    try:
+        return await main
+    finally:
+        await close_connection_pool()
+
+
+@dataclass
+class Endpoint:
+    """A Wyoming server and the load balancer's view of its health."""
+
+    host: str
+    port: int
+    outstanding: int = 0
+    latency_ewma: float | None = None
+    failures: int = 0
+    ejected_until: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the endpoint is not currently ejected."""
+        return time.monotonic() >= self.ejected_until
+
+
+class EndpointBalancer:
+    """Route requests across Wyoming servers by least outstanding requests.
+
+    Ties are broken by the lowest latency EWMA. After ``EJECT_AFTER_FAILURES``
+    consecutive failures an endpoint is ejected for ``EJECT_SECONDS``; when every
+    endpoint is ejected, all of them are tried again.
+    """
+
+    def __init__(self, endpoints: Sequence[tuple[str, int]]) -> None:
+        """Initialize the balancer."""
+        self.endpoints = [Endpoint(host, port) for host, port in endpoints]
+
+    def pick(self, exclude: Container[Endpoint] = ()) -> Endpoint | None:
+        """Return the endpoint to send the next request to, or None if all are excluded."""
+        candidates = [e for e in self.endpoints if e not in exclude]
+        candidates = [e for e in candidates if e.healthy] or candidates
+        if not candidates:
+            return None
+        return min(candidates, key=lambda e: (e.outstanding, e.latency_ewma or 0.0))
+
+    @contextmanager
+    def track(self, endpoint: Endpoint, *, timed: bool = True) -> Generator[None, None, None]:
+        """Count a request as outstanding and record its outcome and latency."""
+        endpoint.outstanding += 1
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            endpoint.failures += 1
+            if endpoint.failures >= EJECT_AFTER_FAILURES:
+                endpoint.ejected_until = time.monotonic() + EJECT_SECONDS
+            raise
+        else:
+            endpoint.failures = 0
+            endpoint.ejected_until = 0.0
+            if timed:
+                latency = time.monotonic() - start
+                endpoint.latency_ewma = (
+                    latency
+                    if endpoint.latency_ewma is None
+                    else LATENCY_EWMA_ALPHA * latency
+                    + (1 - LATENCY_EWMA_ALPHA) * endpoint.latency_ewma
+                )
+        finally:
+            endpoint.outstanding -= 1
+
+
+_balancers: dict[tuple[tuple[str, int], ...], EndpointBalancer] = {}
+
+
+def get_endpoint_balancer(endpoints: Sequence[tuple[str, int]]) -> EndpointBalancer:
+    """Return the shared balancer for a set of endpoints."""
+    key = tuple(endpoints)
+    balancer = _balancers.get(key)
+    if balancer is None:
+        balancer = _balancers[key] = EndpointBalancer(key)
+    return balancer
 
 
 @asynccontextmanager
@@ -22,15 +258,21 @@ async def wyoming_client_context(
     logger: logging.Logger,
     *,
     quiet: bool = False,
+    reuse: bool = True,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Context manager for Wyoming client connections with unified error handling.
 
+    Connections are taken from and returned to the event loop's
+    `WyomingConnectionPool`, so consecutive sessions skip the connection setup.
+
     Args:
         server_ip: Wyoming server IP
         server_port: Wyoming server port
         server_type: Type of server (e.g., "ASR", "TTS", "wake word")
         logger: Logger instance
         quiet: If True, suppress console error messages
+        reuse: If False, close the connection afterwards instead of pooling it,
+            e.g. for sessions that may leave events in flight
 
     Yields:
         Connected Wyoming client
@@ -42,11 +284,18 @@ async def wyoming_client_context(
     """
     uri = f"tcp://{server_ip}:{server_port}"
     logger.info("Connecting to Wyoming %s server at %s", server_type, uri)
+    pool = get_connection_pool()
+    key = (server_ip, server_port, server_type)
 
     try:
-        async with AsyncClient.from_uri(uri) as client:
-            logger.info("%s connection established", server_type)
+        client, stack, reused = await pool.acquire(key)
+        logger.info("%s connection %s", server_type, "reused" if reused else "established")
+        reusable = False
+        try:
             yield client
+            reusable = reuse
+        finally:
+            await pool.release(key, client, stack, reusable=reusable)
     except ConnectionRefusedError:
         logger.exception("%s connection refused.", server_type)
         if not quiet:
@@ -60,3 +309,39 @@ async def wyoming_client_context(
         if not quiet:
             print_error_message(f"{server_type} error: {e}")
         raise
+
+
+@cache
+def _audio_chunk_framing() -> tuple[bytes, bytes] | None:
+    """Serialize an `AudioChunk` with wyoming and split off its constant parts.
+
+    Returns the header line up to the payload length, and the data (the audio
+    format) that follows it, or None if wyoming doesn't write the payload length
+    as the last header field, in which case chunks are sent with ``write_event``.
+    """
+    buffer = io.BytesIO()
+    write_event(AudioChunk(audio=b"\0\0", **constants.WYOMING_AUDIO_CONFIG).event(), buffer)
+    header, _, data = buffer.getvalue().partition(b"\n")
+    prefix, _, suffix = header.rpartition(b" ")
+    if not prefix.endswith(b'"payload_length":') or suffix != b"2}" or data[-2:] != b"\0\0":
+        return None
+    return prefix + b" ", data[:-2]
+
+
+async def write_audio_chunk(client: AsyncClient, chunk: bytes | memoryview) -> None:
+    """Send ``chunk`` as an `AudioChunk` in the `constants.WYOMING_AUDIO_CONFIG` format.
+
+    Equivalent to ``client.write_event(AudioChunk(...).event())`` on the wire, but
+    the header and audio format are serialized once and only the payload length
+    is filled in per chunk, then everything is written in one ``writelines``.
+    Clients without a real stream writer (e.g. in tests), and wyoming versions with
+    a different header layout, use ``write_event``.
+    """
+    writer = getattr(client, "_writer", None)
+    framing = _audio_chunk_framing()
+    if not chunk or framing is None or not isinstance(writer, asyncio.StreamWriter):
+        await client.write_event(AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event())
+        return
+    prefix, data = framing
+    writer.writelines((prefix, b"%d}\n" % len(chunk), data, chunk))
+    await writer.drain()
@@ -3,37 +3,58 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import string
+import time
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import suppress
 from datetime import UTC, datetime
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from wyoming.asr import Transcribe, Transcript, TranscriptChunk, TranscriptStart, TranscriptStop
-from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.audio import AudioStart, AudioStop
 
 from agent_cli import constants
+from agent_cli.core import recording_store
 from agent_cli.core.audio import (
+    WAV_HEADER,
+    AudioBuffer,
+    VoiceActivityDetector,
+    WavFileWriter,
+    compact_silence,
+    create_vad,
+    map_wav_data,
     open_pyaudio_stream,
     read_audio_stream,
     read_from_queue,
+    repair_wav_header,
     setup_input_stream,
+    split_on_silence,
 )
-from agent_cli.core.utils import manage_send_receive_tasks
+from agent_cli.core.audio_format import RECORDING_EXTENSIONS, decode_audio_file, encode_pcm
+from agent_cli.core.utils import manage_send_receive_tasks, render_scheduler
 from agent_cli.services import transcribe_audio_openai
-from agent_cli.services._wyoming_utils import wyoming_client_context
+from agent_cli.services._wyoming_utils import (
+    get_endpoint_balancer,
+    write_audio_chunk,
+    wyoming_client_context,
+)
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 
     import pyaudio
     from rich.live import Live
     from wyoming.client import AsyncClient
 
     from agent_cli import config
-    from agent_cli.core.utils import InteractiveStopEvent
+    from agent_cli.core.recording_store import RecordingStore
+    from agent_cli.core.transcription_cache import TranscriptionCache
+    from agent_cli.core.utils import InteractiveStopEvent, RenderScheduler
+    from agent_cli.services._wyoming_utils import Endpoint, EndpointBalancer
 
 
 def _get_transcriptions_dir() -> Path:
@@ -43,27 +64,115 @@ def _get_transcriptions_dir() -> Path:
     return config_dir
 
 
-def _save_audio_to_file(audio_data: bytes, logger: logging.Logger) -> Path | None:
-    """Save audio data to a WAV file with timestamp-based filename.
+def _recording_path(recording_format: config.RecordingFormat) -> Path:
+    """Return a new timestamp-based path for a recording."""
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")[:-3]  # Include milliseconds
+    return (
+        _get_transcriptions_dir() / f"recording_{timestamp}{RECORDING_EXTENSIONS[recording_format]}"
+    )
+
+
+_recording_writer: ThreadPoolExecutor | None = None
+_pending_writes: set[Future] = set()
+
+
+def _submit_write(fn: Callable[..., object], *args: object) -> Future:
+    """Run ``fn`` in the recording writer thread, in submission order."""
+    global _recording_writer
+    if _recording_writer is None:
+        _recording_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recording-writer")
+    future = _recording_writer.submit(fn, *args)
+    _pending_writes.add(future)
+    future.add_done_callback(_pending_writes.discard)
+    return future
 
-    Returns the path to the saved file, or None if saving failed.
+
+def start_recording_file(logger: logging.Logger) -> WavFileWriter | None:
+    """Create the WAV file that a recording is streamed to while it is captured.
+
+    The recording is indexed right away, so ``--last-recording`` can recover it
+    even if the process crashes before `finish_recording_file`. Until then it is
+    marked as in progress, so other processes don't read or repair it.
     """
     try:
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")[:-3]  # Include milliseconds
-        filename = f"recording_{timestamp}.wav"
-        filepath = _get_transcriptions_dir() / filename
-
-        with wave.open(str(filepath), "wb") as wav_file:
-            wav_file.setnchannels(constants.PYAUDIO_CHANNELS)
-            wav_file.setsampwidth(2)  # 16-bit audio
-            wav_file.setframerate(constants.PYAUDIO_RATE)
-            wav_file.writeframes(audio_data)
-
-        logger.info("Saved audio recording to %s", filepath)
-        return filepath
+        path = _recording_path("wav")
+        recording_store.mark_in_progress(path)
+        try:
+            writer = WavFileWriter(path, logger)
+        except OSError:
+            recording_store.mark_finished(path)
+            raise
+    except OSError:
+        logger.exception("Failed to create audio recording file")
+        return None
+    _submit_write(lambda: get_recording_store().add(writer.path, duration=0.0))
+    return writer
+
+
+def append_to_recording(writer: WavFileWriter, chunk: bytes) -> None:
+    """Append a captured chunk to a recording file, off the event loop."""
+    _submit_write(writer.write, chunk)
+
+
+def finish_recording_file(
+    writer: WavFileWriter,
+    logger: logging.Logger,
+    recording_format: config.RecordingFormat = "wav",
+) -> Future[Path | None]:
+    """Finalize a recording file in the writer thread, compressing it if requested."""
+    return _submit_write(_finish_recording_file, writer, logger, recording_format)
+
+
+def _finish_recording_file(
+    writer: WavFileWriter,
+    logger: logging.Logger,
+    recording_format: config.RecordingFormat,
+) -> Path | None:
+    store = get_recording_store()
+    try:
+        try:
+            writer.close()
+        finally:
+            recording_store.mark_finished(writer.path)
+        if not writer.size:
+            store.remove(writer.path)
+            writer.path.unlink()
+            return None
     except OSError:
         logger.exception("Failed to save audio recording")
         return None
+    path = writer.path
+    if recording_format != "wav":
+        compressed = path.with_suffix(RECORDING_EXTENSIONS[recording_format])
+        try:
+            audio_data = memoryview(path.read_bytes())[WAV_HEADER.size :]
+            compressed.write_bytes(encode_pcm(audio_data, recording_format))
+            store.remove(path)
+            path.unlink()
+            path = compressed
+        except (OSError, RuntimeError):
+            logger.exception("Failed to compress audio recording, keeping %s", path)
+    logger.info("Saved audio recording to %s", path)
+    store.add(path, duration=writer.size / (constants.PYAUDIO_RATE * 2))
+    return path
+
+
+def wait_for_recordings() -> None:
+    """Block until everything submitted to the recording writer is on disk."""
+    wait(list(_pending_writes))
+
+
+def get_recording_store() -> RecordingStore:
+    """Get the index of the saved recordings."""
+    return recording_store.get_recording_store(_get_transcriptions_dir())
+
+
+def apply_recording_retention(retention_cfg: config.RecordingRetention) -> None:
+    """Use ``retention_cfg`` for the saved recordings from now on."""
+    store = get_recording_store()
+    store.max_recordings = retention_cfg.keep_recordings
+    store.max_age_days = retention_cfg.recording_max_age_days
+    store.max_size_mb = retention_cfg.recording_max_size_mb
 
 
 def get_last_recording(index: int = 1) -> Path | None:
@@ -77,35 +186,178 @@ def get_last_recording(index: int = 1) -> Path | None:
         Path to the recording file, or None if not found.
 
     """
-    if index < 1:
-        return None
+    wait_for_recordings()
+    return get_recording_store().last(index)
+
 
-    transcriptions_dir = _get_transcriptions_dir()
-    recording_files = sorted(transcriptions_dir.glob("recording_*.wav"))
+def _is_saved_recording(path: Path) -> bool:
+    """Return whether ``path`` is one of the recordings in the transcriptions directory."""
+    return (
+        path.match(recording_store.RECORDING_GLOB)
+        and path.resolve().parent == _get_transcriptions_dir().resolve()
+    )
 
-    if recording_files and len(recording_files) >= index:
-        # -1 for most recent, -2 for second-to-last, etc.
-        return recording_files[-index]
-    return None
 
+def load_audio_from_file(
+    filepath: Path,
+    logger: logging.Logger,
+) -> bytes | memoryview | None:
+    """Load audio data from a WAV, FLAC or Opus file.
 
-def load_audio_from_file(filepath: Path, logger: logging.Logger) -> bytes | None:
-    """Load audio data from a WAV file."""
+    16 kHz 16-bit mono WAV files are memory-mapped rather than read, so sending
+    them to the ASR server doesn't need memory proportional to their length. Our
+    own recordings that were interrupted are repaired first; other files are
+    never written to.
+    """
     try:
-        with wave.open(str(filepath), "rb") as wav_file:
-            audio_data = wav_file.readframes(wav_file.getnframes())
-            logger.info("Loaded audio from %s", filepath)
-            return audio_data
-    except (OSError, wave.Error):
+        if filepath.suffix == ".wav":
+            if (
+                _is_saved_recording(filepath)
+                and not recording_store.is_in_progress(filepath)
+                and repair_wav_header(filepath)
+            ):
+                logger.warning("Recovered recording %s, which was not saved cleanly", filepath)
+            try:
+                audio_data: bytes | memoryview = map_wav_data(filepath)
+            except wave.Error:
+                audio_data = decode_audio_file(filepath)  # Convert any other WAV format
+        else:
+            audio_data = decode_audio_file(filepath)
+        logger.info("Loaded audio from %s", filepath)
+        return audio_data
+    except (OSError, wave.Error, RuntimeError):
         logger.exception("Failed to load audio from %s", filepath)
         return None
 
 
+def trim_silence(
+    audio_data: bytes | memoryview,
+    silence_trim_cfg: config.SilenceTrim | None,
+    logger: logging.Logger,
+) -> bytes | memoryview:
+    """Trim silence from 16 kHz 16-bit mono PCM before ASR submission, if enabled."""
+    if silence_trim_cfg is None or not silence_trim_cfg.trim_silence:
+        return audio_data
+    trimmed = compact_silence(
+        audio_data,
+        threshold_db=silence_trim_cfg.trim_threshold_db,
+        max_pause_seconds=silence_trim_cfg.trim_max_pause_seconds,
+    )
+    if len(trimmed) < len(audio_data):
+        bytes_per_second = constants.PYAUDIO_RATE * 2
+        logger.info(
+            "Trimmed silence: %.1fs -> %.1fs of audio",
+            len(audio_data) / bytes_per_second,
+            len(trimmed) / bytes_per_second,
+        )
+    return trimmed
+
+
+def _normalize_word(word: str) -> str:
+    return word.strip(string.punctuation).lower()
+
+
+def stitch_transcripts(parts: Sequence[str], *, max_overlap_words: int = 12) -> str:
+    """Join segment transcripts, dropping words repeated at the overlaps.
+
+    For each part, the longest run of up to ``max_overlap_words`` leading words
+    that repeats the end of the text so far (ignoring case and punctuation) is
+    dropped before appending.
+    """
+    words: list[str] = []
+    for part in parts:
+        new_words = part.split()
+        tail = [_normalize_word(w) for w in words[-max_overlap_words:]]
+        head = [_normalize_word(w) for w in new_words[:max_overlap_words]]
+        overlap = next(
+            (k for k in range(min(len(tail), len(head)), 0, -1) if tail[-k:] == head[:k]),
+            0,
+        )
+        words.extend(new_words[overlap:])
+    return " ".join(words)
+
+
+async def transcribe_segmented(
+    audio_data: bytes | memoryview,
+    transcribe_segment: Callable[[bytes | memoryview], Awaitable[str]],
+    segmented_cfg: config.SegmentedTranscription | None,
+    logger: logging.Logger,
+) -> str:
+    """Transcribe 16 kHz 16-bit mono PCM in concurrent segments, if enabled.
+
+    The audio is split at pauses, up to ``parallel_segments`` segments are
+    transcribed at a time with ``transcribe_segment``, and the transcripts are
+    stitched back together in order.
+    """
+    if segmented_cfg is None or segmented_cfg.parallel_segments <= 1:
+        return await transcribe_segment(audio_data)
+    segments = split_on_silence(
+        audio_data,
+        segment_seconds=segmented_cfg.segment_seconds,
+        overlap_seconds=segmented_cfg.segment_overlap_seconds,
+    )
+    if len(segments) == 1:
+        return await transcribe_segment(audio_data)
+
+    logger.info(
+        "Transcribing %d segments, %d at a time",
+        len(segments),
+        segmented_cfg.parallel_segments,
+    )
+    semaphore = asyncio.Semaphore(segmented_cfg.parallel_segments)
+
+    async def run(segment: memoryview) -> str:
+        async with semaphore:
+            return await transcribe_segment(segment)
+
+    parts = await asyncio.gather(*(run(segment) for segment in segments))
+    return stitch_transcripts(parts)
+
+
+def asr_identity(
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+) -> str:
+    """Describe the ASR backend that produces a transcript, for cache keys."""
+    if provider_cfg.asr_provider == "openai":
+        identity = f"openai:{openai_asr_cfg.asr_openai_model}"
+        # Lossy uploads can change the transcript
+        if openai_asr_cfg.asr_openai_upload_format == "opus":
+            identity += ":opus"
+        return identity
+    endpoints = ",".join(f"{host}:{port}" for host, port in sorted(wyoming_asr_cfg.endpoints))
+    return f"wyoming:{endpoints}"
+
+
+async def cached_transcription(
+    cache: TranscriptionCache | None,
+    key: str,
+    transcribe: Callable[[], Awaitable[str]],
+    logger: logging.Logger,
+) -> str:
+    """Return the cached transcript for ``key``, or run ``transcribe`` and cache it.
+
+    Empty transcripts (failed transcriptions) are not cached.
+    """
+    if cache is None:
+        return await transcribe()
+    transcript = cache.get(key)
+    if transcript is not None:
+        logger.info("Using cached transcript")
+        return transcript
+    transcript = await transcribe()
+    if transcript:
+        cache.put(key, transcript)
+    return transcript
+
+
 def create_transcriber(
     provider_cfg: config.ProviderSelection,
     audio_input_cfg: config.AudioInput,
     wyoming_asr_cfg: config.WyomingASR,
     openai_asr_cfg: config.OpenAIASR,
+    silence_trim_cfg: config.SilenceTrim | None = None,
 ) -> Callable[..., Awaitable[str | None]]:
     """Return the appropriate transcriber for live audio based on the provider."""
     if provider_cfg.asr_provider == "openai":
@@ -113,6 +365,7 @@ def create_transcriber(
             _transcribe_live_audio_openai,
             audio_input_cfg=audio_input_cfg,
             openai_asr_cfg=openai_asr_cfg,
+            silence_trim_cfg=silence_trim_cfg,
         )
     if provider_cfg.asr_provider == "local":
         return partial(
@@ -145,19 +398,22 @@ async def _send_audio(
     live: Live,
     quiet: bool = False,
     save_recording: bool = True,
+    vad: VoiceActivityDetector | None = None,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
+    recording_format: config.RecordingFormat = "wav",
 ) -> None:
     """Read from mic and send to Wyoming server."""
     await client.write_event(Transcribe().event())
     await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
 
-    # Buffer to save audio if requested
-    audio_buffer = io.BytesIO() if save_recording else None
+    # Stream the audio to disk while recording if requested
+    recording = start_recording_file(logger) if save_recording else None
 
     async def send_chunk(chunk: bytes) -> None:
-        """Send audio chunk to ASR server and optionally buffer it."""
-        if audio_buffer is not None:
-            audio_buffer.write(chunk)
-        await client.write_event(AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event())
+        """Send audio chunk to ASR server and optionally record it."""
+        if recording is not None:
+            append_to_recording(recording, chunk)
+        await write_audio_chunk(client, chunk)
 
     try:
         await read_audio_stream(
@@ -169,63 +425,110 @@ async def _send_audio(
             quiet=quiet,
             progress_message="Listening",
             progress_style="blue",
+            vad=vad,
+            num_frames=chunk_size,
         )
     finally:
         await client.write_event(AudioStop().event())
         logger.debug("Sent AudioStop")
 
-        # Save the recording to disk if requested
-        if save_recording and audio_buffer:
-            audio_data = audio_buffer.getvalue()
-            if audio_data:
-                _save_audio_to_file(audio_data, logger)
+        if recording is not None:
+            finish_recording_file(recording, logger, recording_format)
 
 
-async def record_audio_to_buffer(queue: asyncio.Queue, logger: logging.Logger) -> bytes:
-    """Record audio from a queue to a buffer."""
-    audio_buffer = io.BytesIO()
+async def record_audio_to_buffer(
+    queue: asyncio.Queue,
+    logger: logging.Logger,
+    *,
+    max_recording_seconds: float = constants.MAX_RECORDING_SECONDS,
+    vad: VoiceActivityDetector | None = None,
+    stop_event: asyncio.Event | None = None,
+    vad_skip_chunks: int = 0,
+) -> memoryview:
+    """Record audio from a queue to a buffer.
+
+    With a voice activity detector, recording ends (and ``stop_event`` is set) at the
+    end of the utterance instead of when the queue is closed; the first
+    ``vad_skip_chunks`` chunks are recorded but not fed to it.
+    """
+    audio_buffer = AudioBuffer(logger, max_seconds=max_recording_seconds)
+    await read_from_queue(
+        queue=queue,
+        chunk_handler=audio_buffer.write,
+        logger=logger,
+        vad=vad,
+        stop_event=stop_event,
+        vad_skip_chunks=vad_skip_chunks,
+    )
+    return audio_buffer.view()
 
-    def buffer_chunk(chunk: bytes) -> None:
-        """Buffer audio chunk."""
-        audio_buffer.write(chunk)
 
-    await read_from_queue(queue=queue, chunk_handler=buffer_chunk, logger=logger)
+class TranscriptSegment(NamedTuple):
+    """A partial or final piece of a streamed transcript.
 
-    return audio_buffer.getvalue()
+    ``timestamp`` is the number of seconds since the transcription started.
+    """
 
+    text: str
+    is_final: bool
+    timestamp: float
 
-async def _receive_transcript(
+
+async def iter_transcript(
     client: AsyncClient,
     logger: logging.Logger,
     *,
-    chunk_callback: Callable[[str], None] | None = None,
-    final_callback: Callable[[str], None] | None = None,
-) -> str:
-    """Receive transcription events and return the final transcript."""
-    transcript_text = ""
+    start_time: float | None = None,
+) -> AsyncIterator[TranscriptSegment]:
+    """Yield `TranscriptChunk` events as partial segments, ending with the final one.
+
+    Timestamps count from ``start_time`` (a `time.monotonic` value), or from the
+    first read if not given. Raises `ConnectionError` if the connection is lost
+    before the final transcript, so the request counts as failed.
+    """
+    start = time.monotonic() if start_time is None else start_time
     while True:
         event = await client.read_event()
         if event is None:
             logger.warning("Connection to ASR server lost.")
-            break
+            msg = "Connection to ASR server lost before the transcript"
+            raise ConnectionError(msg)
 
         if Transcript.is_type(event.type):
             transcript = Transcript.from_event(event)
-            transcript_text = transcript.text
-            logger.info("Final transcript: %s", transcript_text)
-            if final_callback:
-                final_callback(transcript_text)
-            break
+            logger.info("Final transcript: %s", transcript.text)
+            yield TranscriptSegment(
+                transcript.text,
+                is_final=True,
+                timestamp=time.monotonic() - start,
+            )
+            return
         if TranscriptChunk.is_type(event.type):
             chunk = TranscriptChunk.from_event(event)
             logger.debug("Transcript chunk: %s", chunk.text)
-            if chunk_callback:
-                chunk_callback(chunk.text)
+            yield TranscriptSegment(chunk.text, is_final=False, timestamp=time.monotonic() - start)
         elif TranscriptStart.is_type(event.type) or TranscriptStop.is_type(event.type):
             logger.debug("Received %s", event.type)
         else:
             logger.debug("Ignoring event type: %s", event.type)
 
+
+async def _receive_transcript(
+    client: AsyncClient,
+    logger: logging.Logger,
+    *,
+    chunk_callback: Callable[[str], None] | None = None,
+    final_callback: Callable[[str], None] | None = None,
+) -> str:
+    """Receive transcription events and return the final transcript."""
+    transcript_text = ""
+    async for segment in iter_transcript(client, logger):
+        if segment.is_final:
+            transcript_text = segment.text
+            if final_callback:
+                final_callback(transcript_text)
+        elif chunk_callback:
+            chunk_callback(segment.text)
     return transcript_text
 
 
@@ -238,7 +541,13 @@ async def record_audio_with_manual_stop(
     quiet: bool = False,
     live: Live | None = None,
     save_recording: bool = True,
-) -> bytes:
+    max_recording_seconds: float = constants.MAX_RECORDING_SECONDS,
+    vad: VoiceActivityDetector | None = None,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
+    recording_format: config.RecordingFormat = "wav",
+    tee_queue: asyncio.Queue[bytes | None] | None = None,
+    tee_reader: asyncio.Future | None = None,
+) -> memoryview:
     """Record audio to a buffer using a manual stop signal.
 
     Args:
@@ -248,75 +557,345 @@ async def record_audio_with_manual_stop(
         logger: Logger instance
         quiet: If True, suppress console output
         live: Rich Live display for progress
-        save_recording: If True, save the recording to disk
+        save_recording: If True, stream the recording to disk while it is captured
+        max_recording_seconds: Only the most recent this many seconds are returned
+        vad: Voice activity detector that stops the recording at the end of speech
+        chunk_size: Frames per buffer, see `constants.LATENCY_PROFILES`
+        recording_format: Format of the saved recording, converted from WAV once it stops
+        tee_queue: Queue that also receives every chunk and then ``None``, e.g., to feed
+            `transcribe_audio_queue` while recording
+        tee_reader: Task reading ``tee_queue``; once it is done (e.g. failed), the
+            queue is emptied and no longer fed
 
     Returns:
-        The recorded audio data as bytes
+        A zero-copy view of the recorded audio data
 
     """
-    audio_buffer = io.BytesIO()
-
-    def buffer_chunk(chunk: bytes) -> None:
-        """Buffer audio chunk."""
+    audio_buffer = AudioBuffer(logger, max_seconds=max_recording_seconds)
+    # Stream the audio to disk while recording if requested
+    recording = start_recording_file(logger) if save_recording else None
+
+    def tee(chunk: bytes | None) -> None:
+        nonlocal tee_queue
+        if tee_queue is None:
+            return
+        if tee_reader is not None and tee_reader.done():
+            # Nobody reads the queue anymore, don't keep a second copy of the audio
+            while not tee_queue.empty():
+                tee_queue.get_nowait()
+            tee_queue = None
+            return
+        tee_queue.put_nowait(chunk)
+
+    def handle_chunk(chunk: bytes) -> None:
         audio_buffer.write(chunk)
+        if recording is not None:
+            append_to_recording(recording, chunk)
+        tee(chunk)
 
-    stream_kwargs = setup_input_stream(input_device_index)
-    with open_pyaudio_stream(p, **stream_kwargs) as stream:
-        await read_audio_stream(
-            stream=stream,
-            stop_event=stop_event,
-            chunk_handler=buffer_chunk,
-            logger=logger,
-            live=live,
-            quiet=quiet,
-            progress_message="Recording",
-            progress_style="green",
-        )
+    stream_kwargs = setup_input_stream(input_device_index, chunk_size=chunk_size)
+    try:
+        with open_pyaudio_stream(p, **stream_kwargs) as stream:
+            await read_audio_stream(
+                stream=stream,
+                stop_event=stop_event,
+                chunk_handler=handle_chunk,
+                logger=logger,
+                live=live,
+                quiet=quiet,
+                progress_message="Recording",
+                progress_style="green",
+                vad=vad,
+                num_frames=chunk_size,
+            )
+    finally:
+        if recording is not None:
+            finish_recording_file(recording, logger, recording_format)
+        tee(None)
 
-    audio_data = audio_buffer.getvalue()
+    return audio_buffer.view()
 
-    # Save the recording to disk if requested
-    if save_recording and audio_data:
-        _save_audio_to_file(audio_data, logger)
 
-    return audio_data
+async def record_segments(
+    p: pyaudio.PyAudio,
+    input_device_index: int | None,
+    stop_event: InteractiveStopEvent,
+    segments: asyncio.Queue[bytes | None],
+    logger: logging.Logger,
+    *,
+    silence_seconds: float,
+    max_segment_seconds: float,
+    quiet: bool = False,
+    live: Live | None = None,
+    save_recording: bool = True,
+    recording_format: config.RecordingFormat = "wav",
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
+) -> None:
+    """Record until stopped, queueing each utterance as soon as a pause ends it.
+
+    A segment ends after ``silence_seconds`` of silence following speech, or once it
+    is ``max_segment_seconds`` long. Segments without speech are dropped, and only a
+    short pre-roll of the silence before speech is kept. ``None`` is queued once
+    recording stops.
+    """
+    bytes_per_second = constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2
+    max_bytes = int(max_segment_seconds * bytes_per_second)
+    preroll_bytes = int(constants.SEGMENT_PREROLL_SECONDS * bytes_per_second) // 2 * 2
+    vad = VoiceActivityDetector(silence_seconds=silence_seconds)
+    segment = bytearray()
+    recording = start_recording_file(logger) if save_recording else None
+
+    def handle_chunk(chunk: bytes) -> None:
+        nonlocal vad
+        segment.extend(chunk)
+        if recording is not None:
+            append_to_recording(recording, chunk)
+        end_of_utterance = vad.process(chunk)
+        if not vad.speech_detected:
+            del segment[:-preroll_bytes]
+        elif end_of_utterance or len(segment) >= max_bytes:
+            logger.info("Queueing a %.1fs segment", len(segment) / bytes_per_second)
+            segments.put_nowait(bytes(segment))
+            segment.clear()
+            vad = VoiceActivityDetector(silence_seconds=silence_seconds)
+
+    stream_kwargs = setup_input_stream(input_device_index, chunk_size=chunk_size)
+    try:
+        with open_pyaudio_stream(p, **stream_kwargs) as stream:
+            await read_audio_stream(
+                stream=stream,
+                stop_event=stop_event,
+                chunk_handler=handle_chunk,
+                logger=logger,
+                live=live,
+                quiet=quiet,
+                progress_message="Dictating",
+                progress_style="green",
+                num_frames=chunk_size,
+            )
+    finally:
+        if recording is not None:
+            finish_recording_file(recording, logger, recording_format)
+        if vad.speech_detected:
+            segments.put_nowait(bytes(segment))
+        segments.put_nowait(None)
 
 
 async def _transcribe_recorded_audio_wyoming(
     *,
-    audio_data: bytes,
+    audio_data: bytes | memoryview,
     wyoming_asr_cfg: config.WyomingASR,
     logger: logging.Logger,
     quiet: bool = False,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
     **_kwargs: object,
 ) -> str:
-    """Process pre-recorded audio data with Wyoming ASR server."""
-    try:
+    """Process pre-recorded audio data with Wyoming ASR server.
+
+    With several endpoints configured, the request goes to the least busy one and
+    is retried on the next one if it fails.
+    """
+    balancer = get_endpoint_balancer(wyoming_asr_cfg.endpoints)
+    tried: list[Endpoint] = []
+    while (endpoint := balancer.pick(exclude=tried)) is not None:
+        tried.append(endpoint)
+        try:
+            with balancer.track(endpoint):
+                return await _send_recorded_audio(
+                    endpoint,
+                    audio_data,
+                    logger,
+                    quiet=quiet,
+                    chunk_size=chunk_size,
+                )
+        except (ConnectionRefusedError, Exception):
+            logger.warning("Failed to connect to Wyoming ASR server")
+    return ""
+
+
+def _pick_asr_endpoint(
+    wyoming_asr_cfg: config.WyomingASR,
+) -> tuple[EndpointBalancer, Endpoint]:
+    """Return the balancer of the configured ASR servers and the endpoint to use."""
+    balancer = get_endpoint_balancer(wyoming_asr_cfg.endpoints)
+    endpoint = balancer.pick()
+    if endpoint is None:
+        msg = "No Wyoming ASR server is configured"
+        raise ValueError(msg)
+    return balancer, endpoint
+
+
+async def _send_recorded_audio(
+    endpoint: Endpoint,
+    audio_data: bytes | memoryview,
+    logger: logging.Logger,
+    *,
+    quiet: bool,
+    chunk_size: int,
+) -> str:
+    async with wyoming_client_context(
+        endpoint.host,
+        endpoint.port,
+        "ASR",
+        logger,
+        quiet=quiet,
+    ) as client:
+        await _write_recorded_audio(client, audio_data, logger, chunk_size=chunk_size)
+        return await _receive_transcript(client, logger)
+
+
+def recorded_chunk_bytes(audio_bytes: int, chunk_size: int) -> int:
+    """Return the `AudioChunk` size for sending ``audio_bytes`` of recorded audio.
+
+    Live capture sends each ``chunk_size``-frame chunk as it is recorded, but
+    recorded audio is sent all at once, so it is split into about
+    `constants.WYOMING_RECORDED_CHUNKS` larger frames (between one live chunk and
+    `constants.WYOMING_MAX_CHUNK_SECONDS` of audio) to save per-event overhead.
+    """
+    max_bytes = int(constants.WYOMING_MAX_CHUNK_SECONDS * constants.PYAUDIO_RATE) * 2
+    target = audio_bytes // constants.WYOMING_RECORDED_CHUNKS
+    return max(chunk_size * 2, min(max_bytes, target - target % 2))
+
+
+async def _write_recorded_audio(
+    client: AsyncClient,
+    audio_data: bytes | memoryview,
+    logger: logging.Logger,
+    *,
+    chunk_size: int,
+) -> None:
+    await client.write_event(Transcribe().event())
+    await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
+
+    chunk_bytes = recorded_chunk_bytes(len(audio_data), chunk_size)
+    for i in range(0, len(audio_data), chunk_bytes):
+        chunk = audio_data[i : i + chunk_bytes]
+        await write_audio_chunk(client, chunk)
+        logger.debug("Sent %d byte(s) of audio", len(chunk))
+
+    await client.write_event(AudioStop().event())
+    logger.debug("Sent AudioStop")
+
+
+async def stream_transcript(
+    audio_data: bytes | memoryview,
+    provider_cfg: config.ProviderSelection,
+    wyoming_asr_cfg: config.WyomingASR,
+    openai_asr_cfg: config.OpenAIASR,
+    logger: logging.Logger,
+    *,
+    chunk_size: int = constants.PYAUDIO_CHUNK_SIZE,
+    filename: str | None = None,
+) -> AsyncIterator[TranscriptSegment]:
+    """Transcribe recorded audio, yielding partial segments as they arrive.
+
+    Wyoming servers that emit `TranscriptChunk` events produce partial segments
+    while the audio is still being sent; OpenAI only yields the final transcript.
+    For OpenAI, ``filename`` names the audio file ``audio_data`` was read from, to
+    upload it unchanged instead of as PCM. Connection errors are raised to the caller.
+    """
+    start = time.monotonic()
+    if provider_cfg.asr_provider == "openai":
+        text = await transcribe_audio_openai(
+            audio_data,
+            openai_asr_cfg,
+            logger,
+            filename=filename,
+        )
+        yield TranscriptSegment(text, is_final=True, timestamp=time.monotonic() - start)
+        return
+    if provider_cfg.asr_provider != "local":
+        msg = f"Unsupported ASR provider: {provider_cfg.asr_provider}"
+        raise ValueError(msg)
+
+    balancer, endpoint = _pick_asr_endpoint(wyoming_asr_cfg)
+    with balancer.track(endpoint):
         async with wyoming_client_context(
-            wyoming_asr_cfg.asr_wyoming_ip,
-            wyoming_asr_cfg.asr_wyoming_port,
+            endpoint.host,
+            endpoint.port,
             "ASR",
             logger,
-            quiet=quiet,
+            quiet=True,
         ) as client:
-            await client.write_event(Transcribe().event())
-            await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
-
-            chunk_size = constants.PYAUDIO_CHUNK_SIZE * 2
-            for i in range(0, len(audio_data), chunk_size):
-                chunk = audio_data[i : i + chunk_size]
-                await client.write_event(
-                    AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(),
-                )
-                logger.debug("Sent %d byte(s) of audio", len(chunk))
+            send_task = asyncio.create_task(
+                _write_recorded_audio(client, audio_data, logger, chunk_size=chunk_size),
+            )
+            try:
+                async for segment in iter_transcript(client, logger, start_time=start):
+                    yield segment
+                await send_task
+            finally:
+                if not send_task.done():
+                    send_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await send_task
+
+
+async def _write_queued_audio(
+    client: AsyncClient,
+    queue: asyncio.Queue[bytes | None],
+    logger: logging.Logger,
+) -> None:
+    await client.write_event(Transcribe().event())
+    await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
+
+    async def send_chunk(chunk: bytes) -> None:
+        await write_audio_chunk(client, chunk)
+
+    await read_from_queue(queue=queue, chunk_handler=send_chunk, logger=logger)
+    await client.write_event(AudioStop().event())
+    logger.debug("Sent AudioStop")
+
 
-            await client.write_event(AudioStop().event())
-            logger.debug("Sent AudioStop")
+async def transcribe_audio_queue(
+    queue: asyncio.Queue[bytes | None],
+    wyoming_asr_cfg: config.WyomingASR,
+    logger: logging.Logger,
+    *,
+    quiet: bool = False,
+) -> str | None:
+    """Transcribe audio with Wyoming ASR while it is being recorded.
 
-            return await _receive_transcript(client, logger)
+    Chunks are sent to the server as they arrive on ``queue`` (e.g., a tee queue fed
+    by the recorder), so the transcript is ready right after the end-of-stream
+    ``None``. Returns None if the session failed, so the caller can fall back to
+    transcribing the recording.
+    """
+    try:
+        balancer, endpoint = _pick_asr_endpoint(wyoming_asr_cfg)
+        with balancer.track(endpoint, timed=False):
+            async with wyoming_client_context(
+                endpoint.host,
+                endpoint.port,
+                "ASR",
+                logger,
+                quiet=quiet,
+            ) as client:
+                send_task = asyncio.create_task(_write_queued_audio(client, queue, logger))
+                try:
+                    transcript = await _receive_transcript(client, logger)
+                    await send_task
+                finally:
+                    if not send_task.done():
+                        send_task.cancel()
+                        with suppress(asyncio.CancelledError):
+                            await send_task
+                return transcript
     except (ConnectionRefusedError, Exception):
-        logger.warning("Failed to connect to Wyoming ASR server")
-        return ""
+        logger.warning("Failed to stream audio to Wyoming ASR server")
+        return None
+
+
+def _show_partial(
+    renderer: RenderScheduler,
+    partial_text: list[str],
+    chunk_callback: Callable[[str], None] | None,
+    text: str,
+) -> None:
+    partial_text.append(text)
+    renderer.set_caption("".join(partial_text).strip())
+    if chunk_callback:
+        chunk_callback(text)
 
 
 async def _transcribe_live_audio_wyoming(
@@ -331,38 +910,54 @@ async def _transcribe_live_audio_wyoming(
     save_recording: bool = True,
     chunk_callback: Callable[[str], None] | None = None,
     final_callback: Callable[[str], None] | None = None,
+    show_partials: bool = False,
     **_kwargs: object,
 ) -> str | None:
-    """Unified ASR transcription function."""
+    """Unified ASR transcription function.
+
+    With ``show_partials``, partial transcripts are shown under the recording
+    status while speaking.
+    """
+    renderer = render_scheduler(live, quiet=quiet or not show_partials)
+    if renderer.enabled:
+        chunk_callback = partial(_show_partial, renderer, [], chunk_callback)
     try:
-        async with wyoming_client_context(
-            wyoming_asr_cfg.asr_wyoming_ip,
-            wyoming_asr_cfg.asr_wyoming_port,
-            "ASR",
-            logger,
-            quiet=quiet,
-        ) as client:
-            stream_kwargs = setup_input_stream(audio_input_cfg.input_device_index)
-            with open_pyaudio_stream(p, **stream_kwargs) as stream:
-                _, recv_task = await manage_send_receive_tasks(
-                    _send_audio(
-                        client,
-                        stream,
-                        stop_event,
-                        logger,
-                        live=live,
-                        quiet=quiet,
-                        save_recording=save_recording,
-                    ),
-                    _receive_transcript(
-                        client,
-                        logger,
-                        chunk_callback=chunk_callback,
-                        final_callback=final_callback,
-                    ),
-                    return_when=asyncio.ALL_COMPLETED,
+        balancer, endpoint = _pick_asr_endpoint(wyoming_asr_cfg)
+        with balancer.track(endpoint, timed=False):
+            async with wyoming_client_context(
+                endpoint.host,
+                endpoint.port,
+                "ASR",
+                logger,
+                quiet=quiet,
+            ) as client:
+                stream_kwargs = setup_input_stream(
+                    audio_input_cfg.input_device_index,
+                    chunk_size=audio_input_cfg.chunk_size,
                 )
-                return recv_task.result()
+                with open_pyaudio_stream(p, **stream_kwargs) as stream:
+                    _, recv_task = await manage_send_receive_tasks(
+                        _send_audio(
+                            client,
+                            stream,
+                            stop_event,
+                            logger,
+                            live=live,
+                            quiet=quiet,
+                            save_recording=save_recording,
+                            vad=create_vad(audio_input_cfg),
+                            chunk_size=audio_input_cfg.chunk_size,
+                            recording_format=audio_input_cfg.recording_format,
+                        ),
+                        _receive_transcript(
+                            client,
+                            logger,
+                            chunk_callback=chunk_callback,
+                            final_callback=final_callback,
+                        ),
+                        return_when=asyncio.ALL_COMPLETED,
+                    )
+                    return recv_task.result()
     except (ConnectionRefusedError, Exception):
         logger.warning("Failed to connect to Wyoming ASR server")
         return None
@@ -378,6 +973,7 @@ async def _transcribe_live_audio_openai(
     live: Live,
     quiet: bool = False,
     save_recording: bool = True,
+    silence_trim_cfg: config.SilenceTrim | None = None,
     **_kwargs: object,
 ) -> str | None:
     """Record and transcribe live audio using OpenAI Whisper."""
@@ -389,9 +985,14 @@ async def _transcribe_live_audio_openai(
         quiet=quiet,
         live=live,
         save_recording=save_recording,
+        max_recording_seconds=audio_input_cfg.max_recording_seconds,
+        vad=create_vad(audio_input_cfg),
+        chunk_size=audio_input_cfg.chunk_size,
+        recording_format=audio_input_cfg.recording_format,
     )
     if not audio_data:
         return None
+    audio_data = trim_silence(audio_data, silence_trim_cfg, logger)
     try:
         return await transcribe_audio_openai(audio_data, openai_asr_cfg, logger)
     except Exception:
@@ -6,6 +6,7 @@ import asyncio
 import importlib.util
 import io
 import wave
+from contextlib import nullcontext
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,8 +16,8 @@ from rich.live import Live
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.tts import Synthesize, SynthesizeVoice
 
-from agent_cli import config, constants
-from agent_cli.core.audio import open_pyaudio_stream, pyaudio_context, setup_output_stream
+from agent_cli import config
+from agent_cli.core.audio import output_stream_manager, pyaudio_context, setup_output_stream
 from agent_cli.core.utils import (
     InteractiveStopEvent,
     live_timer,
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
     import logging
     from collections.abc import Awaitable, Callable
 
+    import pyaudio
     from rich.live import Live
     from wyoming.client import AsyncClient
 
@@ -78,8 +80,13 @@ async def handle_tts_playback(
     description: str = "Audio",
     stop_event: InteractiveStopEvent | None = None,
     live: Live,
+    p: pyaudio.PyAudio | None = None,
 ) -> bytes | None:
-    """Handle TTS synthesis, playback, and file saving."""
+    """Handle TTS synthesis, playback, and file saving.
+
+    Pass the caller's PyAudio instance as ``p`` to reuse it, and its warm output
+    stream, instead of initializing PyAudio for every playback.
+    """
     try:
         if not quiet and status_message:
             print_with_style(status_message, style="blue")
@@ -96,6 +103,7 @@ async def handle_tts_playback(
             play_audio_flag=play_audio,
             stop_event=stop_event,
             live=live,
+            p=p,
         )
 
         if save_file and audio_data:
@@ -311,8 +319,13 @@ async def _play_audio(
     quiet: bool = False,
     stop_event: InteractiveStopEvent | None = None,
     live: Live,
+    p: pyaudio.PyAudio | None = None,
 ) -> None:
-    """Play WAV audio data using PyAudio."""
+    """Play WAV audio data using PyAudio.
+
+    With the caller's PyAudio instance, the output stream stays open after playback
+    and is reused by the next one if the audio format is unchanged.
+    """
     try:
         wav_io = io.BytesIO(audio_data)
         speed = audio_output_cfg.tts_speed
@@ -326,15 +339,18 @@ async def _play_audio(
             sample_rate = int(sample_rate * speed)
         base_msg = f"🔊 Playing audio at {speed}x speed" if speed != 1.0 else "🔊 Playing audio"
         async with live_timer(live, base_msg, style="blue", quiet=quiet):
-            with pyaudio_context() as p:
+            with pyaudio_context() if p is None else nullcontext(p) as pa:
                 stream_kwargs = setup_output_stream(
                     audio_output_cfg.output_device_index,
                     sample_rate=sample_rate,
                     sample_width=sample_width,
                     channels=channels,
+                    chunk_size=audio_output_cfg.chunk_size,
                 )
-                with open_pyaudio_stream(p, **stream_kwargs) as stream:
-                    chunk_size = constants.PYAUDIO_CHUNK_SIZE
+                output_streams = output_stream_manager(pa)
+                stream = output_streams.get(**stream_kwargs)
+                try:
+                    chunk_size = audio_output_cfg.chunk_size * sample_width * channels
                     for i in range(0, len(frames), chunk_size):
                         if stop_event and stop_event.is_set():
                             logger.info("Audio playback interrupted")
@@ -344,6 +360,9 @@ async def _play_audio(
                         chunk = frames[i : i + chunk_size]
                         stream.write(chunk)
                         await asyncio.sleep(0)
+                except BaseException:
+                    output_streams.close()
+                    raise
         if not (stop_event and stop_event.is_set()):
             logger.info("Audio playback completed (speed: %.1fx)", speed)
             if not quiet:
@@ -367,6 +386,7 @@ async def _speak_text(
     play_audio_flag: bool = True,
     stop_event: InteractiveStopEvent | None = None,
     live: Live,
+    p: pyaudio.PyAudio | None = None,
 ) -> bytes | None:
     """Synthesize and optionally play speech from text."""
     synthesizer = create_synthesizer(
@@ -400,6 +420,7 @@ async def _speak_text(
             quiet=quiet,
             stop_event=stop_event,
             live=live,
+            p=p,
         )
 
     return audio_data
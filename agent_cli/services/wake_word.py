@@ -6,13 +6,13 @@ import asyncio
 from functools import partial
 from typing import TYPE_CHECKING
 
-from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.audio import AudioStart, AudioStop
 from wyoming.wake import Detect, Detection, NotDetected
 
 from agent_cli import config, constants
 from agent_cli.core.audio import read_from_queue
-from agent_cli.core.utils import manage_send_receive_tasks
-from agent_cli.services._wyoming_utils import wyoming_client_context
+from agent_cli.core.utils import manage_send_receive_tasks, render_scheduler
+from agent_cli.services._wyoming_utils import write_audio_chunk, wyoming_client_context
 
 if TYPE_CHECKING:
     import logging
@@ -40,16 +40,15 @@ async def _send_audio_from_queue_for_wake_detection(
     """Read from a queue and send to Wyoming wake word server."""
     await client.write_event(AudioStart(**constants.WYOMING_AUDIO_CONFIG).event())
     seconds_streamed = 0.0
+    renderer = render_scheduler(live, quiet=quiet)
 
     async def send_chunk(chunk: bytes) -> None:
         nonlocal seconds_streamed
         """Send audio chunk to wake word server."""
-        await client.write_event(
-            AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(),
-        )
+        await write_audio_chunk(client, chunk)
         seconds_streamed += len(chunk) / (constants.PYAUDIO_RATE * constants.PYAUDIO_CHANNELS * 2)
-        if live and not quiet:
-            live.update(f"{progress_message}... ({seconds_streamed:.1f}s)")
+        if renderer.enabled:
+            renderer.update(f"{progress_message}... ({seconds_streamed:.1f}s)", style="")
 
     try:
         await read_from_queue(queue=queue, chunk_handler=send_chunk, logger=logger)
@@ -115,6 +114,7 @@ async def _detect_wake_word_from_queue(
             "wake word",
             logger,
             quiet=quiet,
+            reuse=False,  # Detection ends mid-stream, so the server may still be busy
         ) as client:
             await client.write_event(Detect(names=[wake_word_cfg.wake_word]).event())
 
@@ -235,7 +235,7 @@ async def test_async_main_full_loop(tmp_path: Path) -> None:
     )
 
     with (
-        patch("agent_cli.agents.chat.pyaudio_context"),
+        patch("agent_cli.agents.chat.pyaudio_context") as mock_pyaudio_context,
         patch("agent_cli.agents.chat.setup_devices", return_value=(1, "mock_input", 1)),
         patch("agent_cli.agents.chat.asr.create_transcriber") as mock_create_transcriber,
         patch(
@@ -292,6 +292,7 @@ async def test_async_main_full_loop(tmp_path: Path) -> None:
             play_audio=True,
             stop_event=mock_tts.call_args.kwargs["stop_event"],
             live=mock_tts.call_args.kwargs["live"],
+            p=mock_pyaudio_context.return_value.__enter__.return_value,
         )
 
         # Verify that history was saved
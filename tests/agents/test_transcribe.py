@@ -310,3 +310,57 @@ def test_transcription_log_path_expansion() -> None:
     expanded = test_path.expanduser()
     assert expanded.is_absolute()
     assert "~" not in str(expanded)
+
+
+@pytest.mark.asyncio
+@patch("agent_cli.agents.transcribe.pyperclip")
+@patch("agent_cli.agents.transcribe.signal_handling_context")
+async def test_transcribe_continuous_appends_each_segment(
+    mock_signal_handling_context: MagicMock,
+    mock_pyperclip: MagicMock,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that continuous mode outputs every segment as soon as it is transcribed."""
+    mock_signal_handling_context.return_value.__enter__.return_value = asyncio.Event()
+
+    async def record_segments(*args: object, **_kwargs: object) -> None:
+        segments = args[3]
+        for segment in (b"\x01\x00" * 1600, b"\x02\x00" * 1600, None):
+            segments.put_nowait(segment)
+
+    transcripts = {b"\x01\x00" * 1600: "first part", b"\x02\x00" * 1600: "second part"}
+
+    async def transcribe_segment(audio_data: bytes, **_kwargs: object) -> str:
+        return transcripts[bytes(audio_data)]
+
+    with (
+        patch("agent_cli.agents.transcribe.asr.record_segments", side_effect=record_segments),
+        patch(
+            "agent_cli.agents.transcribe._transcribe_recorded_audio",
+            side_effect=transcribe_segment,
+        ),
+    ):
+        await transcribe._async_continuous(
+            extra_instructions=None,
+            provider_cfg=config.ProviderSelection(
+                asr_provider="local",
+                llm_provider="local",
+                tts_provider="local",
+            ),
+            general_cfg=config.General(log_level="INFO", quiet=True, clipboard=True),
+            audio_in_cfg=config.AudioInput(),
+            wyoming_asr_cfg=config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=1),
+            openai_asr_cfg=config.OpenAIASR(asr_openai_model="whisper-1"),
+            ollama_cfg=config.Ollama(llm_ollama_model="", llm_ollama_host=""),
+            openai_llm_cfg=config.OpenAILLM(llm_openai_model="", openai_base_url=None),
+            gemini_llm_cfg=config.GeminiLLM(llm_gemini_model="", gemini_api_key=None),
+            llm_enabled=False,
+            transcription_log=None,
+            p=MagicMock(),
+            save_recording=False,
+            silence_trim_cfg=config.SilenceTrim(trim_silence=False),
+            segmented_cfg=config.SegmentedTranscription(),
+        )
+
+    assert capsys.readouterr().out == "first part\nsecond part\n"
+    assert mock_pyperclip.copy.call_args_list[-1].args == ("first part second part",)
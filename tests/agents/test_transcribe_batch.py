@@ -0,0 +1,58 @@
+"""Tests for batch transcription of a directory."""
+
+from __future__ import annotations
+
+import json
+import wave
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agent_cli import constants
+from agent_cli.agents._transcribe_batch import (
+    find_audio_files,
+    load_done_files,
+    transcribe_batch,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_wav(path: Path, n_frames: int) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(constants.PYAUDIO_CHANNELS)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(constants.PYAUDIO_RATE)
+        wav_file.writeframes(b"\x01\x00" * n_frames)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batch_writes_jsonl_and_resumes(tmp_path: Path) -> None:
+    """Test that results are appended per file and done files are skipped on rerun."""
+    for i in range(1, 4):
+        _write_wav(tmp_path / f"memo{i}.wav", i * 100)
+    (tmp_path / "notes.txt").write_text("not audio")
+    files = find_audio_files(tmp_path, "*")
+    assert [path.name for path in files] == ["memo1.wav", "memo2.wav", "memo3.wav"]
+
+    async def transcribe(audio_data: bytes) -> str:
+        if len(audio_data) == 400:  # memo2 fails the first time
+            return ""
+        return f"{len(audio_data)} bytes"
+
+    output = tmp_path / "out" / "transcripts.jsonl"
+    result = await transcribe_batch(files, output, transcribe, AsyncMock(), concurrency=2)
+    assert result == (2, 1, 0)
+    entries = {entry["file"]: entry for entry in map(json.loads, output.read_text().splitlines())}
+    assert entries[str(files[0])]["transcript"] == "200 bytes"
+    assert "error" in entries[str(files[1])]
+
+    # A crash may leave a partial line behind; the rerun only retries the failed file
+    with output.open("a") as f:
+        f.write('{"file": "trunc')
+    retry = AsyncMock(return_value="retried")
+    assert await transcribe_batch(files, output, retry, AsyncMock(), concurrency=2) == (1, 0, 2)
+    retry.assert_awaited_once_with(b"\x01\x00" * 200)
+    assert load_done_files(output) == {str(path) for path in files}
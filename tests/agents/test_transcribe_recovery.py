@@ -415,6 +415,27 @@ def test_transcribe_command_last_recording_option(
             llm_provider="local",
             input_device_index=None,
             input_device_name=None,
+            max_recording_duration=3600.0,
+            vad=False,
+            vad_silence=1.5,
+            trim_silence=True,
+            trim_threshold=-45.0,
+            trim_max_pause=0.75,
+            parallel_segments=1,
+            segment_seconds=30.0,
+            asr_wyoming_endpoint=None,
+            transcript_cache=True,
+            from_dir=None,
+            glob="*",
+            batch_output=None,
+            batch_concurrency=4,
+            keep_recordings=0,
+            recording_max_age=0,
+            recording_max_size=0,
+            recording_format="wav",
+            continuous=False,
+            asr_openai_upload_format="flac",
+            latency_profile="balanced",
             asr_wyoming_ip="localhost",
             asr_wyoming_port=10300,
             asr_openai_model="whisper-1",
@@ -441,8 +462,9 @@ def test_transcribe_command_last_recording_option(
 
         # Verify _async_main_from_file was called
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        # The coroutine is passed to asyncio.run
+        # The coroutine is passed to asyncio.run, wrapped to close pooled connections
+        assert mock_run.call_args[0][0].__name__ == "closing_connection_pool"
+        call_args = mock_run.call_args[0][0].cr_frame.f_locals["main"]
         assert call_args.__name__ == "_async_main"
 
         # Verify the message about using most recent recording
@@ -467,6 +489,27 @@ def test_transcribe_command_from_file_option(tmp_path: Path):
             llm_provider="local",
             input_device_index=None,
             input_device_name=None,
+            max_recording_duration=3600.0,
+            vad=False,
+            vad_silence=1.5,
+            trim_silence=True,
+            trim_threshold=-45.0,
+            trim_max_pause=0.75,
+            parallel_segments=1,
+            segment_seconds=30.0,
+            asr_wyoming_endpoint=None,
+            transcript_cache=True,
+            from_dir=None,
+            glob="*",
+            batch_output=None,
+            batch_concurrency=4,
+            keep_recordings=0,
+            recording_max_age=0,
+            recording_max_size=0,
+            recording_format="wav",
+            continuous=False,
+            asr_openai_upload_format="flac",
+            latency_profile="balanced",
             asr_wyoming_ip="localhost",
             asr_wyoming_port=10300,
             asr_openai_model="whisper-1",
@@ -493,7 +536,8 @@ def test_transcribe_command_from_file_option(tmp_path: Path):
 
         # Verify _async_main_from_file was called with the right file
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        assert mock_run.call_args[0][0].__name__ == "closing_connection_pool"
+        call_args = mock_run.call_args[0][0].cr_frame.f_locals["main"]
         assert call_args.__name__ == "_async_main"
 
 
@@ -531,6 +575,27 @@ def test_transcribe_command_last_recording_with_index(
             llm_provider="local",
             input_device_index=None,
             input_device_name=None,
+            max_recording_duration=3600.0,
+            vad=False,
+            vad_silence=1.5,
+            trim_silence=True,
+            trim_threshold=-45.0,
+            trim_max_pause=0.75,
+            parallel_segments=1,
+            segment_seconds=30.0,
+            asr_wyoming_endpoint=None,
+            transcript_cache=True,
+            from_dir=None,
+            glob="*",
+            batch_output=None,
+            batch_concurrency=4,
+            keep_recordings=0,
+            recording_max_age=0,
+            recording_max_size=0,
+            recording_format="wav",
+            continuous=False,
+            asr_openai_upload_format="flac",
+            latency_profile="balanced",
             asr_wyoming_ip="localhost",
             asr_wyoming_port=10300,
             asr_openai_model="whisper-1",
@@ -589,6 +654,27 @@ def test_transcribe_command_last_recording_disabled(
             llm_provider="local",
             input_device_index=None,
             input_device_name=None,
+            max_recording_duration=3600.0,
+            vad=False,
+            vad_silence=1.5,
+            trim_silence=True,
+            trim_threshold=-45.0,
+            trim_max_pause=0.75,
+            parallel_segments=1,
+            segment_seconds=30.0,
+            asr_wyoming_endpoint=None,
+            transcript_cache=True,
+            from_dir=None,
+            glob="*",
+            batch_output=None,
+            batch_concurrency=4,
+            keep_recordings=0,
+            recording_max_age=0,
+            recording_max_size=0,
+            recording_format="wav",
+            continuous=False,
+            asr_openai_upload_format="flac",
+            latency_profile="balanced",
             asr_wyoming_ip="localhost",
             asr_wyoming_port=10300,
             asr_openai_model="whisper-1",
@@ -615,7 +701,8 @@ def test_transcribe_command_last_recording_disabled(
 
         # Verify _async_main was called for normal recording (not from file)
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        assert mock_run.call_args[0][0].__name__ == "closing_connection_pool"
+        call_args = mock_run.call_args[0][0].cr_frame.f_locals["main"]
         # Should be normal recording mode, not file mode
         assert call_args.__name__ == "_async_main"
 
@@ -633,6 +720,27 @@ def test_transcribe_command_conflicting_options() -> None:
             llm_provider="local",
             input_device_index=None,
             input_device_name=None,
+            max_recording_duration=3600.0,
+            vad=False,
+            vad_silence=1.5,
+            trim_silence=True,
+            trim_threshold=-45.0,
+            trim_max_pause=0.75,
+            parallel_segments=1,
+            segment_seconds=30.0,
+            asr_wyoming_endpoint=None,
+            transcript_cache=True,
+            from_dir=None,
+            glob="*",
+            batch_output=None,
+            batch_concurrency=4,
+            keep_recordings=0,
+            recording_max_age=0,
+            recording_max_size=0,
+            recording_format="wav",
+            continuous=False,
+            asr_openai_upload_format="flac",
+            latency_profile="balanced",
             asr_wyoming_ip="localhost",
             asr_wyoming_port=10300,
             asr_openai_model="whisper-1",
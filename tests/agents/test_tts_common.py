@@ -64,6 +64,7 @@ async def test_handle_tts_playback(mock_speak_text: AsyncMock) -> None:
         play_audio_flag=True,
         stop_event=None,
         live=mock_live,
+        p=None,
     )
 
 
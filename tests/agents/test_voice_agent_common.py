@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -44,6 +45,48 @@ async def test_get_instruction_from_audio(mock_create_transcriber: MagicMock) ->
     mock_transcriber.assert_called_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("live_result", "expected"),
+    [
+        ("live instruction", "live instruction"),
+        (None, "recorded instruction"),
+        ("", "recorded instruction"),  # The connection was lost before the transcript
+    ],
+)
+@patch("agent_cli.agents._voice_agent_common.asr.create_recorded_audio_transcriber")
+async def test_get_instruction_from_live_transcript(
+    mock_create_transcriber: MagicMock,
+    live_result: str | None,
+    expected: str,
+) -> None:
+    """Test that a live transcript is used, falling back to the recording if it failed."""
+    mock_transcriber = AsyncMock(return_value="recorded instruction")
+    mock_create_transcriber.return_value = mock_transcriber
+
+    async def live_session() -> str | None:
+        return live_result
+
+    result = await get_instruction_from_audio(
+        audio_data=b"test audio",
+        provider_cfg=config.ProviderSelection(
+            asr_provider="local",
+            llm_provider="local",
+            tts_provider="local",
+        ),
+        audio_input_cfg=config.AudioInput(),
+        wyoming_asr_cfg=config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=1234),
+        openai_asr_cfg=config.OpenAIASR(asr_openai_model="whisper-1"),
+        ollama_cfg=config.Ollama(llm_ollama_model="test-model", llm_ollama_host="localhost"),
+        logger=MagicMock(),
+        quiet=True,
+        live_transcript=asyncio.create_task(live_session()),
+    )
+
+    assert result == expected
+    assert mock_transcriber.called == (not live_result)
+
+
 @pytest.mark.asyncio
 @patch("agent_cli.agents._voice_agent_common.asr.create_recorded_audio_transcriber")
 async def test_get_instruction_from_audio_error(mock_create_transcriber: MagicMock) -> None:
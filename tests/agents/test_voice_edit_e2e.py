@@ -151,6 +151,7 @@ async def test_voice_edit_e2e(
         ollama_cfg=ollama_cfg,
         logger=ANY,
         quiet=False,
+        live_transcript=ANY,
     )
     mock_process_instruction.assert_called_once_with(
         instruction="this is a test",
@@ -168,4 +169,5 @@ async def test_voice_edit_e2e(
         agent_instructions=AGENT_INSTRUCTIONS,
         live=ANY,
         logger=ANY,
+        p=mock_pyaudio_instance,
     )
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
+from agent_cli import config
+from agent_cli.agents import assistant
 from agent_cli.cli import app
+from agent_cli.core import audio
 
 runner = CliRunner()
 
@@ -69,3 +75,73 @@ def test_assistant_toggle(mock_stop_or_status_or_toggle: MagicMock):
         True,
         quiet=False,
     )
+
+
+class _FakeTee:
+    """Records the consumer queues of `_record_audio_with_wake_word`."""
+
+    def __init__(self) -> None:
+        self.queues: list[audio.TeeQueue] = []
+
+    async def add_queue(self, **kwargs: object) -> audio.TeeQueue:
+        queue = audio.TeeQueue(policy=kwargs.get("policy", "block"))  # type: ignore[arg-type]
+        self.queues.append(queue)
+        return queue
+
+    async def remove_queue(self, queue: audio.TeeQueue) -> None:
+        self.discard_queue(queue)
+
+    def discard_queue(self, queue: audio.TeeQueue) -> None:
+        if queue in self.queues:
+            self.queues.remove(queue)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("live_session", [False, True])
+async def test_record_audio_with_wake_word_drops_unread_asr_queue(live_session: bool) -> None:
+    """Test that no ASR queue is fed without a live session, or after it ended."""
+    tee = _FakeTee()
+    policies_while_recording: list[str] = []
+
+    @asynccontextmanager
+    async def tee_audio_stream(*_args: object, **_kwargs: object):  # noqa: ANN202
+        yield tee
+
+    async def detector(**kwargs: object) -> str:
+        if "progress_message" in kwargs:  # The stop word, said while recording
+            await asyncio.sleep(0.01)
+            policies_while_recording.extend(queue.policy for queue in tee.queues)
+        return "ok_nabu"
+
+    async def record(*_args: object, **_kwargs: object) -> memoryview:
+        await asyncio.sleep(0.05)
+        return memoryview(b"audio")
+
+    async def failed_session() -> None:
+        return None
+
+    def transcribe_live(_queue: audio.TeeQueue) -> asyncio.Task[str | None] | None:
+        return asyncio.create_task(failed_session()) if live_session else None
+
+    with (
+        patch.object(assistant.audio, "tee_audio_stream", tee_audio_stream),
+        patch.object(assistant, "create_wake_word_detector", return_value=detector),
+        patch.object(assistant.asr, "record_audio_to_buffer", record),
+    ):
+        recording = await assistant._record_audio_with_wake_word(
+            MagicMock(),
+            MagicMock(is_set=MagicMock(return_value=False)),
+            MagicMock(),
+            wake_word_cfg=config.WakeWord(
+                wake_server_ip="localhost",
+                wake_server_port=10400,
+                wake_word="ok_nabu",
+            ),
+            quiet=True,
+            transcribe_live=transcribe_live,
+        )
+
+    assert recording is not None
+    assert recording.audio_data == b"audio"
+    assert sorted(policies_while_recording) == ["block", "drop_oldest"]
+    assert not tee.queues
@@ -0,0 +1,72 @@
+"""Benchmark microphone capture: per-chunk `asyncio.to_thread` vs. the capture thread.
+
+Simulates a 16 kHz mono input stream whose `read` blocks for the duration of one
+chunk (optionally sped up) and reports the CPU time spent per minute of audio.
+
+Usage:
+    python -m tests.benchmarks.bench_capture [--seconds 60] [--speedup 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from agent_cli import constants
+from agent_cli.core.audio import capture_audio_stream
+
+
+class _FakeInputStream:
+    """Input stream that blocks like a real device for each chunk."""
+
+    def __init__(self, speedup: float) -> None:
+        self.chunk_duration = constants.PYAUDIO_CHUNK_SIZE / constants.PYAUDIO_RATE / speedup
+        self.chunk = b"\x00\x00" * constants.PYAUDIO_CHUNK_SIZE
+
+    def read(self, num_frames: int, *, exception_on_overflow: bool = True) -> bytes:  # noqa: ARG002
+        time.sleep(self.chunk_duration)
+        return self.chunk
+
+
+async def _to_thread_path(stream: _FakeInputStream, n_chunks: int) -> None:
+    for _ in range(n_chunks):
+        await asyncio.to_thread(
+            stream.read,
+            num_frames=constants.PYAUDIO_CHUNK_SIZE,
+            exception_on_overflow=False,
+        )
+
+
+async def _capture_thread_path(stream: _FakeInputStream, n_chunks: int) -> None:
+    async with capture_audio_stream(stream, None) as capture:  # type: ignore[arg-type]
+        for _ in range(n_chunks):
+            await capture.read()
+
+
+def _measure(name: str, coro_fn, stream: _FakeInputStream, n_chunks: int, audio_s: float) -> None:  # noqa: ANN001
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    asyncio.run(coro_fn(stream, n_chunks))
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    print(
+        f"{name:<16} chunks={n_chunks:<6} wall={wall:6.2f}s cpu={cpu * 1000:8.1f}ms "
+        f"cpu/audio-min={cpu / audio_s * 60 * 1000:7.1f}ms",
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Audio seconds to capture.")
+    parser.add_argument("--speedup", type=float, default=4.0, help="Faster-than-realtime factor.")
+    args = parser.parse_args()
+
+    n_chunks = int(args.seconds * constants.PYAUDIO_RATE / constants.PYAUDIO_CHUNK_SIZE)
+    stream = _FakeInputStream(args.speedup)
+    _measure("to_thread", _to_thread_path, stream, n_chunks, args.seconds)
+    _measure("capture-thread", _capture_thread_path, stream, n_chunks, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
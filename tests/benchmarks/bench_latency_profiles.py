@@ -0,0 +1,96 @@
+"""Benchmark the latency profiles: first-byte latency vs. CPU cost.
+
+For each profile, a simulated 16 kHz mono input stream whose `read` blocks until the
+requested frames have been "recorded" feeds `read_audio_stream`, whose handler frames
+every chunk as a Wyoming `AudioChunk` event, like the live ASR path does.
+
+- first-byte latency: time from opening the stream until the first chunk has been
+  framed for the server, measured in real time.
+- CPU cost: CPU time per minute of audio, measured faster than real time.
+
+Usage:
+    python -m tests.benchmarks.bench_latency_profiles [--seconds 60] [--speedup 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import time
+
+from wyoming.audio import AudioChunk
+from wyoming.event import write_event
+
+from agent_cli import constants
+from agent_cli.core.audio import read_audio_stream
+from agent_cli.core.utils import InteractiveStopEvent
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _FakeInputStream:
+    """Input stream that blocks like a real device until the frames are recorded."""
+
+    def __init__(self, speedup: float) -> None:
+        self.speedup = speedup
+
+    def read(self, num_frames: int, *, exception_on_overflow: bool = True) -> bytes:  # noqa: ARG002
+        time.sleep(num_frames / constants.PYAUDIO_RATE / self.speedup)
+        return b"\x00\x00" * num_frames
+
+
+async def _stream(chunk_size: int, n_chunks: int, speedup: float) -> float:
+    """Stream ``n_chunks`` chunks and return the first-byte latency in seconds."""
+    stop_event = InteractiveStopEvent()
+    sink = io.BytesIO()
+    first_byte: list[float] = []
+    received = 0
+
+    def handle(chunk: bytes) -> None:
+        nonlocal received
+        write_event(AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(), sink)
+        sink.seek(0)
+        if not first_byte:
+            first_byte.append(time.perf_counter())
+        received += 1
+        if received == n_chunks:
+            stop_event.set()
+
+    start = time.perf_counter()
+    await read_audio_stream(
+        _FakeInputStream(speedup),  # type: ignore[arg-type]
+        stop_event,
+        handle,
+        LOGGER,
+        quiet=True,
+        num_frames=chunk_size,
+    )
+    return first_byte[0] - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Audio seconds to stream.")
+    parser.add_argument("--speedup", type=float, default=4.0, help="Faster-than-realtime factor.")
+    parser.add_argument("--trials", type=int, default=10, help="First-byte latency trials.")
+    args = parser.parse_args()
+
+    for profile, chunk_size in constants.LATENCY_PROFILES.items():
+        latencies = [asyncio.run(_stream(chunk_size, 1, 1.0)) for _ in range(args.trials)]
+        n_chunks = int(args.seconds * constants.PYAUDIO_RATE / chunk_size)
+        cpu_start = time.process_time()
+        asyncio.run(_stream(chunk_size, n_chunks, args.speedup))
+        cpu = time.process_time() - cpu_start
+        print(
+            f"{profile:<12} frames={chunk_size:<5} "
+            f"first-byte={statistics.median(latencies) * 1000:6.1f}ms "
+            f"cpu/audio-min={cpu / args.seconds * 60 * 1000:7.1f}ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark streaming pre-recorded audio to Wyoming: live-sized vs. adaptive frames.
+
+Frames the audio as Wyoming `AudioChunk` events into an in-memory writer, both with
+`AsyncClient.write_event` and with the `write_audio_chunk` fast path, and reports
+the events per second and the wall time per hour of audio.
+
+Usage:
+    python -m tests.benchmarks.bench_wyoming_stream [--seconds 600]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from wyoming.audio import AudioChunk
+from wyoming.client import AsyncClient
+
+from agent_cli import constants
+from agent_cli.services._wyoming_utils import write_audio_chunk
+from agent_cli.services.asr import recorded_chunk_bytes
+
+
+class _NullWriter(asyncio.StreamWriter):
+    """Stream writer that discards the data, like a fast local socket."""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+
+    def __del__(self) -> None:
+        pass  # There is no transport to close
+
+    def write(self, data: bytes) -> None:
+        self.bytes_written += len(data)
+
+    def writelines(self, data: tuple[bytes, ...]) -> None:  # type: ignore[override]
+        for part in data:
+            self.write(part)
+
+    async def drain(self) -> None:
+        await asyncio.sleep(0)
+
+
+async def _send(audio_data: bytes, chunk_bytes: int, *, fast: bool) -> int:
+    """Send ``audio_data`` in ``chunk_bytes`` frames and return the number of events."""
+    client = AsyncClient()
+    client._writer = _NullWriter()
+    n_events = 0
+    for i in range(0, len(audio_data), chunk_bytes):
+        chunk = audio_data[i : i + chunk_bytes]
+        if fast:
+            await write_audio_chunk(client, chunk)
+        else:
+            await client.write_event(
+                AudioChunk(audio=chunk, **constants.WYOMING_AUDIO_CONFIG).event(),
+            )
+        n_events += 1
+    return n_events
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=600.0, help="Audio seconds to send.")
+    args = parser.parse_args()
+
+    audio_data = b"\x00\x00" * int(args.seconds * constants.PYAUDIO_RATE)
+    live = constants.PYAUDIO_CHUNK_SIZE * 2
+    adaptive = recorded_chunk_bytes(len(audio_data), constants.PYAUDIO_CHUNK_SIZE)
+    for name, chunk_bytes in (("live-sized", live), ("adaptive", adaptive)):
+        for writer, fast in (("write_event", False), ("fast-path", True)):
+            start = time.perf_counter()
+            n_events = asyncio.run(_send(audio_data, chunk_bytes, fast=fast))
+            wall = time.perf_counter() - start
+            print(
+                f"{name:<12} {writer:<12} frame={chunk_bytes:<6} events={n_events:<6} "
+                f"events/s={n_events / wall:9.0f} "
+                f"wall/audio-hour={wall / args.seconds * 3600:7.3f}s",
+            )
+
+
+if __name__ == "__main__":
+    main()
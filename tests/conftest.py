@@ -6,10 +6,17 @@ import asyncio
 import contextlib
 import io
 import logging
+from typing import TYPE_CHECKING
 
 import pytest
 from rich.console import Console
 
+from agent_cli.services import asr
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     """Set default timeout for all tests."""
@@ -18,6 +25,27 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker(pytest.mark.timeout(3))
 
 
+@pytest.fixture(autouse=True)
+def _device_cache_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the persisted audio device map out of the user's cache directory."""
+    monkeypatch.setattr("agent_cli.core.audio.DEVICE_CACHE_FILE", tmp_path / "audio_devices.json")
+
+
+@pytest.fixture(autouse=True)
+def _transcription_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty transcription cache outside the user's cache directory."""
+    monkeypatch.setattr("agent_cli.core.transcription_cache.CACHE_DIR", tmp_path / "transcripts")
+    monkeypatch.setattr("agent_cli.core.transcription_cache._default_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def _wait_for_recordings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Finish background recording saves before the test's monkeypatches are undone."""
+    del monkeypatch  # Requested only so that it is torn down after this fixture
+    yield
+    asr.wait_for_recordings()
+
+
 @pytest.fixture
 def mock_console() -> Console:
     """Provide a console that writes to a StringIO for testing."""
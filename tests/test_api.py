@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-from agent_cli.api import app
+from agent_cli import config
+from agent_cli.api import _transcribe_with_provider, app
+from agent_cli.services.asr import TranscriptSegment
 
 
 @pytest.fixture
@@ -45,6 +48,31 @@ def test_transcribe_invalid_file_type(client: TestClient) -> None:
     assert "Unsupported audio format" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_transcribe_with_openai_uploads_file_unchanged() -> None:
+    """Test that an uploaded file is sent to OpenAI as-is, under its own name."""
+    with patch("agent_cli.services._get_openai_client") as mock_openai_client:
+        mock_openai_client.return_value.audio.transcriptions.create = AsyncMock(
+            return_value=MagicMock(text="hello"),
+        )
+        result = await _transcribe_with_provider(
+            b"\x00\x00\x00\x20ftypM4A odd",
+            config.ProviderSelection(
+                asr_provider="openai",
+                llm_provider="local",
+                tts_provider="local",
+            ),
+            config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=10300),
+            config.OpenAIASR(asr_openai_model="whisper-1", openai_api_key="key"),
+            filename="memo.m4a",
+        )
+
+    assert result == "hello"
+    upload = mock_openai_client.return_value.audio.transcriptions.create.call_args[1]["file"]
+    assert upload.name == "memo.m4a"
+    assert upload.getvalue() == b"\x00\x00\x00\x20ftypM4A odd"
+
+
 @patch("agent_cli.api._convert_audio_for_local_asr")
 @patch("agent_cli.api._transcribe_with_provider")
 @patch("agent_cli.api.process_and_update_clipboard")
@@ -283,3 +311,59 @@ def test_supported_audio_formats(client: TestClient) -> None:
                 assert response.status_code == 200, f"Failed for {ext}"
                 data = response.json()
                 assert data["success"] is True, f"Failed for {ext}"
+
+
+def test_transcribe_stream_sends_server_sent_events(client: TestClient) -> None:
+    """Test that the streaming endpoint emits partial and final transcript events."""
+
+    async def stream_transcript(*_args: object, **_kwargs: object):  # noqa: ANN202
+        yield TranscriptSegment("hello", is_final=False, timestamp=0.1)
+        yield TranscriptSegment("hello world", is_final=True, timestamp=0.2)
+
+    with (
+        patch("agent_cli.api._convert_audio_for_local_asr", return_value=b"pcm"),
+        patch("agent_cli.api.asr.stream_transcript", side_effect=stream_transcript),
+        tempfile.NamedTemporaryFile(suffix=".wav") as tmp,
+    ):
+        tmp.write(b"RIFF")
+        tmp.seek(0)
+        response = client.post(
+            "/transcribe/stream",
+            files={"audio": ("test.wav", tmp, "audio/wav")},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [event[0] for event in events] == ["event: partial", "event: final"]
+    assert json.loads(events[1][1].removeprefix("data: ")) == {
+        "text": "hello world",
+        "is_final": True,
+        "timestamp": 0.2,
+    }
+
+
+@patch("agent_cli.api._convert_audio_for_local_asr")
+@patch("agent_cli.api._transcribe_with_provider")
+def test_transcribe_retried_upload_uses_cache(
+    mock_transcribe: AsyncMock,
+    mock_convert: AsyncMock,
+    client: TestClient,
+) -> None:
+    """Test that uploading the same audio again skips conversion and ASR."""
+    mock_convert.return_value = b"converted_audio_data"
+    mock_transcribe.return_value = "cached transcription"
+
+    for _ in range(2):
+        with tempfile.NamedTemporaryFile(suffix=".wav") as tmp:
+            tmp.write(b"RIFF same audio")
+            tmp.seek(0)
+            response = client.post(
+                "/transcribe",
+                files={"audio": ("test.wav", tmp, "audio/wav")},
+                data={"cleanup": "false"},
+            )
+        assert response.json()["raw_transcript"] == "cached transcription"
+
+    mock_convert.assert_called_once()
+    mock_transcribe.assert_called_once()
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from wyoming.asr import Transcribe, Transcript, TranscriptChunk
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 
+from agent_cli import config, constants
 from agent_cli.services import asr
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 
 @pytest.mark.asyncio
 async def test_send_audio() -> None:
@@ -82,6 +90,47 @@ async def test_receive_text() -> None:
     final_callback.assert_called_once_with("hello world")
 
 
+@pytest.mark.asyncio
+async def test_stream_transcript_yields_partials_while_sending() -> None:
+    """Test that stream_transcript yields partial and final segments with timestamps."""
+    client = AsyncMock()
+    client.read_event.side_effect = [
+        TranscriptChunk(text="hello").event(),
+        TranscriptChunk(text=" world").event(),
+        Transcript(text="hello world").event(),
+    ]
+    context = MagicMock(
+        __aenter__=AsyncMock(return_value=client),
+        __aexit__=AsyncMock(return_value=None),
+    )
+    wyoming_asr_cfg = config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=10300)
+    with patch("agent_cli.services.asr.wyoming_client_context", return_value=context):
+        segments = [
+            segment
+            async for segment in asr.stream_transcript(
+                b"\x00\x00" * 100,
+                config.ProviderSelection(
+                    asr_provider="local",
+                    llm_provider="local",
+                    tts_provider="local",
+                ),
+                wyoming_asr_cfg,
+                MagicMock(),
+                MagicMock(),
+            )
+        ]
+
+    assert [(s.text, s.is_final) for s in segments] == [
+        ("hello", False),
+        (" world", False),
+        ("hello world", True),
+    ]
+    assert segments[0].timestamp <= segments[-1].timestamp
+    sent = [call.args[0].type for call in client.write_event.call_args_list]
+    assert sent[:2] == ["transcribe", "audio-start"]
+    assert sent[-1] == "audio-stop"
+
+
 def test_create_transcriber():
     """Test that the correct transcriber is returned."""
     provider_cfg = MagicMock()
@@ -124,8 +173,227 @@ async def test_transcribe_recorded_audio_wyoming_connection_error(
     """Test that transcribe_recorded_audio_wyoming handles ConnectionRefusedError."""
     result = await asr._transcribe_recorded_audio_wyoming(
         audio_data=b"test",
-        wyoming_asr_cfg=MagicMock(),
+        wyoming_asr_cfg=config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=10300),
         logger=MagicMock(),
     )
     assert result == ""
     mock_wyoming_client_context.assert_called_once()
+
+
+def test_recorded_chunk_bytes() -> None:
+    """Test that recorded audio uses larger frames, within the live and maximum sizes."""
+    assert asr.recorded_chunk_bytes(16000, 1024) == 2048  # Short audio: live frame size
+    assert asr.recorded_chunk_bytes(64 * 10_000 + 1, 1024) == 10_000
+    assert asr.recorded_chunk_bytes(3600 * 32000, 1024) == 64000  # Capped at 2 s
+
+
+@pytest.mark.asyncio
+async def test_write_recorded_audio_coalesces_chunks() -> None:
+    """Test that ten minutes of audio are sent in far fewer than 2048-byte frames."""
+    client = AsyncMock()
+    audio_data = b"\x01\x00" * 16000 * 600
+
+    await asr._write_recorded_audio(client, audio_data, MagicMock(), chunk_size=1024)
+
+    chunks = [
+        AudioChunk.from_event(call.args[0])
+        for call in client.write_event.call_args_list
+        if AudioChunk.is_type(call.args[0].type)
+    ]
+    assert len(chunks) == 300
+    assert b"".join(chunk.audio for chunk in chunks) == audio_data
+
+
+def test_stitch_transcripts_removes_overlap() -> None:
+    """Test that words repeated at segment overlaps are dropped."""
+    parts = ["Hello there, how are", "are you doing today?", "Today. Fine thanks"]
+    assert asr.stitch_transcripts(parts) == "Hello there, how are you doing today? Fine thanks"
+    assert asr.stitch_transcripts(["", "one two", ""]) == "one two"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_segmented_runs_segments_concurrently() -> None:
+    """Test that segments are transcribed concurrently and stitched in order."""
+    audio_data = (b"\x40\x1f" * 16000 * 8 + b"\x00\x00" * 16000) * 3
+    running = 0
+    max_running = 0
+
+    async def transcribe_segment(segment: bytes | memoryview) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"part {len(segment)}"
+
+    segmented_cfg = config.SegmentedTranscription(parallel_segments=2, segment_seconds=10.0)
+    transcript = await asr.transcribe_segmented(
+        audio_data,
+        transcribe_segment,
+        segmented_cfg,
+        MagicMock(),
+    )
+
+    assert transcript.count("part") == 3
+    assert max_running == 2
+
+    single = AsyncMock(return_value="whole")
+    assert await asr.transcribe_segmented(audio_data, single, None, MagicMock()) == "whole"
+    single.assert_awaited_once_with(audio_data)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_recorded_audio_wyoming_fails_over_to_next_endpoint() -> None:
+    """Test that a failing endpoint is skipped and later ejected."""
+    wyoming_asr_cfg = config.WyomingASR(
+        asr_wyoming_ip="bad",
+        asr_wyoming_port=10300,
+        asr_wyoming_endpoints=["good:10300"],
+    )
+    hosts: list[str] = []
+
+    async def send(endpoint, *_args, **_kwargs) -> str:  # noqa: ANN001
+        hosts.append(endpoint.host)
+        if endpoint.host == "bad":
+            raise ConnectionRefusedError
+        return "hello"
+
+    with patch("agent_cli.services.asr._send_recorded_audio", side_effect=send):
+        for _ in range(3):
+            result = await asr._transcribe_recorded_audio_wyoming(
+                audio_data=b"test",
+                wyoming_asr_cfg=wyoming_asr_cfg,
+                logger=MagicMock(),
+            )
+            assert result == "hello"
+
+    # After two failures the bad endpoint is ejected and no longer tried
+    assert hosts == ["bad", "good", "bad", "good", "good"]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_recorded_audio_wyoming_fails_over_when_connection_drops() -> None:
+    """Test that a server hanging up before the transcript counts as a failure."""
+    wyoming_asr_cfg = config.WyomingASR(
+        asr_wyoming_ip="dropping",
+        asr_wyoming_port=10300,
+        asr_wyoming_endpoints=["working:10300"],
+    )
+    hosts: list[str] = []
+
+    @asynccontextmanager
+    async def client_context(host: str, *_args, **_kwargs) -> AsyncIterator[AsyncMock]:
+        hosts.append(host)
+        client = AsyncMock()
+        client.read_event.return_value = (
+            None if host == "dropping" else Transcript(text="hello").event()
+        )
+        yield client
+
+    with patch("agent_cli.services.asr.wyoming_client_context", side_effect=client_context):
+        result = await asr._transcribe_recorded_audio_wyoming(
+            audio_data=b"\x00\x00" * 100,
+            wyoming_asr_cfg=wyoming_asr_cfg,
+            logger=MagicMock(),
+        )
+
+    assert result == "hello"
+    assert hosts == ["dropping", "working"]
+    endpoint = asr.get_endpoint_balancer(wyoming_asr_cfg.endpoints).endpoints[0]
+    assert endpoint.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_record_segments_queues_each_utterance() -> None:
+    """Test that continuous recording queues a segment at every pause."""
+    t = np.arange(1024) / 16000
+    speech = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes()
+    silence = bytes(2048)
+    chunks = iter([silence] * 10 + [speech] * 8 + [silence] * 8 + [speech] * 8)
+    stream = MagicMock()
+    stream.read.side_effect = lambda *_args, **_kwargs: next(chunks, silence)
+    segments: asyncio.Queue[bytes | None] = asyncio.Queue()
+    stop_event = MagicMock()
+    stop_event.is_set.side_effect = lambda: segments.qsize() >= 2
+
+    with patch("agent_cli.services.asr.open_pyaudio_stream") as mock_open_stream:
+        mock_open_stream.return_value.__enter__.return_value = stream
+        await asr.record_segments(
+            MagicMock(),
+            None,
+            stop_event,
+            segments,
+            MagicMock(),
+            silence_seconds=0.3,
+            max_segment_seconds=30.0,
+            quiet=True,
+            save_recording=False,
+        )
+
+    first, second, end = (segments.get_nowait() for _ in range(3))
+    assert end is None
+    assert segments.empty()
+    for segment in (first, second):
+        assert segment is not None
+        assert speech * 8 in segment
+        # Only a short pre-roll of the leading silence is kept
+        assert len(segment) < len(speech) * 8 + 32000
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_queue_streams_while_recording() -> None:
+    """Test that queued audio is sent as it arrives and the transcript follows the end."""
+    audio_stopped = asyncio.Event()
+    client = AsyncMock()
+
+    async def write_event(event: object) -> None:
+        if AudioStop.is_type(event.type):
+            audio_stopped.set()
+
+    async def read_event() -> object:
+        await audio_stopped.wait()
+        return Transcript(text="live transcript").event()
+
+    client.write_event.side_effect = write_event
+    client.read_event.side_effect = read_event
+    context = MagicMock(
+        __aenter__=AsyncMock(return_value=client),
+        __aexit__=AsyncMock(return_value=None),
+    )
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    wyoming_asr_cfg = config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=10300)
+    with patch("agent_cli.services.asr.wyoming_client_context", return_value=context):
+        task = asyncio.create_task(asr.transcribe_audio_queue(queue, wyoming_asr_cfg, MagicMock()))
+        queue.put_nowait(b"\x01\x00" * 100)
+        await asyncio.sleep(0.01)
+        # The first chunk is already on its way while recording continues
+        client.write_event.assert_any_call(
+            AudioChunk(rate=16000, width=2, channels=1, audio=b"\x01\x00" * 100).event(),
+        )
+        assert not task.done()
+        queue.put_nowait(None)
+        assert await task == "live transcript"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_queue_connection_error() -> None:
+    """Test that a failed live session returns None so the caller can fall back."""
+    wyoming_asr_cfg = config.WyomingASR(asr_wyoming_ip="localhost", asr_wyoming_port=10300)
+    with patch(
+        "agent_cli.services.asr.wyoming_client_context",
+        side_effect=ConnectionRefusedError,
+    ):
+        assert (
+            await asr.transcribe_audio_queue(asyncio.Queue(), wyoming_asr_cfg, MagicMock()) is None
+        )
+
+
+def test_trim_silence_is_opt_in() -> None:
+    """Test that audio is sent to ASR unchanged unless trimming is enabled."""
+    t = np.arange(constants.PYAUDIO_RATE // 2) / constants.PYAUDIO_RATE
+    tone = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16).tobytes()
+    audio_data = b"\x00\x00" * constants.PYAUDIO_RATE + tone + b"\x00\x00" * constants.PYAUDIO_RATE
+
+    assert asr.trim_silence(audio_data, config.SilenceTrim(), MagicMock()) is audio_data
+    trimmed = asr.trim_silence(audio_data, config.SilenceTrim(trim_silence=True), MagicMock())
+    assert len(trimmed) < len(audio_data)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import struct
 import wave
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +11,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from agent_cli import config, constants
+from agent_cli.core import audio_format, recording_store
+from agent_cli.core.recording_store import RecordingStore, get_recording_store
 from agent_cli.services import asr
 
 
@@ -37,7 +41,7 @@ def test_get_transcriptions_dir():
     assert transcriptions_dir == Path.home() / ".config" / "agent-cli" / "transcriptions"
 
 
-def test_save_audio_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_save_recording_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test saving audio data to a file."""
     # Monkeypatch the transcriptions directory to use tmp_path
     monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
@@ -46,7 +50,10 @@ def test_save_audio_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     audio_data = b"test_audio_data" * 100
 
     # Save the audio
-    saved_path = asr._save_audio_to_file(audio_data, logger)
+    writer = asr.start_recording_file(logger)
+    assert writer is not None
+    asr.append_to_recording(writer, audio_data)
+    saved_path = asr.finish_recording_file(writer, logger).result()
 
     # Verify the file was saved
     assert saved_path is not None
@@ -59,7 +66,10 @@ def test_save_audio_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     assert "Saved audio recording to" in logger.info.call_args[0][0]
 
 
-def test_save_audio_to_file_error_handling(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_start_recording_file_error_handling(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test error handling when saving audio fails."""
     # Monkeypatch to return a read-only directory
     read_only_dir = tmp_path / "readonly"
@@ -67,15 +77,129 @@ def test_save_audio_to_file_error_handling(tmp_path: Path, monkeypatch: pytest.M
     monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: read_only_dir / "nonexistent")
 
     logger = MagicMock()
-    audio_data = b"test_audio_data"
 
-    # Try to save the audio (should fail gracefully)
-    saved_path = asr._save_audio_to_file(audio_data, logger)
+    # Try to create the recording file (should fail gracefully)
+    writer = asr.start_recording_file(logger)
 
     # Verify it returned None and logged the exception
-    assert saved_path is None
+    assert writer is None
     logger.exception.assert_called_once()
-    assert "Failed to save audio recording" in logger.exception.call_args[0][0]
+    assert "Failed to create audio recording file" in logger.exception.call_args[0][0]
+
+
+def test_streamed_recording(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a recording streamed to disk is finalized as a plain WAV file."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+    for chunk in (b"\x01\x02" * 800, b"\x03\x04" * 800):
+        asr.append_to_recording(writer, chunk)
+
+    saved_path = asr.finish_recording_file(writer, MagicMock()).result()
+
+    assert saved_path == writer.path == asr.get_last_recording()
+    with wave.open(str(saved_path), "rb") as wav_file:
+        assert wav_file.readframes(wav_file.getnframes()) == b"\x01\x02" * 800 + b"\x03\x04" * 800
+
+
+def test_streamed_recording_recovered_after_crash(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a recording that was never finished can be recovered."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+    asr.append_to_recording(writer, b"\x01\x02" * 800)
+    asr.append_to_recording(writer, b"\x03")  # Half a sample, cut off by the crash
+    asr.wait_for_recordings()
+    # The process that was writing the recording is gone
+    monkeypatch.setattr(recording_store.os, "kill", MagicMock(side_effect=ProcessLookupError))
+
+    last_recording = asr.get_last_recording()
+
+    assert last_recording == writer.path
+    assert asr.load_audio_from_file(last_recording, MagicMock()) == b"\x01\x02" * 800
+
+
+def test_recording_in_progress_is_not_recovered(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a recording a running process is writing is neither listed nor repaired."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    finished = asr.start_recording_file(MagicMock())
+    assert finished is not None
+    asr.append_to_recording(finished, b"\x01\x02" * 800)
+    asr.finish_recording_file(finished, MagicMock()).result()
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+    asr.append_to_recording(writer, b"\x03\x04" * 800)
+
+    assert asr.get_last_recording() == finished.path
+    asr.load_audio_from_file(writer.path, MagicMock())
+    with wave.open(str(writer.path), "rb") as wav_file:
+        assert wav_file.getnframes() == 0  # The header was left to the writer
+
+    saved_path = asr.finish_recording_file(writer, MagicMock()).result()
+    assert asr.get_last_recording() == saved_path == writer.path
+    assert not list(tmp_path.glob("*.pid"))
+
+
+def test_empty_streamed_recording_is_discarded(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a recording without audio leaves no file behind."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+
+    assert asr.finish_recording_file(writer, MagicMock()).result() is None
+    assert not list(tmp_path.glob("recording_*"))
+    assert asr.get_last_recording() is None
+
+
+@pytest.mark.skipif(
+    not audio_format.has_soundfile and not audio_format.check_ffmpeg_available(),
+    reason="FLAC needs soundfile or FFmpeg",
+)
+def test_save_and_load_flac_recording(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that FLAC recordings are lossless and read back transparently."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    audio_data = bytes(range(256)) * 64
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+    asr.append_to_recording(writer, audio_data)
+
+    saved_path = asr.finish_recording_file(writer, MagicMock(), "flac").result()
+
+    assert saved_path is not None
+    assert saved_path.suffix == ".flac"
+    assert saved_path.stat().st_size < len(audio_data)
+    assert asr.load_audio_from_file(saved_path, MagicMock()) == audio_data
+
+
+def test_streamed_recording_kept_as_wav_without_encoder(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a streamed recording stays a WAV file if it can't be compressed."""
+    monkeypatch.setattr(asr, "_get_transcriptions_dir", lambda: tmp_path)
+    monkeypatch.setattr(asr, "get_recording_store", lambda: RecordingStore(tmp_path))
+    monkeypatch.setattr(audio_format, "has_soundfile", False)
+    monkeypatch.setattr(audio_format.shutil, "which", lambda _: None)
+    writer = asr.start_recording_file(MagicMock())
+    assert writer is not None
+    asr.append_to_recording(writer, b"\x01\x02" * 800)
+
+    assert asr.finish_recording_file(writer, MagicMock(), "opus").result() == writer.path
+    assert asr.get_last_recording() == writer.path
 
 
 def test_get_last_recording(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -155,6 +279,54 @@ def test_load_audio_from_file(tmp_path: Path):
     assert "Loaded audio from" in logger.info.call_args[0][0]
 
 
+def test_load_audio_from_file_maps_wav_data(tmp_path: Path):
+    """Test that WAV samples are memory-mapped, skipping chunks besides the data."""
+    samples = b"\x01\x02\x03\x04" * 100
+    fmt = struct.pack("<HHIIHH", 1, 1, constants.PYAUDIO_RATE, constants.PYAUDIO_RATE * 2, 2, 16)
+    chunks = (
+        b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"LIST\x03\x00\x00\x00abc\x00"
+        b"data" + struct.pack("<I", len(samples)) + samples
+    )
+    test_file = tmp_path / "test.wav"
+    test_file.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks)
+
+    audio_data = asr.load_audio_from_file(test_file, MagicMock())
+
+    assert isinstance(audio_data, memoryview)
+    assert audio_data == samples
+    assert isinstance(audio_data[:10], memoryview)
+
+
+def test_load_audio_from_file_leaves_user_files_alone(tmp_path: Path):
+    """Test that a user's WAV file is loaded read-only, without its trailing chunks."""
+    test_file = tmp_path / "recording_user.wav"
+    create_test_wav_file(test_file, duration_seconds=1.0)
+    with test_file.open("ab") as f:
+        f.write(b"LIST\x1a\x00\x00\x00INFOISFT\x0e\x00\x00\x00Lavf60.3.100\x00\x00")
+    original = test_file.read_bytes()
+    test_file.chmod(0o444)
+
+    audio_data = asr.load_audio_from_file(test_file, MagicMock())
+
+    assert audio_data is not None
+    assert len(audio_data) == constants.PYAUDIO_RATE * 2
+    assert test_file.read_bytes() == original
+
+
+def test_load_audio_from_file_converts_other_wav_formats(tmp_path: Path):
+    """Test that a WAV file in another format is decoded instead of mapped."""
+    test_file = tmp_path / "test.wav"
+    with wave.open(str(test_file), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(44100)
+        wav_file.writeframes(b"\x00\x00" * 200)
+
+    with patch("agent_cli.services.asr.decode_audio_file", return_value=b"pcm") as mock_decode:
+        assert asr.load_audio_from_file(test_file, MagicMock()) == b"pcm"
+    mock_decode.assert_called_once_with(test_file)
+
+
 def test_load_audio_from_file_not_found(tmp_path: Path):
     """Test error handling when loading a non-existent file."""
     logger = MagicMock()
@@ -210,10 +382,45 @@ async def test_record_audio_with_manual_stop_saves_recording(
         assert audio_data == b"audio_chunk" * 100
 
         # Verify a recording file was saved
+        asr.wait_for_recordings()
         recordings = list(tmp_path.glob("recording_*.wav"))
         assert len(recordings) == 1
 
 
+@pytest.mark.asyncio
+async def test_record_audio_with_manual_stop_stops_feeding_failed_reader() -> None:
+    """Test that the tee queue is emptied and no longer fed once its reader fails."""
+    mock_stream = MagicMock()
+    mock_stream.read.return_value = b"audio_chunk" * 100
+    tee_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    async def read_then_fail() -> None:
+        await tee_queue.get()
+        msg = "ASR connection lost"
+        raise ConnectionError(msg)
+
+    reader = asyncio.create_task(read_then_fail())
+    with patch("agent_cli.services.asr.open_pyaudio_stream") as mock_open_stream:
+        mock_open_stream.return_value.__enter__.return_value = mock_stream
+        stop_event = MagicMock()
+        stop_event.is_set.side_effect = [False] * 10 + [True]
+
+        audio_data = await asr.record_audio_with_manual_stop(
+            p=MagicMock(),
+            input_device_index=None,
+            stop_event=stop_event,
+            logger=MagicMock(),
+            quiet=True,
+            save_recording=False,
+            tee_queue=tee_queue,
+            tee_reader=reader,
+        )
+
+    assert len(audio_data) == 10 * len(b"audio_chunk" * 100)
+    assert isinstance(reader.exception(), ConnectionError)
+    assert tee_queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_record_audio_with_manual_stop_no_save(
     tmp_path: Path,
@@ -293,6 +500,7 @@ async def test_send_audio_with_save_recording(
     assert client.write_event.call_count >= 4  # Start, chunks, stop
 
     # Verify a recording file was saved
+    asr.wait_for_recordings()
     recordings = list(tmp_path.glob("recording_*.wav"))
     assert len(recordings) == 1
 
@@ -365,3 +573,40 @@ async def test_transcribe_live_audio_openai_with_save():
         mock_record.assert_called_once()
         assert mock_record.call_args.kwargs["save_recording"] is True
         assert result == "test transcript"
+
+
+def test_recording_store_indexes_and_evicts(tmp_path: Path) -> None:
+    """Test index lookups, stale entries and the retention policy."""
+    store = RecordingStore(tmp_path, max_recordings=2)
+    for i in range(3):
+        path = tmp_path / f"recording_20240101_12000{i}_000.wav"
+        create_test_wav_file(path, duration_seconds=0.1)
+        store.add(path, duration=0.1, background=False)
+
+    # Only the two newest recordings are kept
+    assert sorted(p.name for p in tmp_path.glob("recording_*.wav")) == [
+        "recording_20240101_120001_000.wav",
+        "recording_20240101_120002_000.wav",
+    ]
+    assert store.last(1) == tmp_path / "recording_20240101_120002_000.wav"
+    assert store.last(3) is None
+
+    # A file deleted outside the store is skipped
+    (tmp_path / "recording_20240101_120002_000.wav").unlink()
+    assert store.last(1) == tmp_path / "recording_20240101_120001_000.wav"
+
+    store.max_recordings = 0
+    store.max_size_mb = 0.001
+    store.evict()
+    assert store.last(1) is None
+
+
+def test_recording_store_keeps_everything_by_default(tmp_path: Path) -> None:
+    """Test that saved recordings are only deleted when a retention limit is set."""
+    store = get_recording_store(tmp_path)
+    for i in range(3):
+        path = tmp_path / f"recording_20240101_12000{i}_000.wav"
+        create_test_wav_file(path, duration_seconds=0.1)
+        store.add(path, duration=0.1, background=False)
+    assert len(list(tmp_path.glob("recording_*.wav"))) == 3
+    assert config.RecordingRetention().keep_recordings == 0
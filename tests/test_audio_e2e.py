@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
+from agent_cli import config, constants
 from agent_cli.core import audio
+from agent_cli.core.audio import VoiceActivityDetector, read_from_queue
 from tests.mocks.audio import MockPyAudio
 
 
@@ -371,3 +376,377 @@ async def test_audio_tee_os_error():
     await tee._run()
 
     mock_logger.exception.assert_called_once_with("Error reading audio stream")
+
+
+@pytest.mark.asyncio
+async def test_capture_audio_stream_delivers_chunks_in_order():
+    """Test that the capture thread hands chunks to the loop in read order."""
+    mock_stream = Mock()
+    mock_stream.read.side_effect = [b"one", b"two", b"three"] + [b""] * 100
+    mock_logger = Mock()
+
+    async with audio.capture_audio_stream(mock_stream, mock_logger) as capture:
+        chunks = [await capture.read() for _ in range(3)]
+
+    assert chunks == [b"one", b"two", b"three"]
+    assert not capture._thread.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_capture_audio_stream_propagates_read_errors():
+    """Test that errors raised on the capture thread surface in the consumer."""
+    mock_stream = Mock()
+    mock_stream.read.side_effect = OSError("Input overflowed")
+    mock_logger = Mock()
+
+    async with audio.capture_audio_stream(mock_stream, mock_logger) as capture:
+        with pytest.raises(OSError, match="Input overflowed"):
+            await capture.read()
+
+
+@pytest.mark.asyncio
+async def test_capture_audio_stream_bounds_read_ahead():
+    """Test that the capture thread stops reading when the consumer falls behind."""
+    mock_stream = Mock()
+    mock_stream.read.return_value = b"\x00\x00"
+    mock_logger = Mock()
+
+    async with audio.capture_audio_stream(mock_stream, mock_logger) as capture:
+        await capture.read()
+        await asyncio.sleep(0.05)
+
+    assert mock_stream.read.call_count <= 64 + 1
+
+
+def test_tee_queue_drop_oldest_policy():
+    """Test that a full drop_oldest queue discards its oldest chunk."""
+    queue = audio.TeeQueue(maxsize=2, policy="drop_oldest")
+    for chunk in (b"a", b"b", b"c"):
+        assert queue.offer(chunk)
+
+    assert queue.overflows == 1
+    assert [queue.get_nowait(), queue.get_nowait()] == [b"b", b"c"]
+
+
+def test_tee_queue_coalesce_policy():
+    """Test that a full coalesce queue merges new audio into its newest chunk."""
+    queue = audio.TeeQueue(maxsize=2, policy="coalesce")
+    for chunk in (b"a", b"b", b"c", b"d"):
+        assert queue.offer(chunk)
+
+    assert queue.overflows == 2
+    assert [queue.get_nowait(), queue.get_nowait()] == [b"a", b"bcd"]
+    queue.offer(b"e")
+    queue.offer(b"f")
+    queue.offer(b"g")
+    assert isinstance(queue._queue[-1], bytearray)  # Merged in place, not copied
+
+
+@pytest.mark.asyncio
+async def test_tee_queue_block_policy_waits_and_close_releases():
+    """Test that a full block queue defers to the producer and close always succeeds."""
+    queue = audio.TeeQueue(maxsize=1, policy="block")
+    assert queue.offer(b"a")
+    assert not queue.offer(b"b")
+
+    waiter = asyncio.create_task(queue.put_when_space(b"b"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert await queue.get() == b"a"
+    await waiter
+    assert await queue.get() == b"b"
+
+    queue.offer(b"c")
+    queue.close()  # The sentinel is accepted even though the queue is full
+    assert [await queue.get(), await queue.get()] == [b"c", None]
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_slow_consumer_does_not_stall_others():
+    """Test that an unread drop_oldest consumer cannot starve a blocking consumer."""
+    mock_stream = Mock()
+    mock_stream.read.return_value = b"\x00\x01"
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    async with audio.tee_audio_stream(mock_stream, mock_stop_event, Mock()) as tee:
+        slow = await tee.add_queue(maxsize=4, policy="drop_oldest")
+        fast = await tee.add_queue(policy="block")
+        received = [await fast.get() for _ in range(20)]
+        await tee.remove_queue(fast)
+        await tee.remove_queue(slow)
+
+    assert received == [b"\x00\x01"] * 20
+    assert slow.qsize() <= 5  # Four chunks plus the end-of-stream sentinel
+    assert slow.overflows > 0
+
+
+def test_audio_buffer_returns_zero_copy_view():
+    """Test that the audio buffer accumulates chunks into a single view."""
+    buffer = audio.AudioBuffer(Mock(), max_seconds=1)
+    buffer.write(b"\x01\x02" * 10)
+    buffer.write(b"\x03\x04" * 5)
+
+    view = buffer.view()
+    assert isinstance(view, memoryview)
+    assert len(buffer) == 30
+    assert view == b"\x01\x02" * 10 + b"\x03\x04" * 5
+
+
+def test_audio_buffer_keeps_most_recent_audio_when_full():
+    """Test that the buffer turns into a ring once the cap is reached."""
+    logger = Mock()
+    buffer = audio.AudioBuffer(logger, max_seconds=0.001)  # 16 frames = 32 bytes
+    chunks = [bytes([i]) * 12 for i in range(5)]
+    for chunk in chunks:
+        buffer.write(chunk)
+
+    assert len(buffer) == 32
+    assert buffer.view() == b"".join(chunks)[-32:]
+    logger.warning.assert_called_once()
+
+
+@pytest.mark.parametrize("n_new", [6, 20])
+def test_audio_buffer_views_wrapped_ring_without_copying(n_new: int):
+    """Test that a wrapped ring is returned as two segments, and rotated correctly."""
+    buffer = audio.AudioBuffer(Mock(), max_seconds=0.001)  # 16 frames = 32 bytes
+    old, new = bytes(range(32)), bytes(range(100, 100 + n_new))
+    buffer.write(old)
+    buffer.write(new)
+
+    views = buffer.views()
+    assert len(views) == 2
+    assert views[0].obj is views[1].obj  # Both are views of the buffer itself
+    expected = (old + new)[-32:]
+    assert b"".join(views) == expected
+    assert buffer.view() == expected
+    assert buffer.views() == (expected,)
+
+
+@pytest.mark.asyncio
+async def test_audio_tee_primes_new_queue_with_preroll():
+    """Test that a queue added with preroll=True starts with the recent audio."""
+    chunks = [bytes([i]) * 3200 for i in range(1, 6)]  # 0.1s each
+    pending = iter(chunks)
+    exhausted = threading.Event()
+
+    def read(*_args: object, **_kwargs: object) -> bytes:
+        chunk = next(pending, None)
+        if chunk is None:
+            exhausted.wait(timeout=1)  # Block like an idle microphone
+            return b"\x00" * 3200
+        return chunk
+
+    mock_stream = Mock()
+    mock_stream.read.side_effect = read
+    mock_stop_event = Mock()
+    mock_stop_event.is_set.return_value = False
+
+    async with audio.tee_audio_stream(
+        mock_stream,
+        mock_stop_event,
+        Mock(),
+        preroll_seconds=0.2,
+    ) as tee:
+        watcher = await tee.add_queue()
+        for _ in chunks:
+            await watcher.get()
+        primed = await tee.add_queue(preroll=True)
+        plain = await tee.add_queue()
+        await tee.remove_queue(watcher)
+        await tee.remove_queue(primed)
+        await tee.remove_queue(plain)
+        exhausted.set()
+
+    assert [primed.get_nowait() for _ in range(2)] == chunks[-2:]
+    assert plain.get_nowait() is None
+
+
+def _tone(seconds: float, amplitude: int = 8000) -> bytes:
+    """Generate a 300 Hz tone as 16-bit mono PCM."""
+    t = np.arange(int(constants.PYAUDIO_RATE * seconds)) / constants.PYAUDIO_RATE
+    return (amplitude * np.sin(2 * np.pi * 300 * t)).astype(np.int16).tobytes()
+
+
+def _silence(seconds: float) -> bytes:
+    """Generate digital silence as 16-bit mono PCM."""
+    return bytes(2 * int(constants.PYAUDIO_RATE * seconds))
+
+
+def test_vad_detects_end_of_utterance():
+    """Test that the VAD fires only after speech followed by enough silence."""
+    vad = VoiceActivityDetector(silence_seconds=0.5)
+    assert not vad.process(_silence(1.0))
+    assert not vad.speech_detected
+    assert not vad.process(_tone(0.5))
+    assert vad.speech_detected
+    assert not vad.process(_silence(0.2))
+    assert vad.process(_silence(0.5))
+
+
+def test_vad_ignores_white_noise():
+    """Test that loud broadband noise is not mistaken for speech."""
+    rng = np.random.default_rng(0)
+    noise = rng.integers(-8000, 8000, constants.PYAUDIO_RATE, dtype=np.int16).tobytes()
+    vad = VoiceActivityDetector(silence_seconds=0.5)
+    assert not vad.process(noise)
+    assert not vad.speech_detected
+
+
+@pytest.mark.asyncio
+async def test_read_from_queue_stops_at_end_of_speech():
+    """Test that reading from a queue ends and sets the stop event at end of speech."""
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    chunks = [_tone(0.5), _silence(1.0), _tone(0.5)]
+    for chunk in chunks:
+        await queue.put(chunk)
+    received: list[bytes] = []
+    stop_event = asyncio.Event()
+    await read_from_queue(
+        queue,
+        received.append,
+        MagicMock(),
+        vad=VoiceActivityDetector(silence_seconds=0.5),
+        stop_event=stop_event,
+    )
+    assert received == chunks[:2]
+    assert stop_event.is_set()
+
+
+@pytest.mark.asyncio
+async def test_read_from_queue_waits_for_speech_after_skipped_chunks():
+    """Test that a pause after a skipped pre-roll (the wake word) does not stop reading."""
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    chunks = [_tone(0.5), _silence(1.0), _tone(0.5), _silence(1.0), _tone(0.5)]
+    for chunk in chunks:
+        await queue.put(chunk)
+    received: list[bytes] = []
+    await read_from_queue(
+        queue,
+        received.append,
+        MagicMock(),
+        vad=VoiceActivityDetector(silence_seconds=0.5),
+        vad_skip_chunks=1,
+    )
+    assert received == chunks[:4]
+
+
+def test_compact_silence_trims_edges_and_long_pauses():
+    """Test that edge silence is trimmed and long pauses are shortened."""
+    audio_data = _silence(1.0) + _tone(0.5) + _silence(3.0) + _tone(0.5) + _silence(1.0)
+    compacted = audio.compact_silence(audio_data, max_pause_seconds=0.75, padding_seconds=0.2)
+    # 0.2s padding + 0.5s tone + 0.75s pause + 0.5s tone + 0.2s padding
+    assert len(compacted) == pytest.approx(2 * constants.PYAUDIO_RATE * 2.15, rel=0.02)
+
+
+def test_compact_silence_keeps_short_pauses_and_silent_audio():
+    """Test that audio without removable silence is returned unchanged."""
+    speech = _tone(0.5) + _silence(0.4) + _tone(0.5)
+    assert audio.compact_silence(speech, padding_seconds=0.2) is speech
+    silence = _silence(2.0)
+    assert audio.compact_silence(silence) is silence
+
+
+def test_compact_silence_handles_short_clips():
+    """Test that clips shorter than the padding window are trimmed without errors."""
+    clip = _silence(0.15) + _tone(0.05) + _silence(0.15)
+    compacted = audio.compact_silence(clip, padding_seconds=0.2)
+    assert len(compacted) == len(clip)  # The padding covers the whole clip
+    short_tap = _tone(0.05) + _silence(0.3)
+    compacted = audio.compact_silence(short_tap, padding_seconds=0.2)
+    # 0.05s tone + 0.2s padding, to within a 20 ms frame
+    assert len(compacted) == pytest.approx(2 * constants.PYAUDIO_RATE * 0.25, abs=640)
+
+
+def test_latency_profile_sets_frames_per_buffer():
+    """Test that the latency profile chooses the stream buffer size."""
+    audio_in_cfg = config.AudioInput(latency_profile="low-latency")
+    audio_out_cfg = config.AudioOutput(latency_profile="throughput")
+    input_kwargs = audio.setup_input_stream(None, chunk_size=audio_in_cfg.chunk_size)
+    output_kwargs = audio.setup_output_stream(None, chunk_size=audio_out_cfg.chunk_size)
+    assert input_kwargs["frames_per_buffer"] == 256
+    assert output_kwargs["frames_per_buffer"] == 4096
+    assert config.AudioInput().chunk_size == constants.PYAUDIO_CHUNK_SIZE
+
+
+def test_input_device_name_resolved_from_persisted_map(
+    mock_pyaudio_device_info: list[dict],
+) -> None:
+    """Test that a cached device name is verified with a single device query."""
+    audio._get_all_devices.cache_clear()
+    audio._input_device(MockPyAudio(mock_pyaudio_device_info), "combined", None)
+    assert audio.DEVICE_CACHE_FILE.exists()
+
+    # A new process: nothing cached in memory, only the persisted map
+    p = MockPyAudio(mock_pyaudio_device_info)
+    with patch.object(p, "get_device_info_by_index", wraps=p.get_device_info_by_index) as query:
+        assert audio._input_device(p, "combined", None) == (2, "Mock Combined Device")
+    query.assert_called_once_with(2)
+
+
+def test_input_device_persisted_map_invalidated_when_devices_move(
+    mock_pyaudio_device_info: list[dict],
+) -> None:
+    """Test that a stale cached index falls back to a full scan."""
+    audio._get_all_devices.cache_clear()
+    audio._input_device(MockPyAudio(mock_pyaudio_device_info), "combined", None)
+
+    reordered = [
+        {**mock_pyaudio_device_info[2], "index": 0},
+        {**mock_pyaudio_device_info[1], "index": 1},
+        {**mock_pyaudio_device_info[0], "index": 2},
+    ]
+    audio._get_all_devices.cache_clear()
+    assert audio._input_device(MockPyAudio(reordered), "combined", None) == (
+        0,
+        "Mock Combined Device",
+    )
+
+
+@patch("agent_cli.core.audio.pyaudio.PyAudio")
+def test_output_stream_manager_keeps_stream_warm(
+    mock_pyaudio_class: Mock,
+    mock_pyaudio_device_info: list[dict],
+) -> None:
+    """Test that the output stream is reused until the audio format changes."""
+    mock_pyaudio_class.return_value = MockPyAudio(mock_pyaudio_device_info)
+
+    with audio.pyaudio_context() as p:
+        manager = audio.output_stream_manager(p)
+        assert audio.output_stream_manager(p) is manager
+        stream = manager.get(**audio.setup_output_stream(1, sample_rate=22050))
+        assert manager.get(**audio.setup_output_stream(1, sample_rate=22050)) is stream
+        reconfigured = manager.get(**audio.setup_output_stream(1, sample_rate=24000))
+        assert reconfigured is not stream
+        assert not stream.is_active
+        assert len(p.streams) == 2
+
+    # Leaving the PyAudio context closes the warm stream
+    assert not reconfigured.is_active
+
+
+def test_split_on_silence_cuts_in_pauses_with_overlap() -> None:
+    """Test that long audio is cut in the pauses and neighbouring segments overlap."""
+    audio_data = (_tone(8.0) + _silence(1.0)) * 3
+    segments = audio.split_on_silence(audio_data, segment_seconds=10.0, overlap_seconds=0.2)
+
+    assert len(segments) == 3
+    bytes_per_second = constants.PYAUDIO_RATE * 2
+    overlap = int(0.2 * bytes_per_second)
+    # Every cut lands in a pause: the overlap on each side of it is silent
+    for segment in segments[1:]:
+        assert not any(segment[: 2 * overlap])
+    assert bytes(segments[0][: 8 * bytes_per_second]) == audio_data[: 8 * bytes_per_second]
+    assert bytes(segments[-1][-bytes_per_second:]) == audio_data[-bytes_per_second:]
+    assert audio.split_on_silence(_tone(2.0), segment_seconds=10.0) == [memoryview(_tone(2.0))]
+
+
+def test_split_on_silence_with_short_segments() -> None:
+    """Test that segments shorter than the search window still have about the target length."""
+    rng = np.random.default_rng(0)
+    audio_data = (rng.normal(0, 3000, constants.PYAUDIO_RATE * 60)).astype(np.int16).tobytes()
+    segments = audio.split_on_silence(audio_data, segment_seconds=5.0, overlap_seconds=0.5)
+
+    assert 12 <= len(segments) <= 24
+    bytes_per_second = constants.PYAUDIO_RATE * 2
+    assert all(len(segment) >= 2.5 * bytes_per_second for segment in segments[:-1])
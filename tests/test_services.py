@@ -37,6 +37,57 @@ async def test_transcribe_audio_openai(mock_openai_client: MagicMock) -> None:
     )
 
 
+@pytest.mark.asyncio
+@patch("agent_cli.services._get_openai_client")
+async def test_transcribe_audio_openai_uploads_encoded_audio(
+    mock_openai_client: MagicMock,
+) -> None:
+    """The PCM is uploaded in a container of the configured format."""
+    mock_openai_client.return_value.audio.transcriptions.create = AsyncMock(
+        return_value=MagicMock(text="ok"),
+    )
+    openai_asr_cfg = config.OpenAIASR(
+        asr_openai_model="whisper-1",
+        openai_api_key="test_api_key",
+        asr_openai_upload_format="opus",
+    )
+
+    with patch("agent_cli.services.encode_pcm", return_value=b"OggS") as mock_encode:
+        await transcribe_audio_openai(b"\0\0" * 16, openai_asr_cfg, MagicMock())
+
+    mock_encode.assert_called_once_with(b"\0\0" * 16, "opus")
+    upload = mock_openai_client.return_value.audio.transcriptions.create.call_args[1]["file"]
+    assert upload.name == "audio.ogg"
+    assert upload.getvalue() == b"OggS"
+
+
+@pytest.mark.asyncio
+@patch("agent_cli.services._get_openai_client")
+async def test_transcribe_audio_openai_falls_back_to_wav(mock_openai_client: MagicMock) -> None:
+    """Without an encoder for the format, a WAV file is uploaded."""
+    mock_openai_client.return_value.audio.transcriptions.create = AsyncMock(
+        return_value=MagicMock(text="ok"),
+    )
+    openai_asr_cfg = config.OpenAIASR(
+        asr_openai_model="whisper-1",
+        openai_api_key="test_api_key",
+        asr_openai_upload_format="flac",
+    )
+
+    with (
+        patch("agent_cli.core.audio_format.has_soundfile", new=False),
+        patch(
+            "agent_cli.core.audio_format._run_ffmpeg",
+            side_effect=RuntimeError("FFmpeg not found"),
+        ),
+    ):
+        await transcribe_audio_openai(b"\0\0" * 16, openai_asr_cfg, MagicMock())
+
+    upload = mock_openai_client.return_value.audio.transcriptions.create.call_args[1]["file"]
+    assert upload.name == "audio.wav"
+    assert upload.getvalue()[:4] == b"RIFF"
+
+
 @pytest.mark.asyncio
 @patch("agent_cli.services._get_openai_client")
 async def test_synthesize_speech_openai(mock_openai_client: MagicMock) -> None:
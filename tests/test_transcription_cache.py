@@ -0,0 +1,42 @@
+"""Tests for the transcription cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from agent_cli.core.transcription_cache import TranscriptionCache, cache_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_cache_key_depends_on_audio_and_identity() -> None:
+    """Test that the key changes with the audio and with the ASR identity."""
+    key = cache_key(b"audio", "wyoming:localhost:10300")
+    assert key == cache_key(memoryview(b"audio"), "wyoming:localhost:10300")
+    assert key != cache_key(b"audio!", "wyoming:localhost:10300")
+    assert key != cache_key(b"audio", "openai:whisper-1")
+
+
+def test_cache_roundtrip_ttl_and_lru_eviction(tmp_path: Path) -> None:
+    """Test hits, expiry after the TTL and eviction of the least recently used entry."""
+    cache = TranscriptionCache(tmp_path, max_entries=2, ttl=60.0)
+    assert cache.get("a") is None
+    cache.put("a", "first")
+    cache.put("b", "second")
+    assert cache.get("a") == "first"
+
+    # "b" is now the least recently used entry
+    old = time.time() - 10
+    os.utime(tmp_path / "b.json", (old, old))
+    cache.put("c", "third")
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+    expired = TranscriptionCache(tmp_path, ttl=0.0)
+    time.sleep(0.01)
+    assert expired.get("a") is None
+    assert not (tmp_path / "a.json").exists()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
@@ -155,3 +156,49 @@ def test_stop_or_status_or_toggle(
     mock_kill_process.return_value = True
     assert utils.stop_or_status_or_toggle("test", "test", False, False, True, quiet=True)
     mock_kill_process.assert_called_with("test")
+
+
+@pytest.mark.asyncio
+async def test_render_scheduler_coalesces_updates() -> None:
+    """Test that bursts of status updates are drawn at a capped frame rate."""
+    live = Mock()
+    live.console.is_terminal = True
+    renderer = utils.RenderScheduler(live, fps=50.0)
+    for i in range(100):
+        renderer.update(f"chunk {i}")
+    # The first update is drawn immediately, the rest are coalesced into one frame
+    assert live.update.call_count == 1
+    await asyncio.sleep(0.05)
+    assert live.update.call_count == 2
+    drawn = live.update.call_args.args[0]
+    assert drawn.plain == "chunk 99"
+    renderer.clear()
+    live.update.assert_called_with("")
+
+
+@pytest.mark.asyncio
+async def test_render_scheduler_caption() -> None:
+    """Test that a caption is drawn under the last status message."""
+    live = Mock()
+    live.console.is_terminal = True
+    renderer = utils.RenderScheduler(live, fps=1000.0)
+    renderer.update("Listening")
+    await asyncio.sleep(0.01)
+    renderer.set_caption("hello wor")
+    await asyncio.sleep(0.01)
+    status, caption = live.update.call_args.args[0].renderables
+    assert status.plain == "Listening"
+    assert caption.plain == "hello wor"
+    renderer.clear()
+    renderer.update("Done")
+    assert live.update.call_args.args[0].plain == "Done"
+
+
+def test_render_scheduler_disabled_without_terminal() -> None:
+    """Test that quiet mode and non-terminal consoles skip rendering entirely."""
+    live = Mock()
+    live.console.is_terminal = False
+    assert not utils.render_scheduler(live).enabled
+    assert not utils.render_scheduler(Mock(), quiet=True).enabled
+    utils.render_scheduler(live).update("ignored")
+    live.update.assert_not_called()
@@ -1,10 +1,13 @@
 """Tests for the wake word detection module."""
 
 import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from rich.live import Live
+from wyoming.audio import AudioStop
+from wyoming.wake import Detection
 
 from agent_cli import config
 from agent_cli.core.utils import InteractiveStopEvent
@@ -143,3 +146,36 @@ async def test_detect_wake_word_from_queue_connection_error(
     )
     assert result is None
     mock_wyoming_client_context.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_detect_wake_word_from_queue_finishes_sender_before_release(
+    mock_logger: MagicMock,
+):
+    """Test that the sender's AudioStop is written before the connection is released."""
+    client = AsyncMock()
+    client._writer = MagicMock()
+    client.read_event.return_value = Detection(name="test_word").event()
+    released: list[tuple[bool, str]] = []
+
+    @asynccontextmanager
+    async def context(*_args: object, reuse: bool = True, **_kwargs: object):  # noqa: ANN202
+        yield client
+        released.append((reuse, client.write_event.await_args.args[0].type))
+
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(b"\x00\x00" * 512)  # No end of stream: the detection stops the sender
+    with patch("agent_cli.services.wake_word.wyoming_client_context", context):
+        result = await wake_word._detect_wake_word_from_queue(
+            config.WakeWord(
+                wake_server_ip="localhost",
+                wake_server_port=1234,
+                wake_word="test_word",
+            ),
+            mock_logger,
+            queue,
+            quiet=True,
+        )
+
+    assert result == "test_word"
+    assert released == [(False, AudioStop().event().type)]
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from wyoming.asr import Transcribe, Transcript
+from wyoming.audio import AudioChunk
 from wyoming.client import AsyncClient
+from wyoming.event import async_read_event, async_write_event, write_event
+from wyoming.info import Describe, Info
 
-from agent_cli.services._wyoming_utils import wyoming_client_context
+from agent_cli.services import _wyoming_utils
+from agent_cli.services._wyoming_utils import (
+    EndpointBalancer,
+    WyomingConnectionPool,
+    closing_connection_pool,
+    write_audio_chunk,
+    wyoming_client_context,
+)
 
 
 @pytest.mark.asyncio
@@ -60,3 +73,191 @@ async def test_wyoming_client_context_generic_exception(
             pass  # This part should not be reached
 
     assert "An error occurred during test connection" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_reuses_and_drops_connections():
+    """Test that clean sessions are reused and closed or failed ones are not."""
+    connections: list[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(writer)
+        while (event := await async_read_event(reader)) is not None:
+            if Describe.is_type(event.type):
+                await async_write_event(Info().event(), writer)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    pool = WyomingConnectionPool()
+    key = ("127.0.0.1", port, "Test")
+    try:
+        client, stack, reused = await pool.acquire(key)
+        assert not reused
+        await pool.release(key, client, stack, reusable=True)
+        again, stack, reused = await pool.acquire(key)
+        assert reused
+        assert again is client
+
+        # A failed session is never put back in the pool
+        await pool.release(key, again, stack, reusable=False)
+        client, stack, reused = await pool.acquire(key)
+        assert not reused
+
+        # A connection closed by the server is dropped on checkout
+        await pool.release(key, client, stack, reusable=True)
+        connections[-1].close()
+        await asyncio.sleep(0.05)
+        client, stack, reused = await pool.acquire(key)
+        assert not reused
+        await pool.release(key, client, stack, reusable=True)
+        assert len(connections) == 3
+    finally:
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_stops_pooling_servers_that_hang_up():
+    """Test that a server closing its connections after each session is not pooled."""
+    connections = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal connections
+        connections += 1
+        event = await async_read_event(reader)
+        if event is not None and Transcribe.is_type(event.type):
+            await async_write_event(Transcript(text="hello").event(), writer)
+        writer.close()  # Like faster-whisper after the transcript
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    pool = WyomingConnectionPool()
+    key = ("127.0.0.1", port, "ASR")
+    try:
+        for _ in range(3):
+            client, stack, _ = await pool.acquire(key)
+            await client.write_event(Transcribe().event())
+            event = await client.read_event()
+            assert event is not None
+            assert Transcript.from_event(event).text == "hello"
+            await pool.release(key, client, stack, reusable=True)
+        assert connections == 3
+        assert not pool._idle[key]  # Known to hang up, so no longer pooled
+    finally:
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_closing_connection_pool_leaves_no_idle_connections():
+    """Test that connections pooled during a session are closed when it ends."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while (event := await async_read_event(reader)) is not None:
+            if Describe.is_type(event.type):
+                await async_write_event(Info().event(), writer)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    clients: list[AsyncClient] = []
+
+    async def session() -> None:
+        async with wyoming_client_context("127.0.0.1", port, "Test", logging.getLogger()) as client:
+            clients.append(client)
+        assert _wyoming_utils.get_connection_pool()._idle  # Pooled for the next session
+
+    try:
+        await closing_connection_pool(session())
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert clients[0]._writer is None  # Disconnected
+    assert asyncio.get_running_loop() not in _wyoming_utils._pools
+
+
+@pytest.mark.asyncio
+async def test_wyoming_client_context_does_not_pool_mock_clients():
+    """Test that the context closes clients it cannot verify as open."""
+    aexit = AsyncMock(return_value=None)
+    with patch(
+        "agent_cli.services._wyoming_utils.AsyncClient.from_uri",
+        return_value=MagicMock(__aenter__=AsyncMock(return_value=AsyncMock()), __aexit__=aexit),
+    ):
+        async with wyoming_client_context("localhost", 1234, "Test", logging.getLogger()):
+            pass
+    aexit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_write_audio_chunk_matches_wyoming_framing():
+    """Test that the fast path writes the same bytes as `AsyncClient.write_event`."""
+    received = asyncio.get_running_loop().create_future()
+
+    async def handle(reader: asyncio.StreamReader, _writer: asyncio.StreamWriter) -> None:
+        received.set_result(await reader.read())
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    chunks = [b"\x01\x02" * 1024, memoryview(b"\x03\x04" * 5), b""]
+    try:
+        async with AsyncClient.from_uri(f"tcp://127.0.0.1:{port}") as client:
+            for chunk in chunks:
+                await write_audio_chunk(client, chunk)
+        data = await asyncio.wait_for(received, 1)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    expected = io.BytesIO()
+    for chunk in chunks:
+        event = AudioChunk(rate=16000, width=2, channels=1, audio=bytes(chunk)).event()
+        write_event(event, expected)
+    assert data == expected.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_write_audio_chunk_falls_back_on_unknown_framing():
+    """Test that a different wyoming header layout is sent with `write_event`."""
+
+    def reordered_write_event(_event: object, buffer: io.BytesIO) -> None:
+        buffer.write(b'{"payload_length": 2, "type": "audio-chunk"}\n{}\0\0')
+
+    _wyoming_utils._audio_chunk_framing.cache_clear()
+    try:
+        with patch.object(_wyoming_utils, "write_event", reordered_write_event):
+            assert _wyoming_utils._audio_chunk_framing() is None
+            client = AsyncMock()
+            client._writer = MagicMock(spec=asyncio.StreamWriter)
+            await write_audio_chunk(client, b"\x01\x02")
+    finally:
+        _wyoming_utils._audio_chunk_framing.cache_clear()
+
+    client.write_event.assert_awaited_once()
+    client._writer.writelines.assert_not_called()
+
+
+def test_endpoint_balancer_routes_by_outstanding_requests_and_latency():
+    """Test least-outstanding routing with latency tie-breaks and ejection."""
+    balancer = EndpointBalancer([("a", 1), ("b", 2)])
+    a, b = balancer.endpoints
+
+    with balancer.track(a):
+        assert balancer.pick() is b
+    assert a.latency_ewma is not None
+    assert b.latency_ewma is None
+    b.latency_ewma = a.latency_ewma + 1
+    assert balancer.pick() is a
+    assert balancer.pick(exclude=[a]) is b
+    assert balancer.pick(exclude=[a, b]) is None
+
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError), balancer.track(a):
+            raise ConnectionRefusedError
+    assert not a.healthy
+    assert a.outstanding == 0
+    assert balancer.pick() is b
+    # An ejected endpoint is still used when nothing else is left
+    assert balancer.pick(exclude=[b]) is a